@@ -0,0 +1,53 @@
+"""Benchmark the memory held by many articles as dicts versus ``Article`` records.
+
+    python -m benchmarks.bench_article_memory [--articles 1000000] [--publishers 2000]
+"""
+from __future__ import annotations
+
+import argparse
+import gc
+import tracemalloc
+
+from gnews.article import Article
+
+
+def make_article(i: int, publishers: int) -> dict:
+    # Fresh strings and a fresh publisher dict per entry, as feedparser hands them over.
+    p = i % publishers
+    return {
+        'title': f"Headline number {i} about something newsworthy - Publisher {p}",
+        'description': f"Headline number {i} about something newsworthy  Publisher {p}",
+        'published date': f"Mon, {i % 28 + 1:02d} Jun 2026 10:00:00 GMT",
+        'url': f"https://www.publisher{p}.example.com/2026/06/story-{i}",
+        'publisher': {'href': f"https://www.publisher{p}.example.com", 'title': f"Publisher {p}"},
+    }
+
+
+def measure(count: int, publishers: int, compact: bool) -> int:
+    gc.collect()
+    tracemalloc.start()
+    articles = [Article(make_article(i, publishers)) if compact else make_article(i, publishers)
+                for i in range(count)]
+    gc.collect()
+    size, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del articles
+    return size
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--articles", type=int, default=1_000_000)
+    parser.add_argument("--publishers", type=int, default=2_000)
+    args = parser.parse_args()
+
+    dict_size = measure(args.articles, args.publishers, compact=False)
+    record_size = measure(args.articles, args.publishers, compact=True)
+    print(f"articles: {args.articles}, publishers: {args.publishers}")
+    print(f"dict:     {dict_size / 2**20:10.1f} MiB ({dict_size / args.articles:6.0f} B/article)")
+    print(f"Article:  {record_size / 2**20:10.1f} MiB ({record_size / args.articles:6.0f} B/article)")
+    print(f"saved:    {1 - record_size / dict_size:10.0%}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,50 @@
+"""Benchmark the per-item cost of cleaning Google News descriptions.
+
+Compares a BeautifulSoup ``get_text()`` per description, as ``GNews._clean`` used to do,
+against ``strip_html``.
+
+    python -m benchmarks.bench_clean [--items 10000]
+"""
+from __future__ import annotations
+
+import argparse
+import timeit
+
+from bs4 import BeautifulSoup
+
+from gnews.utils.text import strip_html
+
+
+def soup_clean(markup: str) -> str:
+    return BeautifulSoup(markup, features="html.parser").get_text().replace('\xa0', ' ')
+
+
+def descriptions(count: int) -> list[str]:
+    # Shapes seen in real feeds: a single story, and a story cluster as an ordered list.
+    single = ('<a href="https://news.google.com/rss/articles/CBMi{i}?oc=5" target="_blank">'
+              'Story {i} &amp; its &quot;headline&quot;</a>&nbsp;&nbsp;<font color="#6f6f6f">Publisher {i}</font>')
+    cluster = '<ol>' + ''.join(f'<li>{single}</li>' for _ in range(3)) + '</ol>'
+    return [(cluster if i % 4 == 0 else single).format(i=i) for i in range(count)]
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--items", type=int, default=10_000)
+    args = parser.parse_args()
+
+    items = descriptions(args.items)
+    assert [strip_html(item) for item in items[:100]] == [soup_clean(item) for item in items[:100]]
+
+    soup_time = min(timeit.repeat(lambda: [soup_clean(item) for item in items], number=1, repeat=3))
+    strip_time = min(timeit.repeat(lambda: [strip_html(item) for item in items], number=1, repeat=3))
+
+    soup_per_item = soup_time / len(items)
+    strip_per_item = strip_time / len(items)
+    print(f"items: {len(items)}")
+    print(f"BeautifulSoup: {soup_per_item * 1e6:10.1f} us/item")
+    print(f"strip_html:    {strip_per_item * 1e6:10.1f} us/item")
+    print(f"speedup:       {soup_per_item / strip_per_item:10.0f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,48 @@
+"""Benchmark ``exclude_websites`` filtering with a large blocklist.
+
+Compares the previous per-entry regex scan against the compiled ``DomainIndex``.
+
+    python -m benchmarks.bench_exclusion [--domains 10000] [--entries 1000]
+"""
+from __future__ import annotations
+
+import argparse
+import re
+import timeit
+
+from gnews.utils.domains import DomainIndex
+
+
+def regex_scan(source: str, exclude_websites: list[str]) -> bool:
+    # The filter as it was before DomainIndex: one regex built and matched per site, per entry.
+    return any(re.match(website, source) for website in
+               [f'^http(s)?://(www.)?{website.lower()}.*' for website in exclude_websites])
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--domains", type=int, default=10_000)
+    parser.add_argument("--entries", type=int, default=1_000)
+    args = parser.parse_args()
+
+    blocklist = [f"blocked{i}.example.com" for i in range(args.domains)]
+    # Mostly misses (the expensive case for a scan), with a hit every tenth entry.
+    sources = [f"https://www.blocked{i}.example.com" if i % 10 == 0 else f"https://news{i}.example.org"
+               for i in range(args.entries)]
+
+    regex_entries = max(1, args.entries // 100)
+    regex_time = timeit.timeit(lambda: [regex_scan(s, blocklist) for s in sources[:regex_entries]], number=1)
+    build_time = timeit.timeit(lambda: DomainIndex(blocklist), number=1)
+    index = DomainIndex(blocklist)
+    index_time = min(timeit.repeat(lambda: [index.matches(s) for s in sources], number=1, repeat=5))
+
+    regex_per_entry = regex_time / regex_entries
+    index_per_entry = index_time / len(sources)
+    print(f"domains: {args.domains}, entries: {args.entries}")
+    print(f"regex scan:    {regex_per_entry * 1e6:12.1f} us/entry")
+    print(f"DomainIndex:   {index_per_entry * 1e6:12.3f} us/entry (build {build_time * 1e3:.1f} ms once)")
+    print(f"speedup:       {regex_per_entry / index_per_entry:12.0f}x")
+
+
+if __name__ == "__main__":
+    main()
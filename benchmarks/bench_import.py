@@ -0,0 +1,58 @@
+"""Benchmark the import time of ``gnews`` and the modules each entry point loads.
+
+Every measurement runs in a fresh interpreter with ``-X importtime`` and reports the
+best of several runs, so warm filesystem caches are all that carries over.
+
+    python -m benchmarks.bench_import [--repeat 5]
+"""
+from __future__ import annotations
+
+import argparse
+import subprocess
+import sys
+
+#: Entry points and the statement that exercises them.
+STATEMENTS = {
+    "import gnews": "import gnews",
+    "from gnews import GNews": "from gnews import GNews",
+    "GNews()": "from gnews import GNews; GNews()",
+    "import gnews.cli": "import gnews.cli",
+}
+
+#: Modules that should only load once a code path needs them.
+HEAVY_MODULES = ("feedparser", "bs4", "requests", "urllib.request", "csv", "asyncio",
+                 "gnews.backends.searchapi", "httpx", "trafilatura", "playwright")
+
+
+def import_time_us(statement: str) -> tuple[int, list[str]]:
+    """Total import time of ``statement`` in microseconds, and the heavy modules it loaded."""
+    script = (f"{statement}\nimport sys\n"
+              f"print(','.join(m for m in {HEAVY_MODULES!r} if m in sys.modules))")
+    result = subprocess.run([sys.executable, "-X", "importtime", "-c", script],
+                            capture_output=True, text=True, check=True)
+    total = 0
+    for line in result.stderr.splitlines():
+        # "import time: self [us] | cumulative | imported package"; top-level imports are unindented.
+        if line.startswith("import time:") and not line.split("|")[2].startswith("  "):
+            cumulative = line.split("|")[1].strip()
+            if cumulative.isdigit():
+                total += int(cumulative)
+    loaded = result.stdout.strip()
+    return total, loaded.split(",") if loaded else []
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    baseline = min(import_time_us("pass")[0] for _ in range(args.repeat))
+    print(f"interpreter startup imports: {baseline / 1000:8.1f} ms")
+    for label, statement in STATEMENTS.items():
+        runs = [import_time_us(statement) for _ in range(args.repeat)]
+        best = min(total for total, _ in runs) - baseline
+        print(f"{label:26} {best / 1000:8.1f} ms   loads: {', '.join(runs[0][1]) or '-'}")
+
+
+if __name__ == "__main__":
+    main()
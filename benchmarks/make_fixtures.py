@@ -0,0 +1,131 @@
+"""Generate the synthetic feed fixtures the benchmark suite replays.
+
+Writes ``benchmarks/fixtures/google_news_search.xml``, a 100-item Google News
+search RSS feed, and ``benchmarks/fixtures/searchapi_google_news.json``, a
+100-result SearchApi ``google_news`` response. Neither was captured from the live
+services. Both follow the structure of the real responses: element and field names,
+escaped HTML descriptions with every fourth item a three-story cluster, Google
+article IDs of realistic length, and publishers drawn from a fixed list. Headlines
+are built from random word lists. The generator is seeded, so rerunning it
+reproduces the committed files byte for byte.
+
+    python -m benchmarks.make_fixtures [--seed 2026]
+"""
+from __future__ import annotations
+
+import argparse
+import datetime
+import html
+import json
+import os
+import random
+import string
+
+FIXTURES = os.path.join(os.path.dirname(__file__), "fixtures")
+
+PUBLISHERS = [
+    ("Reuters", "https://www.reuters.com"), ("The Verge", "https://www.theverge.com"),
+    ("BBC", "https://www.bbc.com"), ("The New York Times", "https://www.nytimes.com"),
+    ("TechCrunch", "https://techcrunch.com"), ("Bloomberg", "https://www.bloomberg.com"),
+    ("The Guardian", "https://www.theguardian.com"), ("CNBC", "https://www.cnbc.com"),
+    ("Ars Technica", "https://arstechnica.com"), ("Wired", "https://www.wired.com"),
+    ("Financial Times", "https://www.ft.com"), ("Associated Press", "https://apnews.com"),
+    ("Forbes", "https://www.forbes.com"), ("ZDNET", "https://www.zdnet.com"),
+    ("VentureBeat", "https://venturebeat.com"), ("Axios", "https://www.axios.com"),
+    ("The Washington Post", "https://www.washingtonpost.com"), ("CNN", "https://www.cnn.com"),
+    ("Engadget", "https://www.engadget.com"), ("Fortune", "https://fortune.com"),
+    ("MIT Technology Review", "https://www.technologyreview.com"),
+    ("The Information", "https://www.theinformation.com"),
+    ("Business Insider", "https://www.businessinsider.com"), ("NPR", "https://www.npr.org"),
+]
+SUBJECTS = ["OpenAI", "Nvidia", "Google", "Microsoft", "Anthropic", "Meta", "Apple", "Amazon",
+            "EU regulators", "Chipmakers", "Startups", "Researchers"]
+VERBS = ["unveils", "expands", "delays", "bets big on", "faces scrutiny over", "cuts prices for",
+         "opens access to", "partners on", "rethinks", "doubles down on"]
+OBJECTS = ["new AI model", "data center push", "open-weight release", "safety framework",
+           "chip export rules", "enterprise agents", "training compute", "copyright lawsuit",
+           "robotics effort", "on-device assistant", "inference pricing", "research lab"]
+ID_ALPHABET = string.ascii_letters + string.digits + "-_"
+NOW = datetime.datetime(2026, 6, 15, 18, 0, 0)
+
+
+def generate(seed: int) -> tuple[str, dict]:
+    """The RSS document and the SearchApi response for ``seed``."""
+    rng = random.Random(seed)
+
+    def article_id():
+        return "CBMi" + "".join(rng.choice(ID_ALPHABET) for _ in range(rng.randint(90, 140)))
+
+    def headline():
+        return f"{rng.choice(SUBJECTS)} {rng.choice(VERBS)} {rng.choice(OBJECTS)}"
+
+    def anchor(link, title, name):
+        return (f'<a href="{link}" target="_blank">{html.escape(title)}</a>'
+                f'&nbsp;&nbsp;<font color="#6f6f6f">{html.escape(name)}</font>')
+
+    published = NOW
+    items, results = [], []
+    for i in range(100):
+        published -= datetime.timedelta(minutes=rng.randint(3, 45))
+        name, href = rng.choice(PUBLISHERS)
+        title = headline()
+        guid = article_id()
+        link = f"https://news.google.com/rss/articles/{guid}?oc=5"
+        if i % 4 == 0:
+            stories = []
+            for _ in range(3):
+                other, _ = rng.choice(PUBLISHERS)
+                other_title = headline()
+                stories.append("<li>" + anchor(f"https://news.google.com/rss/articles/{article_id()}?oc=5",
+                                               other_title, other) + "</li>")
+            description = "<ol>" + "".join(stories) + "</ol>"
+        else:
+            description = anchor(link, title, name)
+        items.append(f'<item><title>{html.escape(title)} - {html.escape(name)}</title><link>{link}</link>'
+                     f'<guid isPermaLink="false">{guid}</guid>'
+                     f'<pubDate>{published:%a, %d %b %Y %H:%M:%S GMT}</pubDate>'
+                     f'<description>{html.escape(description)}</description>'
+                     f'<source url="{href}">{html.escape(name)}</source></item>')
+
+        age = (NOW - published).seconds
+        slug = title.lower().replace(" ", "-")
+        results.append({
+            "position": i + 1, "title": title, "link": f"{href}/2026/06/15/{slug}-{i}", "source": name,
+            "date": f"{age // 3600} hours ago" if age >= 3600 else f"{max(1, age // 60)} minutes ago",
+            "iso_date": f"{published:%Y-%m-%dT%H:%M:%SZ}",
+            "snippet": f"{title}. " + " ".join(rng.choice(OBJECTS) for _ in range(12)) + ".",
+            "favicon": f"{href}/favicon.ico",
+            "thumbnail": f"https://encrypted-tbn0.gstatic.com/images?q=tbn:{article_id()[4:40]}" if i % 3 else "",
+        })
+
+    rss = ('<?xml version="1.0" encoding="UTF-8" standalone="yes"?>'
+           '<rss xmlns:media="http://search.yahoo.com/mrss/" version="2.0">'
+           '<channel><generator>NFE/5.0</generator><title>"artificial intelligence" - Google News</title>'
+           '<link>https://news.google.com/search?q=artificial+intelligence&amp;hl=en-US&amp;gl=US&amp;ceid=US:en</link>'
+           '<language>en-US</language><webMaster>news-webmaster@google.com</webMaster>'
+           '<copyright>2026 Google Inc.</copyright><lastBuildDate>Mon, 15 Jun 2026 18:00:00 GMT</lastBuildDate>'
+           '<description>Google News</description>' + "".join(items) + '</channel></rss>')
+    searchapi = {
+        "search_metadata": {"id": "search_benchmark", "status": "Success",
+                            "engine_url": "https://www.google.com/search?q=artificial+intelligence&tbm=nws"},
+        "search_parameters": {"engine": "google_news", "q": "artificial intelligence", "gl": "us", "hl": "en",
+                              "num": 100},
+        "organic_results": results,
+    }
+    return rss, searchapi
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--seed", type=int, default=2026)
+    args = parser.parse_args()
+
+    rss, searchapi = generate(args.seed)
+    with open(os.path.join(FIXTURES, "google_news_search.xml"), "w", encoding="utf-8") as f:
+        f.write(rss)
+    with open(os.path.join(FIXTURES, "searchapi_google_news.json"), "w", encoding="utf-8") as f:
+        json.dump(searchapi, f, indent=2, ensure_ascii=False)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,323 @@
+"""Benchmark the hot paths of ``GNews`` over synthetic feed fixtures and report JSON.
+
+The fixtures in ``benchmarks/fixtures`` are generated by ``benchmarks.make_fixtures``
+in the shape of a Google News search feed and a SearchApi response; they are not
+captured traffic. Nothing touches the network, so runs are comparable across machines
+and releases, but the numbers reflect the fixtures' size and markup rather than any
+particular live feed. Each benchmark reports the per-item latency (median of
+``--repeat`` runs), throughput and the peak memory traced during one run.
+
+    python -m benchmarks.suite [--only process clean ...] [--repeat 5] [--scale 1]
+                               [--json results.json] [--compare baseline.json]
+"""
+from __future__ import annotations
+
+import argparse
+import asyncio
+import datetime
+import json
+import os
+import platform
+import statistics
+import sys
+import tempfile
+import time
+import timeit
+import tracemalloc
+from collections.abc import Callable
+from types import SimpleNamespace
+
+from gnews import GNews, ResolutionCache
+from gnews.backends.searchapi import SearchApiBackend
+from gnews.utils.cache import google_article_id
+from gnews.utils.domains import DomainIndex
+from gnews.utils.transport import parse_feed
+from gnews.utils.utils import process_url
+
+FIXTURES = os.path.join(os.path.dirname(__file__), "fixtures")
+RSS_FIXTURE = os.path.join(FIXTURES, "google_news_search.xml")
+SEARCHAPI_FIXTURE = os.path.join(FIXTURES, "searchapi_google_news.json")
+
+#: Simulated round trip of one feed request in the throughput benchmarks.
+FEED_LATENCY = 0.02
+
+#: name -> setup(scale) returning ``(items, run)``; ``run`` does the work for ``items`` items.
+BENCHMARKS: dict[str, Callable[[float], tuple[int, Callable[[], object]]]] = {}
+
+
+def benchmark(name: str):
+    def register(setup):
+        BENCHMARKS[name] = setup
+        return setup
+    return register
+
+
+def _read(path: str) -> bytes:
+    with open(path, "rb") as f:
+        return f.read()
+
+
+def _entries() -> list:
+    return parse_feed(200, _read(RSS_FIXTURE), {}).entries
+
+
+def _sized(scale: float, base: int) -> int:
+    return max(1, int(base * scale))
+
+
+def _tile(items: list, count: int) -> list:
+    return [items[i % len(items)] for i in range(count)]
+
+
+def _resolved_client(**kwargs) -> GNews:
+    """Client whose URL cache already holds every fixture link, so resolving is a cache hit."""
+    cache = ResolutionCache(":memory:")
+    for entry in _entries():
+        article_id = google_article_id(entry.link)
+        cache.set(article_id, f"https://publisher.example.com/{article_id[:24]}")
+    return GNews(url_cache=cache, max_workers=1, **kwargs)
+
+
+def _feed_pages(count: int) -> list[SimpleNamespace]:
+    """Parsed fixture feeds whose links and dates differ page to page, as successive windows would."""
+    entries = _entries()
+    return [SimpleNamespace(status=200, etag=None, modified=None,
+                            entries=[_older(dict(entry, link=f"{entry.link}&page={page}"), weeks=page)
+                                     for entry in entries])
+            for page in range(count)]
+
+
+def _older(entry: dict, weeks: int) -> dict:
+    published = datetime.datetime(*entry['published_parsed'][:6]) - datetime.timedelta(weeks=weeks)
+    entry['published'] = f"{published:%a, %d %b %Y %H:%M:%S GMT}"
+    entry['published_parsed'] = published.timetuple()
+    return entry
+
+
+def _exclusions(scale: float) -> list[str]:
+    # A quarter of the fixture publishers are blocked, hidden in a large synthetic list.
+    publishers = sorted({entry.source.href.split("//", 1)[1] for entry in _entries()})
+    return [f"blocked{i}.example.com" for i in range(_sized(scale, 10_000))] + publishers[::4]
+
+
+def _articles(scale: float) -> list[dict]:
+    g = _resolved_client()
+    rss = [g._process(entry) for entry in _entries()]
+    searchapi = SearchApiBackend("key")._parse(_searchapi_response())
+    return _tile(rss + searchapi, _sized(scale, 2_000))
+
+
+_scratch: tempfile.TemporaryDirectory | None = None
+
+
+def _scratch_path(name: str) -> str:
+    # Removed when the interpreter exits.
+    global _scratch
+    if _scratch is None:
+        _scratch = tempfile.TemporaryDirectory(prefix="gnews-bench-")
+    return os.path.join(_scratch.name, name)
+
+
+def _searchapi_response() -> SimpleNamespace:
+    raw = _read(SEARCHAPI_FIXTURE)
+    return SimpleNamespace(status_code=200, text="", json=lambda: json.loads(raw))
+
+
+@benchmark("parse_feed")
+def bench_parse_feed(scale):
+    content = _read(RSS_FIXTURE)
+    feeds = _sized(scale, 5)
+    return feeds * 100, lambda: [parse_feed(200, content, {}) for _ in range(feeds)]
+
+
+@benchmark("clean")
+def bench_clean(scale):
+    descriptions = _tile([entry.description for entry in _entries()], _sized(scale, 10_000))
+    return len(descriptions), lambda: [GNews._clean(d) for d in descriptions]
+
+
+@benchmark("process")
+def bench_process(scale):
+    g = _resolved_client()
+    entries = _tile(_entries(), _sized(scale, 1_000))
+    return len(entries), lambda: [g._process(entry) for entry in entries]
+
+
+@benchmark("process_lazy")
+def bench_process_lazy(scale):
+    g = GNews(lazy_urls=True)
+    entries = _tile(_entries(), _sized(scale, 1_000))
+    return len(entries), lambda: [g._process(entry) for entry in entries]
+
+
+@benchmark("process_url_exclusions")
+def bench_process_url(scale):
+    # The public helper takes the blocklist as a list, so every call indexes it afresh.
+    g = _resolved_client()
+    exclude = _exclusions(scale)
+    entries = _tile(_entries(), _sized(scale, 50))
+    return len(entries), lambda: [process_url(entry, exclude, cache=g._url_cache) for entry in entries]
+
+
+@benchmark("process_url_exclusions_indexed")
+def bench_process_url_indexed(scale):
+    g = _resolved_client()
+    exclude = DomainIndex(_exclusions(scale))
+    entries = _tile(_entries(), _sized(scale, 1_000))
+    return len(entries), lambda: [process_url(entry, exclude, cache=g._url_cache) for entry in entries]
+
+
+@benchmark("walker")
+def bench_walker(scale):
+    wanted = _sized(scale, 1_000)
+    pages = _feed_pages(wanted // 100 + 2)
+
+    def run():
+        g = GNews(max_results=wanted, lazy_urls=True)
+        feeds = iter(pages)
+        g._fetch_feed = lambda url, **kwargs: next(feeds)
+        return g._get_news_more_than_100("artificial intelligence")
+
+    return wanted, run
+
+
+@benchmark("searchapi_parse")
+def bench_searchapi_parse(scale):
+    backend = SearchApiBackend("key")
+    response = _searchapi_response()
+    responses = _sized(scale, 20)
+    return responses * 100, lambda: [backend._parse(response) for _ in range(responses)]
+
+
+@benchmark("save_to_json")
+def bench_save_to_json(scale):
+    articles = _articles(scale)
+    path = _scratch_path("news.json")
+    return len(articles), lambda: GNews().save_to_json(articles, path)
+
+
+@benchmark("save_to_csv")
+def bench_save_to_csv(scale):
+    articles = _articles(scale)
+    path = _scratch_path("news.csv")
+    return len(articles), lambda: GNews().save_to_csv(articles, path)
+
+
+def _throughput_keys(scale: float) -> list[str]:
+    return [f"topic {i}" for i in range(_sized(scale, 40))]
+
+
+@benchmark("throughput_sync")
+def bench_throughput_sync(scale):
+    keys = _throughput_keys(scale)
+    page = _feed_pages(1)[0]
+
+    def fetch(url, **kwargs):
+        time.sleep(FEED_LATENCY)
+        return page
+
+    g = GNews(lazy_urls=True)
+    g._fetch_feed = fetch
+    return len(keys) * len(page.entries), lambda: g.get_news_many(keys, concurrency=10)
+
+
+@benchmark("throughput_async")
+def bench_throughput_async(scale):
+    keys = _throughput_keys(scale)
+    page = _feed_pages(1)[0]
+
+    async def fetch(url, **kwargs):
+        await asyncio.sleep(FEED_LATENCY)
+        return page
+
+    g = GNews(lazy_urls=True)
+    g._fetch_feed_async = fetch
+    return len(keys) * len(page.entries), lambda: asyncio.run(g.get_news_many_async(keys, concurrency=10))
+
+
+def measure(name: str, scale: float = 1.0, repeat: int = 5) -> dict:
+    """Run one benchmark and return its result record."""
+    items, run = BENCHMARKS[name](scale)
+    run()  # warm caches and lazy imports
+    timings = timeit.repeat(run, number=1, repeat=repeat)
+    tracemalloc.start()
+    try:
+        run()
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    median = statistics.median(timings)
+    return {
+        "name": name,
+        "items": items,
+        "repeat": repeat,
+        "median_s": median,
+        "best_s": min(timings),
+        "per_item_us": median / items * 1e6,
+        "items_per_s": items / median if median else None,
+        "peak_memory_bytes": peak,
+    }
+
+
+def _version() -> str | None:
+    try:
+        from importlib.metadata import PackageNotFoundError, version
+        return version("gnews")
+    except PackageNotFoundError:
+        return None
+
+
+def run_suite(names: list[str] | None = None, scale: float = 1.0, repeat: int = 5) -> dict:
+    """Run the named benchmarks (all by default) and return the JSON-ready report."""
+    return {
+        "gnews_version": _version(),
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "created": datetime.datetime.now(datetime.timezone.utc).isoformat(timespec="seconds"),
+        "scale": scale,
+        "results": [measure(name, scale, repeat) for name in names or BENCHMARKS],
+    }
+
+
+def compare(report: dict, baseline: dict) -> dict[str, float]:
+    """Per-item latency of each benchmark relative to ``baseline``; above 1 means slower."""
+    before = {result["name"]: result for result in baseline["results"]}
+    return {result["name"]: result["per_item_us"] / before[result["name"]]["per_item_us"]
+            for result in report["results"] if result["name"] in before}
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--only", nargs="+", choices=sorted(BENCHMARKS), metavar="NAME",
+                        help=f"benchmarks to run: {', '.join(BENCHMARKS)}")
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--scale", type=float, default=1.0, help="multiply the items per benchmark")
+    parser.add_argument("--json", metavar="PATH", help="write the report to PATH ('-' for stdout)")
+    parser.add_argument("--compare", metavar="PATH", help="report from an earlier run to compare against")
+    args = parser.parse_args()
+
+    report = run_suite(args.only, args.scale, args.repeat)
+    if args.json == "-":
+        json.dump(report, sys.stdout, indent=2)
+        print()
+        return
+    if args.json:
+        with open(args.json, "w", encoding="utf-8") as f:
+            json.dump(report, f, indent=2)
+
+    ratios = {}
+    if args.compare:
+        with open(args.compare, encoding="utf-8") as f:
+            ratios = compare(report, json.load(f))
+    print(f"{'benchmark':32} {'items':>7} {'us/item':>10} {'items/s':>12} {'peak MiB':>9}"
+          + (f" {'vs base':>8}" if ratios else ""))
+    for result in report["results"]:
+        line = (f"{result['name']:32} {result['items']:7d} {result['per_item_us']:10.2f} "
+                f"{result['items_per_s']:12.0f} {result['peak_memory_bytes'] / 2**20:9.2f}")
+        if result["name"] in ratios:
+            line += f" {ratios[result['name']]:7.2f}x"
+        print(line)
+
+
+if __name__ == "__main__":
+    main()
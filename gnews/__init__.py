@@ -1,4 +1,8 @@
-from .gnews import GNews
+"""Google News RSS client.
+
+Public names are imported on first access (PEP 562), so ``import gnews`` stays
+cheap and the HTTP, feed-parsing and storage modules load only when used.
+"""
 from .exceptions import (
     GNewsException,
     RateLimitError,
@@ -8,10 +12,64 @@ from .exceptions import (
 
 name = "gnews"
 
+# Public name -> module it lives in, relative to this package.
+_LAZY = {
+    "GNews": ".gnews",
+    "Article": ".article",
+    "LazyArticle": ".article",
+    "ResolutionCache": ".utils.cache",
+    "ResponseCache": ".utils.cache",
+    "MemoryValidatorStore": ".utils.validators",
+    "SQLiteValidatorStore": ".utils.validators",
+    "BrowserPool": ".utils.browser",
+    "Transport": ".utils.transport",
+    "RateLimiter": ".utils.ratelimit",
+    "SQLiteRateLimiter": ".utils.ratelimit",
+    "NewsCursor": ".utils.cursor",
+    "SQLiteDedupStore": ".utils.dedup",
+    "BloomDedupStore": ".utils.dedup",
+    "ArticleWriter": ".utils.export",
+    "write_articles": ".utils.export",
+    "write_articles_async": ".utils.export",
+    "ArticleCache": ".utils.fulltext",
+}
+
 __all__ = [
     "GNews",
+    "Article",
+    "LazyArticle",
+    "ResolutionCache",
+    "ResponseCache",
+    "MemoryValidatorStore",
+    "SQLiteValidatorStore",
+    "BrowserPool",
+    "Transport",
+    "RateLimiter",
+    "SQLiteRateLimiter",
+    "NewsCursor",
+    "SQLiteDedupStore",
+    "BloomDedupStore",
+    "ArticleWriter",
+    "write_articles",
+    "write_articles_async",
+    "ArticleCache",
     "GNewsException",
     "RateLimitError",
     "InvalidConfigError",
     "NetworkError",
 ]
+
+
+def __getattr__(attr):
+    module = _LAZY.get(attr)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {attr!r}")
+    import importlib
+
+    value = getattr(importlib.import_module(module, __name__), attr)
+    globals()[attr] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
@@ -0,0 +1,206 @@
+from __future__ import annotations
+
+import sys
+from collections.abc import Callable, Mapping
+
+
+class LazyArticle(dict):
+    """Article dict whose ``url`` starts as the Google News link.
+
+    The publisher URL is resolved the first time ``article['url']`` or
+    ``article.get('url')`` is read, or in bulk through :meth:`GNews.resolve`.
+    Until then, iterating the dict (``items()``, ``json.dump``) sees the
+    Google News link.
+    """
+
+    __slots__ = ('_resolver', 'link')
+
+    def __init__(self, data: dict, resolver: Callable[[str], str]) -> None:
+        super().__init__(data)
+        self._resolver = resolver
+        #: The URL as it appeared in the feed.
+        self.link = data['url']
+
+    @property
+    def resolved(self) -> bool:
+        return self._resolver is None
+
+    def resolve(self) -> str:
+        resolver = self._resolver
+        if resolver is not None:
+            self._set_url(resolver(self.link))
+        return dict.__getitem__(self, 'url')
+
+    def _set_url(self, url: str) -> None:
+        dict.__setitem__(self, 'url', url)
+        self._resolver = None
+
+    def __getitem__(self, key):
+        if key == 'url':
+            return self.resolve()
+        return dict.__getitem__(self, key)
+
+    def get(self, key, default=None):
+        if key == 'url' and key in self:
+            return self.resolve()
+        return dict.get(self, key, default)
+
+    def copy(self) -> LazyArticle:
+        """Independent copy that resolves (or has resolved) the same link."""
+        copy = LazyArticle(_copy_fields(self), self._resolver)
+        copy.link = self.link
+        return copy
+
+    def __reduce__(self):
+        # Resolvers close over the client; pickled copies carry whatever URL is known now.
+        return dict, (dict(self),)
+
+
+def _copy_fields(article: dict) -> dict:
+    # dict.items() so a LazyArticle is copied without resolving its url.
+    return {key: dict(value) if isinstance(value, dict) else value for key, value in dict.items(article)}
+
+
+def _detached(article):
+    """Copy of an article sharing no mutable state with it, so a cached copy cannot be changed
+    through the one handed to a caller. :class:`Article` records are immutable and returned as is."""
+    if isinstance(article, LazyArticle):
+        return article.copy()
+    if isinstance(article, dict):
+        return _copy_fields(article)
+    return article
+
+
+# Keys every backend produces, stored in named slots; any other keys go in ``_extra``.
+_FIELDS = {
+    'title': 'title',
+    'description': 'description',
+    'published date': 'published_date',
+    'url': 'url',
+    'publisher': '_publisher',
+}
+_PUBLISHERS: dict = {}
+_MAX_PUBLISHERS = 65_536
+
+
+class _Shape:
+    """Key layout shared by every article with the same keys in the same order."""
+
+    __slots__ = ('keys', 'index')
+
+    def __init__(self, keys: tuple) -> None:
+        self.keys = keys
+        #: Maps each key to its slot name, or to its position in ``Article._extra``.
+        self.index = {}
+        extra = 0
+        for key in keys:
+            if key in _FIELDS:
+                self.index[key] = _FIELDS[key]
+            else:
+                self.index[key] = extra
+                extra += 1
+
+
+_SHAPES: dict[tuple, _Shape] = {}
+
+
+def _shape(keys: tuple) -> _Shape:
+    shape = _SHAPES.get(keys)
+    if shape is None:
+        shape = _SHAPES.setdefault(keys, _Shape(keys))
+    return shape
+
+
+class _PublisherItems(tuple):
+    """Interned ``(key, value)`` pairs of a publisher dict; handed out as a fresh dict."""
+
+    __slots__ = ()
+
+
+def _intern_publisher(publisher):
+    if isinstance(publisher, str):
+        return sys.intern(publisher)
+    if not isinstance(publisher, Mapping) or not all(isinstance(v, str) for v in publisher.values()):
+        return publisher
+    items = _PublisherItems((sys.intern(k), sys.intern(v)) for k, v in publisher.items())
+    interned = _PUBLISHERS.get(items)
+    if interned is None:
+        interned = items
+        if len(_PUBLISHERS) < _MAX_PUBLISHERS:
+            _PUBLISHERS[items] = items
+    return interned
+
+
+class Article(Mapping):
+    """Immutable, slotted article record with read-only dict access.
+
+    Supports ``article['title']``, ``.get()``, ``keys()``, iteration and ``dict(article)``,
+    and compares equal to a dict with the same items. Publisher names and hrefs are
+    interned, so articles from the same publisher share them.
+
+    :param data: Article dict as built by :class:`GNews` or the SearchApi backend
+    """
+
+    __slots__ = ('_shape', 'title', 'description', 'published_date', 'url', '_publisher', '_extra')
+
+    def __init__(self, data: Mapping) -> None:
+        shape = _shape(tuple(data))
+        setattr_ = object.__setattr__
+        setattr_(self, '_shape', shape)
+        extra = []
+        for key, value in data.items():
+            slot = shape.index[key]
+            if slot.__class__ is int:
+                extra.append(value)
+            elif slot == '_publisher':
+                setattr_(self, slot, _intern_publisher(value))
+            else:
+                setattr_(self, slot, value)
+        setattr_(self, '_extra', tuple(extra))
+
+    @property
+    def publisher(self):
+        publisher = self._publisher
+        return dict(publisher) if publisher.__class__ is _PublisherItems else publisher
+
+    def __getitem__(self, key):
+        try:
+            slot = self._shape.index[key]
+        except KeyError:
+            raise KeyError(key) from None
+        if slot.__class__ is int:
+            return self._extra[slot]
+        if slot == '_publisher':
+            return self.publisher
+        return getattr(self, slot)
+
+    def __contains__(self, key) -> bool:
+        return key in self._shape.index
+
+    def __iter__(self):
+        return iter(self._shape.keys)
+
+    def __len__(self) -> int:
+        return len(self._shape.keys)
+
+    def to_dict(self) -> dict:
+        return {key: self[key] for key in self._shape.keys}
+
+    def __setattr__(self, name, value):
+        raise AttributeError("Article is immutable")
+
+    def __delattr__(self, name):
+        raise AttributeError("Article is immutable")
+
+    def __reduce__(self):
+        return Article, (self.to_dict(),)
+
+    def __repr__(self) -> str:
+        return f"Article({self.to_dict()!r})"
+
+
+def _json_default(obj):
+    """``json.dump`` hook that serialises :class:`Article` records as plain objects."""
+    if isinstance(obj, Article):
+        return obj.to_dict()
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
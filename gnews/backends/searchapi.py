@@ -1,19 +1,139 @@
 from __future__ import annotations
 
+import asyncio
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from itertools import islice
+
 import requests
 from gnews.exceptions import NetworkError, InvalidConfigError
 from gnews.utils.constants import SEARCHAPI_BASE_URL
 
 
 class SearchApiBackend:
-    def __init__(self, api_key: str):
+    def __init__(self, api_key: str, transport=None, rate_limiter=None):
         if not api_key:
             raise InvalidConfigError("searchapi_key cannot be empty.")
         self._api_key = api_key
+        # Optional gnews Transport; without one each request opens its own connection.
+        self._transport = transport
+        # Optional token bucket every request waits on before it is sent.
+        self._rate_limiter = rate_limiter
 
     def get_news(self, query: str, language: str = "en", country: str = "US",
                  start_date: str = None, end_date: str = None,
                  max_results: int = 10, page: int = 1) -> list[dict]:
+        params = self._params(query, language, country, start_date, end_date, page)
+        return self._fetch(params, max_results)
+
+    async def get_news_async(self, query: str, language: str = "en", country: str = "US",
+                             start_date: str = None, end_date: str = None,
+                             max_results: int = 10, page: int = 1, client=None) -> list[dict]:
+        """Async version of :meth:`get_news`.
+
+        :param client: ``httpx.AsyncClient`` to send the request with. Without one the
+            blocking request runs in a worker thread.
+        """
+        params = self._params(query, language, country, start_date, end_date, page)
+        return (await self._fetch_page_async(params, client))[:max_results]
+
+    def collect(self, query: str, language: str = "en", country: str = "US",
+                start_date: str = None, end_date: str = None, max_results: int = 100,
+                page: int = 1, concurrency: int = 4, page_size: int = 10) -> list[dict]:
+        """Fetch the pages needed for ``max_results`` results concurrently.
+
+        Pages ``page``, ``page + 1``, ... are requested with at most ``concurrency`` in
+        flight. A page with fewer than ``page_size`` results is taken as the last one:
+        no further pages are requested and any already in flight are discarded. Results
+        are merged in page and ``rank`` order, keeping the first article per URL.
+
+        :param max_results: Number of results to collect
+        :param page: First page to fetch
+        :param concurrency: Maximum number of requests in flight
+        :param page_size: Results SearchApi returns per full page
+        """
+        numbers = iter(self._page_numbers(max_results, page, concurrency, page_size))
+        pages = []
+        with ThreadPoolExecutor(max_workers=concurrency, thread_name_prefix="gnews-searchapi") as pool:
+            def submit(number):
+                params = self._params(query, language, country, start_date, end_date, number)
+                return pool.submit(self._fetch_page, params)
+
+            pending = deque(submit(number) for number in islice(numbers, concurrency))
+            try:
+                while pending:
+                    results = pending.popleft().result()
+                    pages.append(results)
+                    if len(results) < page_size:
+                        break
+                    pending.extend(submit(number) for number in islice(numbers, 1))
+            finally:
+                for future in pending:
+                    future.cancel()
+        return self._merge(pages, max_results)
+
+    async def collect_async(self, query: str, language: str = "en", country: str = "US",
+                            start_date: str = None, end_date: str = None, max_results: int = 100,
+                            page: int = 1, concurrency: int = 4, page_size: int = 10,
+                            client=None) -> list[dict]:
+        """Async version of :meth:`collect`.
+
+        :param client: ``httpx.AsyncClient`` to send the requests with. Without one the
+            blocking requests run in worker threads.
+        """
+        numbers = self._page_numbers(max_results, page, concurrency, page_size)
+        semaphore = asyncio.Semaphore(concurrency)
+        last = None
+
+        async def fetch(number):
+            nonlocal last
+            async with semaphore:
+                if last is not None and number > last:
+                    return []
+                params = self._params(query, language, country, start_date, end_date, number)
+                results = await self._fetch_page_async(params, client)
+                if len(results) < page_size and (last is None or number < last):
+                    last = number
+                return results
+
+        tasks = [asyncio.ensure_future(fetch(number)) for number in numbers]
+        pages = []
+        try:
+            for task in tasks:
+                results = await task
+                pages.append(results)
+                if len(results) < page_size:
+                    break
+        finally:
+            for task in tasks:
+                task.cancel()
+        return self._merge(pages, max_results)
+
+    @staticmethod
+    def _page_numbers(max_results: int, page: int, concurrency: int, page_size: int) -> list[int]:
+        if max_results <= 0 or concurrency <= 0 or page_size <= 0:
+            raise InvalidConfigError("max_results, concurrency and page_size must be positive integers.")
+        return list(range(page, page + -(-max_results // page_size)))
+
+    @staticmethod
+    def _merge(pages: list[list[dict]], max_results: int) -> list[dict]:
+        ranked = sorted(((number, article.get("rank") or 0, article)
+                         for number, results in enumerate(pages) for article in results),
+                        key=lambda item: item[:2])
+        merged, seen = [], set()
+        for _, _, article in ranked:
+            url = article.get("url")
+            if url:
+                if url in seen:
+                    continue
+                seen.add(url)
+            merged.append(article)
+            if len(merged) == max_results:
+                break
+        return merged
+
+    def _params(self, query: str, language: str, country: str, start_date: str | None,
+                end_date: str | None, page: int) -> dict:
         params = {
             "engine": "google_news",
             "q": query,
@@ -29,22 +149,40 @@ class SearchApiBackend:
             if end_date:
                 tbs_parts.append(f"cd_max:{end_date}")
             params["tbs"] = ",".join(tbs_parts)
-
-        return self._fetch(params, max_results)
+        return params
 
     def _fetch(self, params: dict, max_results: int) -> list[dict]:
+        return self._fetch_page(params)[:max_results]
+
+    def _fetch_page(self, params: dict) -> list[dict]:
+        if self._rate_limiter is not None:
+            self._rate_limiter.acquire()
         try:
-            response = requests.get(SEARCHAPI_BASE_URL, params=params, timeout=10)
-            if response.status_code != 200:
-                raise NetworkError(f"SearchApi returned {response.status_code}: {response.text}")
-            data = response.json()
-            results = data.get("organic_results", [])
-            return [self._map_article(item) for item in results[:max_results]]
+            get = self._transport.get if self._transport is not None else requests.get
+            return self._parse(get(SEARCHAPI_BASE_URL, params=params, timeout=10))
         except NetworkError:
             raise
         except Exception as e:
             raise NetworkError(f"SearchApi request failed: {e}") from e
 
+    async def _fetch_page_async(self, params: dict, client=None) -> list[dict]:
+        if client is None:
+            return await asyncio.to_thread(self._fetch_page, params)
+        if self._rate_limiter is not None:
+            await self._rate_limiter.acquire_async()
+        try:
+            return self._parse(await client.get(SEARCHAPI_BASE_URL, params=params, timeout=10))
+        except NetworkError:
+            raise
+        except Exception as e:
+            raise NetworkError(f"SearchApi request failed: {e}") from e
+
+    def _parse(self, response) -> list[dict]:
+        if response.status_code != 200:
+            raise NetworkError(f"SearchApi returned {response.status_code}: {response.text}")
+        data = response.json()
+        return [self._map_article(item) for item in data.get("organic_results", [])]
+
     @staticmethod
     def _map_article(item: dict) -> dict:
         return {
@@ -3,8 +3,13 @@ from __future__ import annotations
 import argparse
 import json
 import sys
+from collections.abc import Iterable, Iterator
+from typing import TYPE_CHECKING, TextIO
 
-from gnews import GNews
+from gnews.article import _json_default
+
+if TYPE_CHECKING:
+    from gnews import GNews
 
 
 def _print_articles(articles: list[dict], as_json: bool) -> None:
@@ -18,7 +23,20 @@ def _print_articles(articles: list[dict], as_json: bool) -> None:
             print()
 
 
+def _print_watched(feed: str, articles: list[dict], as_json: bool) -> None:
+    for article in articles:
+        if as_json:
+            print(json.dumps({"feed": feed, **article}, ensure_ascii=False))
+        else:
+            print(f"[{feed}] {article.get('title', '')}")
+            print(f"   {article.get('url', '')}")
+    sys.stdout.flush()
+
+
 def _build_client(args: argparse.Namespace) -> GNews:
+    # Imported after argument parsing so `gnews --help` and usage errors stay fast.
+    from gnews import GNews
+
     return GNews(
         language=args.lang,
         country=args.country,
@@ -26,11 +44,31 @@ def _build_client(args: argparse.Namespace) -> GNews:
     )
 
 
-def _add_common_args(parser: argparse.ArgumentParser) -> None:
+def _add_common_args(parser: argparse.ArgumentParser, json_flag: bool = True) -> None:
     parser.add_argument("--lang", default="en", metavar="LANG", help="Language code (default: en)")
     parser.add_argument("--country", default="US", metavar="COUNTRY", help="Country code (default: US)")
     parser.add_argument("--max", type=int, default=10, metavar="N", help="Max results (default: 10)")
-    parser.add_argument("--json", action="store_true", dest="as_json", help="Output as JSON")
+    if json_flag:
+        parser.add_argument("--json", action="store_true", dest="as_json", help="Output as JSON")
+
+
+def _read_keys(lines: Iterable[str]) -> Iterator[str]:
+    for line in lines:
+        line = line.strip()
+        if line and not line.startswith("#"):
+            yield line
+
+
+def _run_batch(g: GNews, source: TextIO, args: argparse.Namespace) -> int:
+    """Stream every article as an NDJSON line tagged with its input; return the number of failed inputs."""
+    failed = 0
+    for key, result in g.iter_news_many(_read_keys(source), kind=args.kind, concurrency=args.concurrency):
+        if isinstance(result, Exception):
+            failed += 1
+            print(f"gnews: {key}: {result}", file=sys.stderr)
+            continue
+        print(json.dumps({"query": key, **result}, ensure_ascii=False, default=_json_default), flush=True)
+    return failed
 
 
 def main() -> None:
@@ -64,9 +102,55 @@ def main() -> None:
     p_loc.add_argument("location", help="Location (e.g. Pakistan, India)")
     _add_common_args(p_loc)
 
+    # watch
+    p_watch = sub.add_parser("watch", help="Poll feeds and print new articles as they appear")
+    p_watch.add_argument("feeds", nargs="+",
+                         help="Feeds: top, topic:TOPIC, location:PLACE, site:DOMAIN or a search query")
+    p_watch.add_argument("--interval", type=float, default=300.0, metavar="SECONDS",
+                         help="Seconds between polls of a feed (default: 300)")
+    p_watch.add_argument("--max-interval", type=float, default=None, metavar="SECONDS",
+                         help="Longest interval a quiet feed backs off to (default: 8x interval)")
+    p_watch.add_argument("--skip-existing", action="store_true",
+                         help="Only print articles that appear after the first poll")
+    _add_common_args(p_watch)
+
+    # batch
+    p_batch = sub.add_parser("batch", help="Run many searches from a file or stdin, streaming NDJSON")
+    p_batch.add_argument("file", nargs="?", default="-",
+                         help="File with one query, topic, location or site per line (default: stdin)")
+    p_batch.add_argument("--kind", choices=["query", "topic", "location", "site"], default="query",
+                         help="What each line is (default: query)")
+    p_batch.add_argument("--concurrency", type=int, default=10, metavar="N",
+                         help="Searches run at once (default: 10)")
+    _add_common_args(p_batch, json_flag=False)
+
     args = parser.parse_args()
+
+    if args.command == "batch":
+        if args.concurrency <= 0:
+            parser.error("--concurrency must be a positive integer")
+        try:
+            source = sys.stdin if args.file == "-" else open(args.file, encoding="utf-8")
+        except OSError as err:
+            parser.error(f"cannot read {args.file}: {err.strerror}")
+        with source, _build_client(args) as g:
+            try:
+                failed = _run_batch(g, source, args)
+            except UnicodeDecodeError as err:
+                print(f"gnews: {args.file}: {err}", file=sys.stderr)
+                sys.exit(1)
+        sys.exit(1 if failed else 0)
+
     g = _build_client(args)
 
+    if args.command == "watch":
+        try:
+            g.watch(args.feeds, lambda feed, articles: _print_watched(feed, articles, args.as_json),
+                    interval=args.interval, max_interval=args.max_interval, skip_existing=args.skip_existing)
+        except KeyboardInterrupt:
+            pass
+        return
+
     if args.command == "search":
         articles = g.get_news(args.query)
     elif args.command == "top":
@@ -1,33 +1,387 @@
 from __future__ import annotations
 
 import asyncio
-import csv
-import functools
 import json
 import logging
+import multiprocessing
+import os
+import queue
 import random
+import re
+import threading
 import time
-import urllib.request
+import urllib.parse
 import datetime
-import inspect
 import warnings
-
-import feedparser
-from bs4 import BeautifulSoup as Soup
-
-from gnews.utils.constants import AVAILABLE_COUNTRIES, AVAILABLE_LANGUAGES, SECTIONS, TOPICS, BASE_URL, USER_AGENT
-from gnews.utils.utils import process_url
+from collections import deque
+from collections.abc import AsyncIterator, Callable, Iterable, Iterator, Mapping
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, ThreadPoolExecutor, as_completed, wait
+from contextlib import closing
+from itertools import islice
+
+from gnews.utils.constants import AVAILABLE_COUNTRIES, AVAILABLE_LANGUAGES, SECTIONS, TOPICS, BASE_URL
+from gnews.utils.browser import BrowserPool
+from gnews.utils.cache import ResolutionCache, ResponseCache, google_article_id
+from gnews.article import Article, LazyArticle, _detached, _json_default
+from gnews.utils.cursor import NewsCursor, url_digest
+from gnews.utils.dedup import BloomDedupStore, SQLiteDedupStore, dedup_key
+from gnews.utils.domains import DomainIndex
+from gnews.utils.fulltext import ArticleCache, CachedArticle, extract_text, trafilatura_module
+from gnews.utils.ratelimit import RateLimiter, SQLiteRateLimiter
+from gnews.utils.text import strip_html
+from gnews.utils.transport import Transport, conditional_headers, parse_feed
+from gnews.utils.validators import CachedFeed, MemoryValidatorStore, SQLiteValidatorStore
+from gnews.utils.utils import resolve_link, resolve_link_async
 from gnews.exceptions import (
     GNewsException,
     RateLimitError,
     InvalidConfigError,
     NetworkError,
 )
-from gnews.backends.searchapi import SearchApiBackend
 
 logger = logging.getLogger(__name__)
 logger.addHandler(logging.NullHandler())
 
+_BATCH_METHODS = {
+    "query": "get_news",
+    "topic": "get_news_by_topic",
+    "location": "get_news_by_location",
+    "site": "get_news_by_site",
+}
+
+
+def _unique(keys: Iterable[str]) -> Iterator[str]:
+    """Yield each key once, reading ``keys`` lazily."""
+    seen = set()
+    for key in keys:
+        if key not in seen:
+            seen.add(key)
+            yield key
+
+
+def _worker_context():
+    """Start method for extraction processes: ``forkserver`` where available, else ``spawn``."""
+    method = 'forkserver' if 'forkserver' in multiprocessing.get_all_start_methods() else 'spawn'
+    return multiprocessing.get_context(method)
+
+
+async def _aclose_quietly(client) -> None:
+    try:
+        await client.aclose()
+    except Exception as err:
+        # Connections opened on a loop that has since closed cannot shut down cleanly.
+        logger.debug("Closing a stale async HTTP client failed: %s", err)
+
+
+def _published(value) -> datetime.datetime | None:
+    """Parse a feed ``published`` date, or None if it is missing or malformed."""
+    try:
+        return datetime.datetime.strptime(value, '%a, %d %b %Y %H:%M:%S GMT')
+    except (TypeError, ValueError):
+        return None
+
+
+def _earliest_published(entries: list) -> datetime.datetime | None:
+    """Earliest publication date among raw feed entries, filtered or not."""
+    dates = []
+    for entry in entries:
+        parsed = entry.get('published_parsed')
+        date = datetime.datetime(*parsed[:6]) if parsed else _published(entry.get('published'))
+        if date is not None:
+            dates.append(date)
+    return min(dates, default=None)
+
+
+class _PendingKeys:
+    """Dedup keys of processed articles, written to the store only once each article is delivered.
+
+    An article that is processed but never returned (past ``max_results``, a
+    duplicate of another window, or still in flight when the consumer stopped) is
+    not recorded, so a later run returns it. One instance covers one page.
+    """
+
+    __slots__ = ('store', '_held')
+
+    def __init__(self, store) -> None:
+        self.store = store
+        # id(article) -> (article, key); holding the article keeps its id from being reused.
+        self._held: dict[int, tuple[dict, int]] = {}
+
+    def hold(self, article: dict, key: int | bool) -> None:
+        if key is not True:
+            self._held[id(article)] = (article, key)
+
+    def key(self, article: dict) -> int | None:
+        held = self._held.get(id(article))
+        return held[1] if held is not None and held[0] is article else None
+
+    def deliver(self, articles: Iterable[dict]) -> None:
+        for article in articles:
+            held = self._held.pop(id(article), None)
+            if held is not None and held[0] is article:
+                self.store.add(held[1])
+
+
+class _WindowWalk:
+    """Bookkeeping for the rolling 7-day walk past the ~100-result ceiling.
+
+    Shared by the list and streaming walkers, sync and async, so all apply the same
+    dedup and window-anchoring rules; callers only differ in how they fetch a window
+    and whether they keep the articles. Windows overlap and can stall on the same
+    anchor, so a URL can come back any number of windows later; digests of every URL
+    seen are kept for the whole walk.
+    """
+
+    def __init__(self, max_results: int, keep: bool = True, end: datetime.datetime | None = None) -> None:
+        self.max_results = max_results
+        self.articles: list[dict] | None = [] if keep else None
+        self.count = 0
+        # URL digests of every article offered so far, kept or not.
+        self.seen: set[bytes] = set()
+        self.earliest_date: datetime.datetime | None = None
+        # Without an ``end`` the first request carries no dates, so it gets the newest articles.
+        self.window: tuple[datetime.datetime, datetime.datetime] | None = \
+            (end - datetime.timedelta(days=7), end) if end is not None else None
+        self.done = False
+
+    def take(self, fetched_articles: list[dict], entries: int,
+             earliest: datetime.datetime | None = None) -> list[dict]:
+        """Offer a window's articles and finish it; returns the new ones.
+
+        ``entries`` and ``earliest`` describe the raw feed page, see :meth:`end_page`.
+        """
+        new = []
+        for article in fetched_articles:
+            if self.offer(article):
+                new.append(article)
+            if self.done:
+                break
+        self.end_page(entries, earliest)
+        return new
+
+    def offer(self, article: dict) -> bool:
+        """Count one fetched article; returns True if it is new and should be kept."""
+        # Lazy articles dedup on the feed link so the walk never triggers resolution.
+        digest = url_digest(article.link if isinstance(article, LazyArticle) else article['url'])
+        if digest in self.seen:
+            return False
+        self.seen.add(digest)
+        self.count += 1
+        if self.articles is not None:
+            self.articles.append(article)
+        if self.count >= self.max_results:
+            self.done = True
+
+        published_date = article.get("published date")
+        try:
+            published_date = datetime.datetime.strptime(published_date, '%a, %d %b %Y %H:%M:%S GMT')
+        except Exception as e:
+            logger.warning(f"Failed to parse published date: {e}")
+            return True
+        if self.earliest_date is None or published_date < self.earliest_date:
+            self.earliest_date = published_date
+        return True
+
+    def end_page(self, entries: int, earliest: datetime.datetime | None = None) -> None:
+        """Finish the current window and move to the next one, or stop.
+
+        :param entries: Feed entries the window returned before the dedup store and
+            site filters ran; only a page short of the ceiling means the walk is over.
+        :param earliest: Earliest publication date among those entries. The window
+            is anchored on it, so a page the filters emptied still moves the walk back.
+        """
+        if self.done:
+            return
+        if earliest is not None and (self.earliest_date is None or earliest < self.earliest_date):
+            self.earliest_date = earliest
+        # A short page, or dates that no longer move back, means there is no older window to move to.
+        if (entries < 100 or self.earliest_date is None
+                or (self.window is not None and self.earliest_date >= self.window[1])):
+            self.done = True
+            return
+
+        self.window = (self.earliest_date - datetime.timedelta(days=7), self.earliest_date)
+
+    def cursor(self, query: str) -> NewsCursor:
+        """Snapshot taken between windows, after :meth:`end_page`."""
+        state = {
+            'window': [day.isoformat() for day in self.window] if self.window else None,
+            'earliest_date': self.earliest_date.isoformat() if self.earliest_date else None,
+        }
+        return NewsCursor(query, 'walk', state, self.seen, self.count, self.done)
+
+    @classmethod
+    def resume(cls, cursor: NewsCursor, max_results: int, keep: bool = True) -> _WindowWalk:
+        walk = cls(max_results, keep=keep)
+        window, earliest = cursor.state.get('window'), cursor.state.get('earliest_date')
+        walk.window = tuple(datetime.datetime.fromisoformat(day) for day in window) if window else None
+        walk.earliest_date = datetime.datetime.fromisoformat(earliest) if earliest else None
+        walk.seen = set(cursor.seen)
+        walk.count = cursor.count
+        walk.done = cursor.done or cursor.count >= max_results
+        return walk
+
+
+class _DateRangePlan:
+    """Adaptive date windows covering ``[start, end)`` for searches past the ~100-result ceiling.
+
+    The range starts as equal windows, newest first. A window that comes back
+    saturated is split in half and both halves are queued; the saturated page's
+    articles are kept too. Each unsaturated window updates an articles-per-day
+    estimate, and a window from the initial split absorbs its older untouched
+    neighbours while the estimate says the merged window would still come back
+    well under the ceiling, so sparse stretches cost one request instead of many.
+    Google News dates have day granularity, so a saturated one-day window is final.
+
+    Drivers (sync, async, list or streaming) take windows from :meth:`next_window`
+    and hand each fetched page back to :meth:`complete`, which dedups across the
+    whole range.
+    """
+
+    # A page this full probably hit the ~100 ceiling and left articles out.
+    SATURATED = 90
+    # Expected articles a merged window may reach.
+    TARGET = 60
+
+    def __init__(self, start: datetime.datetime, end: datetime.datetime, max_results: int,
+                 keep: bool = True) -> None:
+        days = max(1, (end - start).days)
+        count = max(1, min(days, -(-max_results // 100)))
+        bounds = [start + datetime.timedelta(days=days * i // count) for i in range(count + 1)]
+        # (start, end, split): halves of a saturated window are never merged back.
+        self.pending = deque((bounds[i], bounds[i + 1], False) for i in reversed(range(count)))
+        self.max_results = max_results
+        self.seen: set[bytes] = set()
+        self.count = 0
+        self.requests = 0
+        self.running: dict[tuple[datetime.datetime, datetime.datetime], bool] = {}
+        self.density: float | None = None
+        self.done = False
+        self._parts: list[tuple[datetime.datetime, list[dict]]] | None = [] if keep else None
+
+    def next_window(self) -> tuple[datetime.datetime, datetime.datetime] | None:
+        if self.done or not self.pending:
+            return None
+        start, end, split = self.pending.popleft()
+        if not split and self.density is not None:
+            while (self.pending and not self.pending[0][2] and self.pending[0][1] == start
+                   and self.density * (end - self.pending[0][0]).days < self.TARGET):
+                start = self.pending.popleft()[0]
+        self.running[start, end] = split
+        self.requests += 1
+        return start, end
+
+    def complete(self, window: tuple[datetime.datetime, datetime.datetime], articles: list[dict],
+                 fetched: int) -> list[dict]:
+        """Record a fetched window; returns its articles not seen in any other window."""
+        self.running.pop(window, None)
+        start, end = window
+        days = (end - start).days
+        if fetched >= self.SATURATED:
+            if days > 1:
+                middle = start + datetime.timedelta(days=days // 2)
+                self.pending.extendleft([(start, middle, True), (middle, end, True)])
+        else:
+            self.density = fetched / days
+        new = []
+        for article in articles:
+            if self.done:
+                break
+            # Lazy articles dedup on the feed link so planning never triggers resolution.
+            digest = url_digest(article.link if isinstance(article, LazyArticle) else article['url'])
+            if digest in self.seen:
+                continue
+            self.seen.add(digest)
+            new.append(article)
+            self.count += 1
+            if self.count >= self.max_results:
+                self.done = True
+        if self._parts is not None:
+            self._parts.append((start, new))
+        return new
+
+    def cursor(self, query: str) -> NewsCursor:
+        """Snapshot of the plan; windows still in flight are recorded as pending and refetched on resume."""
+        windows = sorted([(start, end, split) for (start, end), split in self.running.items()] + list(self.pending),
+                         key=lambda window: window[0], reverse=True)
+        state = {
+            'pending': [[start.isoformat(), end.isoformat(), split] for start, end, split in windows],
+            'density': self.density,
+        }
+        return NewsCursor(query, 'range', state, self.seen, self.count, self.done or not windows)
+
+    @classmethod
+    def resume(cls, cursor: NewsCursor, max_results: int, keep: bool = True) -> _DateRangePlan:
+        pending = [(datetime.datetime.fromisoformat(start), datetime.datetime.fromisoformat(end), bool(split))
+                   for start, end, split in cursor.state.get('pending', [])]
+        now = datetime.datetime.now()
+        plan = cls(now, now, max_results, keep=keep)
+        plan.pending = deque(pending)
+        plan.density = cursor.state.get('density')
+        plan.seen = set(cursor.seen)
+        plan.count = cursor.count
+        plan.done = cursor.done or cursor.count >= max_results
+        return plan
+
+    @property
+    def articles(self) -> list[dict]:
+        """Kept articles, newest window first and in feed order within a window."""
+        parts = sorted(self._parts or (), key=lambda part: part[0], reverse=True)
+        return [article for _, new in parts for article in new][:self.max_results]
+
+
+class _FeedWatch:
+    """Polling state of one feed followed by :meth:`GNews.watch`.
+
+    Keeps the feed's validators and the IDs of the entries already seen, so only new
+    entries are processed, and stretches the polling interval while the feed stays
+    unchanged. The most recent ``MAX_SEEN`` IDs are remembered; entries still on the
+    feed are refreshed on every poll and never forgotten.
+    """
+
+    MAX_SEEN = 2048
+
+    def __init__(self, feed: str, query: str, interval: float, max_interval: float, backoff: float,
+                 skip_existing: bool, now: float) -> None:
+        self.feed = feed
+        self.query = query
+        self.base_interval = interval
+        self.interval = interval
+        self.max_interval = max_interval
+        self.backoff = backoff
+        self.skip_existing = skip_existing
+        self.next_at = now
+        self.etag = None
+        self.modified = None
+        self.seen: dict[str, None] = {}
+        self.polls = 0
+
+    def conditional(self) -> dict:
+        return {key: value for key, value in (('etag', self.etag), ('modified', self.modified)) if value}
+
+    def new_entries(self, feed_data, limit: int) -> list:
+        """Entries of a fetched feed that were not on it before, in feed order."""
+        self.polls += 1
+        if feed_data.status == 304:
+            return []
+        self.etag = getattr(feed_data, 'etag', None)
+        self.modified = getattr(feed_data, 'modified', None)
+        new = []
+        for item in feed_data.entries[:limit]:
+            entry_id = item.get('id') or item.get('link')
+            if entry_id not in self.seen:
+                new.append(item)
+            self.seen.pop(entry_id, None)
+            self.seen[entry_id] = None
+        while len(self.seen) > self.MAX_SEEN:
+            del self.seen[next(iter(self.seen))]
+        return [] if self.skip_existing and self.polls == 1 else new
+
+    def reschedule(self, changed: bool, now: float) -> None:
+        """Poll again after the base interval if the feed changed, else back off."""
+        self.interval = self.base_interval if changed else min(self.interval * self.backoff, self.max_interval)
+        self.next_at = now + self.interval
+
 
 class GNews:
     def __init__(
@@ -39,11 +393,25 @@ class GNews:
         start_date: tuple | datetime.datetime | None = None,
         end_date: tuple | datetime.datetime | None = None,
         exclude_websites: list[str] | None = None,
+        include_websites: list[str] | None = None,
         proxy: dict | None = None,
         searchapi_key: str | None = None,
         max_retries: int = 3,
         retry_backoff_base: float = 1.0,
         retry_backoff_max: float = 60.0,
+        url_cache: ResolutionCache | str | None = None,
+        browser_pool: BrowserPool | None = None,
+        lazy_urls: bool = False,
+        max_workers: int = 8,
+        compact_articles: bool = False,
+        validator_store: MemoryValidatorStore | SQLiteValidatorStore | str | None = None,
+        response_cache: ResponseCache | None = None,
+        transport: Transport | None = None,
+        searchapi_concurrency: int | None = None,
+        rate_limit: float | RateLimiter | SQLiteRateLimiter | None = None,
+        searchapi_rate_limit: float | RateLimiter | SQLiteRateLimiter | None = None,
+        dedup_store: SQLiteDedupStore | BloomDedupStore | str | None = None,
+        article_cache: ArticleCache | str | None = None,
     ) -> None:
         """
         Initialize the GNews client with configuration options.
@@ -54,7 +422,10 @@ class GNews:
         :param period: Time period for filtering news
         :param start_date: Date after which results must have been published
         :param end_date: Date before which results must have been published
-        :param exclude_websites: List of websites to exclude from results
+        :param exclude_websites: List of websites to exclude from results. A website also
+            excludes its subdomains, e.g. 'cnn.com' excludes 'edition.cnn.com'
+        :param include_websites: Only return results from these websites (and their
+            subdomains). Exclusions still apply on top.
         :param proxy: Proxy settings as a dict {protocol: address}
         :param searchapi_key: Optional SearchAPI key to enable the paid backend
         :param max_retries: Maximum retry attempts on HTTP 429 responses from Google News.
@@ -64,6 +435,52 @@ class GNews:
             plus uniform jitter in ``[0, retry_backoff_base)``. Defaults to 1.0.
         :param retry_backoff_max: Maximum seconds any single backoff wait may reach.
             Caps the exponential growth. Defaults to 60.0.
+        :param url_cache: Cache for resolved Google News article URLs. Pass a
+            ``ResolutionCache`` or the path of a SQLite file to share across runs and
+            worker processes. Disabled by default.
+        :param browser_pool: ``BrowserPool`` used to resolve Google News links with
+            Playwright. By default the client creates and owns one, which is started on
+            first use and shut down by :meth:`close`.
+        :param lazy_urls: Return articles whose ``url`` starts as the Google News link and
+            is resolved to the publisher URL on first access, or in bulk through
+            :meth:`resolve`. Defaults to False (resolve every article up front).
+        :param max_workers: Maximum number of feed entries processed (and URLs resolved)
+            concurrently. Set to 1 to process entries one at a time. Defaults to 8.
+        :param compact_articles: Return immutable, slotted :class:`Article` records instead
+            of dicts. They support read-only dict access and take far less memory when
+            holding many results. Cannot be combined with ``lazy_urls``. Defaults to False.
+        :param validator_store: Store of ``ETag``/``Last-Modified`` validators per feed URL,
+            which makes repeat fetches conditional. When the feed is unchanged (HTTP 304) the
+            articles from the previous fetch are returned without parsing or resolving
+            anything. Pass a ``MemoryValidatorStore``, a ``SQLiteValidatorStore`` or the path
+            of a SQLite file. Disabled by default.
+        :param response_cache: ``ResponseCache`` for whole query results. A hit skips
+            fetching, parsing and URL resolution. The ``get_*`` methods take a
+            ``cache_ttl`` argument to override its TTL per call; ``cache_ttl=0`` always
+            fetches fresh. Disabled by default.
+        :param transport: ``Transport`` with the pooled HTTP connections used for feeds,
+            the redirect fallback and SearchApi. By default the client creates and owns
+            one with keep-alive connections, which :meth:`close` shuts down. Pass your
+            own to tune connection limits or enable HTTP/2, or to share it between clients.
+        :param searchapi_concurrency: With the SearchApi backend, collect up to
+            ``max_results`` results from consecutive pages (starting at ``page``) with this
+            many requests in flight, instead of returning the single requested page. Each
+            page is a billed SearchApi request. Defaults to None (one page per call).
+        :param rate_limit: Requests per second allowed to Google News. A number draws from
+            a token bucket shared by every client in the process, and clients passing a
+            different number raise ``InvalidConfigError``; pass a ``RateLimiter`` for a
+            private budget or a ``SQLiteRateLimiter`` to share one across processes.
+            Each feed request, browser navigation and HEAD redirect fallback waits for a
+            token before it is sent; cached link resolutions do not. Disabled by default.
+        :param searchapi_rate_limit: Same as ``rate_limit``, for SearchApi requests.
+        :param dedup_store: Record of the articles already returned, kept across calls and
+            runs. Feed entries found in it are dropped before their URL is resolved or
+            their description cleaned. Pass a ``SQLiteDedupStore`` (exact), a
+            ``BloomDedupStore`` (fixed memory, tunable false-positive rate) or the path
+            of a SQLite file. Disabled by default.
+        :param article_cache: ``ArticleCache`` (or the path of its SQLite file) for the
+            pages and text of :meth:`get_full_article` and :meth:`get_full_articles`.
+            Stale entries are revalidated with ``ETag``/``Last-Modified``. Disabled by default.
         """
         if max_retries < 0:
             raise InvalidConfigError("max_retries must be >= 0.")
@@ -74,6 +491,12 @@ class GNews:
 
         if max_results <= 0:
             raise InvalidConfigError("max_results must be a positive integer.")
+        if max_workers <= 0:
+            raise InvalidConfigError("max_workers must be a positive integer.")
+        if compact_articles and lazy_urls:
+            raise InvalidConfigError("compact_articles cannot be combined with lazy_urls.")
+        if searchapi_concurrency is not None and searchapi_concurrency <= 0:
+            raise InvalidConfigError("searchapi_concurrency must be a positive integer.")
 
         self._max_results = max_results
         self._language = language
@@ -84,23 +507,67 @@ class GNews:
         self.end_date = end_date
         self.start_date = start_date
         self._exclude_websites = exclude_websites if exclude_websites and isinstance(exclude_websites, list) else []
+        self._exclude_index = DomainIndex(self._exclude_websites)
+        self._include_websites = include_websites if include_websites and isinstance(include_websites, list) else []
+        self._include_index = DomainIndex(self._include_websites)
         self._proxy = proxy if proxy else None
-        self._searchapi = SearchApiBackend(searchapi_key) if searchapi_key else None
+        self._owns_transport = transport is None
+        self._transport = Transport(proxies=self._proxy) if transport is None else transport
+        self._rate_limiter = self._limiter(rate_limit, "news.google.com")
+        self._searchapi = None
+        if searchapi_key:
+            # Imported here so clients without a SearchApi key never load the backend.
+            from gnews.backends.searchapi import SearchApiBackend
+            self._searchapi = SearchApiBackend(
+                searchapi_key, transport=self._transport,
+                rate_limiter=self._limiter(searchapi_rate_limit, "searchapi"),
+            )
+        self._searchapi_concurrency = searchapi_concurrency
         self._max_retries = max_retries
         self._retry_backoff_base = retry_backoff_base
         self._retry_backoff_max = retry_backoff_max
+        self._url_cache = ResolutionCache(url_cache) if isinstance(url_cache, (str, os.PathLike)) else url_cache
+        self._validator_store = (SQLiteValidatorStore(validator_store)
+                                 if isinstance(validator_store, (str, os.PathLike)) else validator_store)
+        self._response_cache = response_cache
+        self._dedup_store = (SQLiteDedupStore(dedup_store)
+                             if isinstance(dedup_store, (str, os.PathLike)) else dedup_store)
+        self._article_cache = (ArticleCache(article_cache)
+                               if isinstance(article_cache, (str, os.PathLike)) else article_cache)
+        self._lazy_urls = lazy_urls
+        self._max_workers = max_workers
+        self._compact_articles = compact_articles
+        self._executor = None
+        self._executor_lock = threading.Lock()
+        self._process_pool = None
+        self._process_pool_size = None
+        self._owns_browser_pool = browser_pool is None
+        self._browser_pool = BrowserPool(proxies=self._proxy) if browser_pool is None else browser_pool
+        self._http_async = None
+        self._http_async_loop = None
+        self._closing_clients = set()
+
+    @staticmethod
+    def _limiter(rate_limit, name: str) -> RateLimiter | SQLiteRateLimiter | None:
+        if rate_limit is None or isinstance(rate_limit, (RateLimiter, SQLiteRateLimiter)):
+            return rate_limit
+        return RateLimiter.shared(name, rate_limit)
 
-    def _ceid(self) -> str:
+    def _ceid(self, searching: bool = False, window: tuple | None = None) -> str:
         time_query = ''
-        if self._start_date or self._end_date:
-            if inspect.stack()[2][3] != 'get_news':
+        if window is not None:
+            start_date, end_date = window
+            time_query += '%20before%3A{}'.format(end_date.strftime("%Y-%m-%d"))
+            time_query += '%20after%3A{}'.format(start_date.strftime("%Y-%m-%d"))
+        elif self._start_date or self._end_date:
+            if not searching:
                 warnings.warn(message=("Only searches using get_news support date ranges. "
-                                       "Start and end dates will be ignored."), category=UserWarning, stacklevel=4)
+                                       "Start and end dates will be ignored."), category=UserWarning, stacklevel=5)
                 if self._period:
                     time_query += 'when%3A'.format(self._period)
             if self._period:
                 warnings.warn(message=f'\nPeriod ({self.period}) will be ignored in favour of the start and end dates',
-                              category=UserWarning, stacklevel=4)
+                              category=UserWarning, stacklevel=5)
             if self.end_date is not None:
                 time_query += '%20before%3A{}'.format(self.end_date)
             if self.start_date is not None:
@@ -130,6 +597,18 @@ class GNews:
         if not isinstance(exclude_websites, list):
             raise InvalidConfigError("exclude_websites must be a list.")
         self._exclude_websites = exclude_websites
+        self._exclude_index = DomainIndex(exclude_websites)
+
+    @property
+    def include_websites(self):
+        return self._include_websites
+
+    @include_websites.setter
+    def include_websites(self, include_websites):
+        if not isinstance(include_websites, list):
+            raise InvalidConfigError("include_websites must be a list.")
+        self._include_websites = include_websites
+        self._include_index = DomainIndex(include_websites)
 
     @property
     def max_results(self):
@@ -160,7 +639,7 @@ class GNews:
     def start_date(self, start_date):
         if type(start_date) is tuple:
             start_date = datetime.datetime(start_date[0], start_date[1], start_date[2])
-        if self._end_date:
+        if self._end_date and start_date is not None:
             if start_date - self._end_date == datetime.timedelta(days=0):
                 warnings.warn("The start and end dates should be at least 1 day apart.")
             elif self._end_date < start_date:
@@ -194,43 +673,418 @@ class GNews:
         self._country = AVAILABLE_COUNTRIES.get(country, country)
 
     def get_full_article(self, url: str) -> dict:
-        try:
-            import trafilatura
-        except ImportError as e:
-            raise ImportError(
-                "get_full_article() requires trafilatura. "
-                "Install it with: pip install gnews[fulltext]"
-            ) from e
+        """
+        Download an article and extract its main text. Requires ``pip install gnews[fulltext]``.
+
+        With an ``article_cache`` the page is fetched through the client's transport so it
+        can be revalidated, and a fresh cached article is returned without any request.
+
+        :param url: Article URL
+        :return: ``{'text', 'url'}``
+        """
+        trafilatura = trafilatura_module("get_full_article()")
+        if self._article_cache is not None:
+            return self._download_and_extract(url)
 
         downloaded = trafilatura.fetch_url(url)
         if not downloaded:
             raise NetworkError(f"Could not download article from {url}")
 
         text = trafilatura.extract(downloaded, include_comments=False, include_tables=False)
+        return self._full_article(url, text)
+
+    @staticmethod
+    def _full_article(url: str, text: str | None) -> dict:
         if not text:
             raise NetworkError(f"Could not extract article text from {url}")
-
         return {"text": text, "url": url}
 
+    def get_full_articles(self, urls: Iterable[str], concurrency: int | None = None,
+                          processes: int | None = None) -> list[dict | Exception]:
+        """
+        Download and extract many articles at once.
+
+        Pages are downloaded concurrently over the client's pooled transport, and each
+        one is handed to a process pool for text extraction as soon as it arrives, so
+        extraction uses every core while the remaining downloads are in flight. Articles
+        in the ``article_cache`` are served from it.
+
+        :param urls: Article URLs
+        :param concurrency: Maximum downloads in flight. Defaults to ``max_workers``.
+        :param processes: Extraction worker processes. Defaults to the number of CPUs;
+            0 extracts on the download threads instead. The pool is kept by the client
+            and shut down by :meth:`close`.
+        :return: One entry per URL, in input order: ``{'text', 'url'}`` as returned by
+            :meth:`get_full_article`, or the exception that URL failed with.
+        """
+        trafilatura_module("get_full_articles()")
+        urls = list(urls)
+        concurrency = self._fulltext_concurrency(concurrency)
+        pool = self._extraction_pool(processes)
+        results: list[dict | Exception | None] = [None] * len(urls)
+        extracting = {}
+        with ThreadPoolExecutor(max_workers=max(1, min(concurrency, len(urls))),
+                                thread_name_prefix="gnews-fulltext") as downloads:
+            fetch = self._article_source if pool is not None else self._download_and_extract
+            futures = {downloads.submit(fetch, url): index for index, url in enumerate(urls)}
+            for future in as_completed(futures):
+                index = futures[future]
+                try:
+                    result = future.result()
+                except Exception as err:
+                    results[index] = err
+                    continue
+                if isinstance(result, dict):
+                    results[index] = result
+                else:
+                    extracting[pool.submit(extract_text, result[0])] = (index, result)
+        for future, (index, (html, validators)) in extracting.items():
+            try:
+                results[index] = self._store_article(urls[index], html, validators, future.result())
+            except Exception as err:
+                results[index] = err
+        return results
+
+    def iter_full_articles_async(self, urls: Iterable[str], concurrency: int | None = None,
+                                 processes: int | None = None) -> AsyncIterator[tuple[str, dict | Exception]]:
+        """
+        Async-iterator version of :meth:`get_full_articles`.
+
+        Yields ``(url, result)`` as each article finishes, in completion order. Downloads
+        use the pooled async HTTP client when httpx is installed. Leaving the loop
+        cancels the downloads still pending.
+        """
+        trafilatura_module("iter_full_articles_async()")
+        return self._iter_full_articles_async(list(urls), self._fulltext_concurrency(concurrency),
+                                              self._extraction_pool(processes))
+
+    async def _iter_full_articles_async(self, urls: list[str], concurrency: int,
+                                        pool) -> AsyncIterator[tuple[str, dict | Exception]]:
+        semaphore = asyncio.Semaphore(concurrency)
+        loop = asyncio.get_running_loop()
+
+        async def one(url):
+            try:
+                async with semaphore:
+                    source = await self._article_source_async(url)
+                if isinstance(source, dict):
+                    return url, source
+                if pool is None:
+                    text = await asyncio.to_thread(extract_text, source[0])
+                else:
+                    text = await loop.run_in_executor(pool, extract_text, source[0])
+                return url, self._store_article(url, source[0], source[1], text)
+            except Exception as err:
+                return url, err
+
+        tasks = [asyncio.ensure_future(one(url)) for url in urls]
+        try:
+            for finished in asyncio.as_completed(tasks):
+                yield await finished
+        finally:
+            for task in tasks:
+                task.cancel()
+
+    def _fulltext_concurrency(self, concurrency: int | None) -> int:
+        if concurrency is not None and concurrency <= 0:
+            raise InvalidConfigError("concurrency must be a positive integer.")
+        return self._max_workers if concurrency is None else concurrency
+
+    def _extraction_pool(self, processes: int | None) -> ProcessPoolExecutor | None:
+        """Client-wide process pool for extraction, rebuilt if a different size is asked for.
+
+        Workers start from a fork server where the platform has one, and are spawned
+        otherwise: the client runs download threads, so forking it could copy a lock
+        some other thread holds into the child.
+        """
+        if processes is not None and processes < 0:
+            raise InvalidConfigError("processes must be >= 0.")
+        if processes == 0:
+            return None
+        size = processes or os.cpu_count() or 1
+        with self._executor_lock:
+            if self._process_pool is not None and self._process_pool_size != size:
+                self._process_pool.shutdown(wait=False)
+                self._process_pool = None
+            if self._process_pool is None:
+                self._process_pool = ProcessPoolExecutor(max_workers=size, mp_context=_worker_context())
+                self._process_pool_size = size
+            return self._process_pool
+
+    def _cached_article_entry(self, url: str) -> CachedArticle | None:
+        return self._article_cache.get(url) if self._article_cache is not None else None
+
+    def _article_source(self, url: str) -> dict | tuple[bytes, dict]:
+        """The cached article for ``url``, or the page HTML and validators still to be extracted."""
+        entry = self._cached_article_entry(url)
+        if entry is not None and entry.fresh:
+            return self._full_article(url, entry.text)
+        try:
+            response = self._transport.get(url, headers=self._article_headers(entry))
+        except Exception as err:
+            raise NetworkError(f"Could not download article from {url}: {err}") from err
+        return self._article_response(url, entry, response)
+
+    async def _article_source_async(self, url: str) -> dict | tuple[bytes, dict]:
+        client = self._async_http()
+        if client is None:
+            return await asyncio.to_thread(self._article_source, url)
+        entry = self._cached_article_entry(url)
+        if entry is not None and entry.fresh:
+            return self._full_article(url, entry.text)
+        try:
+            response = await client.get(url, headers=self._article_headers(entry))
+        except Exception as err:
+            raise NetworkError(f"Could not download article from {url}: {err}") from err
+        return self._article_response(url, entry, response)
+
+    @staticmethod
+    def _article_headers(entry: CachedArticle | None) -> dict | None:
+        return conditional_headers(entry.etag, entry.modified) if entry is not None else None
+
+    def _article_response(self, url: str, entry: CachedArticle | None, response) -> dict | tuple[bytes, dict]:
+        if response.status_code == 304 and entry is not None:
+            self._article_cache.refresh(url, entry)
+            return self._full_article(url, entry.text)
+        if response.status_code != 200 or not response.content:
+            raise NetworkError(f"Could not download article from {url} (HTTP {response.status_code})")
+        validators = {"etag": response.headers.get("ETag"), "modified": response.headers.get("Last-Modified")}
+        return response.content, validators
+
+    def _store_article(self, url: str, html: bytes, validators: dict, text: str | None) -> dict:
+        if self._article_cache is not None:
+            self._article_cache.set(url, html, text, **validators)
+        return self._full_article(url, text)
+
+    def _download_and_extract(self, url: str) -> dict:
+        source = self._article_source(url)
+        if isinstance(source, dict):
+            return source
+        html, validators = source
+        return self._store_article(url, html, validators, extract_text(html))
+
     @staticmethod
     def _clean(html: str) -> str:
-        soup = Soup(html, features="html.parser")
-        text = soup.get_text()
-        text = text.replace('\xa0', ' ')
-        return text
-
-    def _process(self, item: dict) -> dict | None:
-        url = process_url(item, self._exclude_websites, self._proxy)
-        if url:
-            title = item.get("title", "")
-            item = {
-                'title': title,
-                'description': self._clean(item.get("description", "")),
-                'published date': item.get("published", ""),
-                'url': url,
-                'publisher': item.get("source", " ")
-            }
-            return item
+        return strip_html(html)
+
+    def _accepts(self, item: dict) -> bool:
+        source = item.get('source').get('href')
+        if self._include_index and not self._include_index.matches(source):
+            return False
+        return not self._exclude_index.matches(source)
+
+    def _process(self, item: dict, pending: _PendingKeys | None = None) -> dict | None:
+        """Article for a feed entry, or None if it was seen before or is filtered out.
+
+        The entry's dedup key goes to ``pending``, to be recorded once the article is delivered.
+        """
+        key = self._unseen_key(item.get('link'))
+        if key is None or not self._accepts(item):
+            return None
+        if self._lazy_urls:
+            article = LazyArticle(self._build_article(item, item.get('link')), self._resolve_link)
+        else:
+            article = self._build_article(item, self._resolve_link(item.get('link')))
+        if pending is not None:
+            pending.hold(article, key)
+        return article
+
+    async def _process_async(self, item: dict, pending: _PendingKeys | None = None) -> dict | None:
+        key = self._unseen_key(item.get('link'))
+        if key is None or not self._accepts(item):
+            return None
+        if self._lazy_urls:
+            article = LazyArticle(self._build_article(item, item.get('link')), self._resolve_link)
+        else:
+            url = await resolve_link_async(item.get('link'), self._proxy, self._async_http(),
+                                           self._url_cache, self._browser_pool, self._rate_limiter)
+            article = self._build_article(item, url)
+        if pending is not None:
+            pending.hold(article, key)
+        return article
+
+    def _unseen_key(self, url: str | None) -> int | bool | None:
+        """Dedup key of an article not returned before, True without a dedup store, or None if seen."""
+        if self._dedup_store is None or not url:
+            return True
+        key = dedup_key(url)
+        return None if key in self._dedup_store else key
+
+    def _mark_seen(self, key: int | bool) -> None:
+        if key is not True:
+            self._dedup_store.add(key)
+
+    def _drop_seen(self, articles: list[dict]) -> list[dict]:
+        """Filter SearchApi results through the dedup store, recording the ones kept."""
+        if self._dedup_store is None:
+            return articles
+        fresh = []
+        for article in articles:
+            key = self._unseen_key(article.get('url'))
+            if key is not None:
+                self._mark_seen(key)
+                fresh.append(article)
+        return fresh
+
+    def _unchanged(self, cached: CachedFeed, pending: _PendingKeys | None = None) -> list[dict]:
+        """Articles for a feed page that came back 304.
+
+        With a dedup store only the stored articles not delivered since are returned,
+        and their keys go to ``pending`` like freshly processed ones.
+        """
+        if self._dedup_store is None:
+            return self._restore([_detached(article) for article in cached.articles])
+        if cached.keys is None:
+            return []
+        unseen = [(article, key) for article, key in zip(cached.articles, cached.keys)
+                  if key is None or key not in self._dedup_store]
+        articles = self._restore([_detached(article) for article, _ in unseen])
+        if pending is not None:
+            for article, (_, key) in zip(articles, unseen):
+                if key is not None:
+                    pending.hold(article, key)
+        return articles
+
+    def _process_safely(self, item: dict, pending: _PendingKeys | None = None) -> dict | None:
+        try:
+            return self._process(item, pending)
+        except Exception as err:
+            logger.warning("Skipping feed entry that failed to process: %s", err)
+            return None
+
+    def _process_entries(self, entries: list, pending: _PendingKeys | None = None) -> list[dict]:
+        # Lazy articles are cheap to build, so threads would only add overhead.
+        if self._lazy_urls or self._max_workers == 1 or len(entries) <= 1:
+            processed = (self._process_safely(item, pending) for item in entries)
+        else:
+            processed = self._worker_pool().map(self._process_safely, entries, [pending] * len(entries))
+        return [item for item in processed if item]
+
+    def _iter_entries(self, entries: list, pending: _PendingKeys | None = None) -> Iterator[dict]:
+        """Yield processed entries in feed order as soon as each is ready.
+
+        At most ``max_workers`` entries are in flight, and the ones not yet started
+        are cancelled when the consumer stops iterating.
+        """
+        if self._lazy_urls or self._max_workers == 1 or len(entries) <= 1:
+            for item in entries:
+                article = self._process_safely(item, pending)
+                if article:
+                    yield article
+            return
+        pool = self._worker_pool()
+        remaining = iter(entries)
+        running = deque(pool.submit(self._process_safely, item, pending)
+                        for item in islice(remaining, self._max_workers))
+        try:
+            while running:
+                article = running.popleft().result()
+                for item in remaining:
+                    running.append(pool.submit(self._process_safely, item, pending))
+                    break
+                if article:
+                    yield article
+        finally:
+            for future in running:
+                future.cancel()
+
+    async def _process_entries_async(self, entries: list, pending: _PendingKeys | None = None) -> list[dict]:
+        semaphore = asyncio.Semaphore(self._max_workers)
+
+        async def process_one(item):
+            async with semaphore:
+                try:
+                    return await self._process_async(item, pending)
+                except Exception as err:
+                    logger.warning("Skipping feed entry that failed to process: %s", err)
+                    return None
+
+        processed = await asyncio.gather(*(process_one(item) for item in entries))
+        return [item for item in processed if item]
+
+    async def _iter_entries_async(self, entries: list, pending: _PendingKeys | None = None) -> AsyncIterator[dict]:
+        """Async counterpart of :meth:`_iter_entries`."""
+        async def process_one(item):
+            try:
+                return await self._process_async(item, pending)
+            except Exception as err:
+                logger.warning("Skipping feed entry that failed to process: %s", err)
+                return None
+
+        remaining = iter(entries)
+        running = deque(asyncio.ensure_future(process_one(item)) for item in islice(remaining, self._max_workers))
+        try:
+            while running:
+                article = await running.popleft()
+                for item in remaining:
+                    running.append(asyncio.ensure_future(process_one(item)))
+                    break
+                if article:
+                    yield article
+        finally:
+            for task in running:
+                task.cancel()
+
+    def _worker_pool(self) -> ThreadPoolExecutor:
+        """Client-wide pool for entry processing, so concurrent queries share one worker limit."""
+        with self._executor_lock:
+            if self._executor is None:
+                self._executor = ThreadPoolExecutor(max_workers=self._max_workers, thread_name_prefix="gnews")
+            return self._executor
+
+    def _resolve_link(self, url: str) -> str:
+        return resolve_link(url, self._proxy, cache=self._url_cache, pool=self._browser_pool,
+                            transport=self._transport, rate_limiter=self._rate_limiter)
+
+    def resolve(self, articles: Iterable[dict], concurrency: int | None = None) -> list[dict]:
+        """
+        Resolve the publisher URL of lazily returned articles in bulk.
+
+        Only call this on the articles you keep; anything else is never resolved.
+
+        :param articles: Articles returned with ``lazy_urls=True``; other dicts pass through
+        :param concurrency: Maximum number of URLs resolved at once, defaults to ``max_workers``
+        :return: The articles as a list, with ``url`` resolved in place
+        """
+        concurrency = concurrency or self._max_workers
+        if concurrency <= 0:
+            raise InvalidConfigError("concurrency must be a positive integer.")
+        articles = list(articles)
+        pending = [a for a in articles if isinstance(a, LazyArticle) and not a.resolved]
+        if pending:
+            with ThreadPoolExecutor(max_workers=min(concurrency, len(pending))) as pool:
+                list(pool.map(LazyArticle.resolve, pending))
+        return articles
+
+    async def resolve_async(self, articles: Iterable[dict], concurrency: int | None = None) -> list[dict]:
+        """Async version of :meth:`resolve`."""
+        concurrency = concurrency or self._max_workers
+        if concurrency <= 0:
+            raise InvalidConfigError("concurrency must be a positive integer.")
+        articles = list(articles)
+        semaphore = asyncio.Semaphore(concurrency)
+        client = self._async_http()
+
+        async def resolve_one(article):
+            async with semaphore:
+                article._set_url(await resolve_link_async(article.link, self._proxy, client, self._url_cache,
+                                                          self._browser_pool, self._rate_limiter))
+
+        await asyncio.gather(*(resolve_one(a) for a in articles if isinstance(a, LazyArticle) and not a.resolved))
+        return articles
+
+    def _build_article(self, item: dict, url: str) -> dict:
+        article = {
+            'title': item.get("title", ""),
+            'description': self._clean(item.get("description", "")),
+            'published date': item.get("published", ""),
+            'url': url,
+            'publisher': item.get("source", " ")
+        }
+        return Article(article) if self._compact_articles else article
+
+    def _records(self, articles: list[dict]) -> list[dict]:
+        return [Article(article) for article in articles] if self._compact_articles else articles
 
     def docstring_parameter(*sub):
         def dec(obj):
@@ -247,151 +1101,981 @@ class GNews:
                        "{'href': link to publisher's website," + indent2 + "'title': name of the publisher}}")
 
     @docstring_parameter(standard_output)
-    def get_news(self, key: str, page: int = 1) -> list[dict]:
+    def get_news(self, key: str, page: int = 1, cache_ttl: float | None = None) -> list[dict]:
         if key:
-            if self._searchapi:
-                return self._searchapi.get_news(
-                    query=key,
-                    language=self._language,
-                    country=self._country,
-                    start_date=self.start_date,
-                    end_date=self.end_date,
-                    max_results=self._max_results,
-                    page=page,
-                )
-            if self._max_results > 100:
-                return self._get_news_more_than_100(key)
-            key = "%20".join(key.split(" "))
-            query = '/search?q={}'.format(key)
-            return self._get_news(query)
+            return self._cached(self._news_request(key, page), cache_ttl, lambda: self._fetch_news(key, page))
         raise InvalidConfigError("Search key cannot be empty.")
 
+    def _fetch_news(self, key: str, page: int) -> list[dict]:
+        if self._searchapi:
+            return self._records(self._searchapi_news(key, page))
+        if self._max_results > 100:
+            date_range = self._date_range()
+            if date_range is not None:
+                return self._get_news_in_range(key, date_range)
+            return self._get_news_more_than_100(key)
+        return self._get_news(self._search_query(key))
+
     def _get_news_more_than_100(self, key: str) -> list[dict]:
         """Walk past the Google News ~100-result ceiling using rolling date windows.
 
-        Caveats (callers building precise temporal pipelines should know):
+        Used when the client has no ``start_date`` or ``period``; bounded searches go
+        through :meth:`_get_news_in_range` instead. Caveats:
 
-        * Any ``start_date``, ``end_date``, or ``period`` configured on the client is
-          **discarded** before pagination begins. Date filters apply only when
-          ``max_results <= 100``.
+        * An ``end_date`` is kept: the first window is the 7 days before it. Without
+          one the first request is undated and returns the newest articles.
+        * A ``period`` that cannot be turned into a start date only applies to that
+          first undated request.
         * The walker steps backward in 7-day windows anchored on the earliest
           ``published_date`` seen so far. Results returned may extend significantly
           earlier than any date you intended to filter on.
         * Articles whose ``published date`` cannot be parsed are skipped for window
           anchoring but still returned, which can stall the window at the previous
           earliest date.
-        * Per-call de-duplication is in-memory (``seen_urls``) and does not persist
-          across calls; callers needing cross-run dedup must layer their own.
+        * De-duplication is in-memory and covers every window of the walk. It does
+          not persist across calls; pass a ``dedup_store`` for cross-run dedup.
 
-        If you need strict date precision, keep ``max_results <= 100`` and call
-        multiple times with explicit windows instead.
+        If you need strict date precision, set ``start_date`` (or ``period``) so the
+        range engine is used instead.
         """
-        articles = []
-        seen_urls = set()
-        earliest_date = None
-
-        if self._start_date or self._end_date or self._period:
+        walk = self._start_walk()
+        while not walk.done:
+            pending = _PendingKeys(self._dedup_store)
+            pending.deliver(walk.take(*self._get_page(f'/search?q={key}', window=walk.window, pending=pending)))
+        return walk.articles
+
+    async def _get_news_more_than_100_async(self, key: str) -> list[dict]:
+        """Async counterpart of :meth:`_get_news_more_than_100`; same caveats apply."""
+        walk = self._start_walk()
+        while not walk.done:
+            pending = _PendingKeys(self._dedup_store)
+            page = await self._get_page_async(f'/search?q={key}', window=walk.window, pending=pending)
+            pending.deliver(walk.take(*page))
+        return walk.articles
+
+    def _date_range(self) -> tuple[datetime.datetime, datetime.datetime] | None:
+        """Whole-day ``[start, end)`` range for searches past 100 results, or None when unbounded.
+
+        ``start_date`` or, failing that, ``period`` gives the start; the end defaults to
+        tomorrow so today's articles are included.
+        """
+        now = datetime.datetime.now()
+        end = self._end_date or now + datetime.timedelta(days=1)
+        start = self._start_date
+        if start is None and self._period:
+            match = re.fullmatch(r'(\d+)([hdmy])', self._period)
+            if match is None:
+                return None
+            amount, unit = int(match.group(1)), match.group(2)
+            start = now - datetime.timedelta(hours=amount) if unit == 'h' else \
+                now - datetime.timedelta(days=amount * {'d': 1, 'm': 30, 'y': 365}[unit])
+        if start is None:
+            return None
+        start = datetime.datetime(start.year, start.month, start.day)
+        end = datetime.datetime(end.year, end.month, end.day)
+        return start, max(end, start + datetime.timedelta(days=1))
+
+    def _get_news_in_range(self, key: str,
+                           date_range: tuple[datetime.datetime, datetime.datetime]) -> list[dict]:
+        """Collect up to ``max_results`` articles from ``date_range`` with adaptive, concurrent windows.
+
+        Windows are fetched up to ``max_workers`` at a time and planned by
+        :class:`_DateRangePlan`: saturated windows are split, sparse ones merged.
+        Duplicates across windows are dropped and the result is ordered newest
+        window first.
+        """
+        plan = _DateRangePlan(*date_range, self._max_results)
+        for new, pending in self._iter_range_pages(self._search_query(key), plan):
+            pending.deliver(new)
+        return plan.articles
+
+    async def _get_news_in_range_async(self, key: str,
+                                       date_range: tuple[datetime.datetime, datetime.datetime]) -> list[dict]:
+        """Async counterpart of :meth:`_get_news_in_range`."""
+        plan = _DateRangePlan(*date_range, self._max_results)
+        pages = self._iter_range_pages_async(self._search_query(key), plan)
+        try:
+            async for new, pending in pages:
+                pending.deliver(new)
+        finally:
+            await pages.aclose()
+        return plan.articles
+
+    def _iter_range(self, key: str, date_range: tuple[datetime.datetime, datetime.datetime]) -> Iterator[dict]:
+        plan = _DateRangePlan(*date_range, self._max_results, keep=False)
+        with closing(self._iter_range_pages(self._search_query(key), plan)) as pages:
+            for new, pending in pages:
+                for article in new:
+                    # Recorded as it is handed over, so a consumer that stops early loses nothing.
+                    pending.deliver((article,))
+                    yield article
+
+    async def _iter_range_async(self, key: str,
+                                date_range: tuple[datetime.datetime, datetime.datetime]) -> AsyncIterator[dict]:
+        plan = _DateRangePlan(*date_range, self._max_results, keep=False)
+        pages = self._iter_range_pages_async(self._search_query(key), plan)
+        try:
+            async for new, pending in pages:
+                for article in new:
+                    pending.deliver((article,))
+                    yield article
+        finally:
+            await pages.aclose()
+
+    def _iter_range_pages(self, query: str, plan: _DateRangePlan) -> Iterator[tuple[list[dict], _PendingKeys]]:
+        """Fetch the plan's windows on up to ``max_workers`` threads.
+
+        Yields each window's new articles with the dedup keys the caller records as it
+        delivers them.
+        """
+        with ThreadPoolExecutor(max_workers=self._max_workers, thread_name_prefix="gnews-window") as pool:
+            running = {}
+            try:
+                while not plan.done:
+                    while len(running) < self._max_workers:
+                        window = plan.next_window()
+                        if window is None:
+                            break
+                        pending = _PendingKeys(self._dedup_store)
+                        running[pool.submit(self._get_page, query, window, pending)] = window, pending
+                    if not running:
+                        return
+                    finished, _ = wait(running, return_when=FIRST_COMPLETED)
+                    for future in finished:
+                        window, pending = running.pop(future)
+                        articles, fetched = future.result()[:2]
+                        yield plan.complete(window, articles, fetched), pending
+            finally:
+                for future in running:
+                    future.cancel()
+
+    async def _iter_range_pages_async(self, query: str,
+                                      plan: _DateRangePlan) -> AsyncIterator[tuple[list[dict], _PendingKeys]]:
+        running = {}
+        try:
+            while not plan.done:
+                while len(running) < self._max_workers:
+                    window = plan.next_window()
+                    if window is None:
+                        break
+                    pending = _PendingKeys(self._dedup_store)
+                    running[asyncio.ensure_future(self._get_page_async(query, window, pending))] = window, pending
+                if not running:
+                    return
+                finished, _ = await asyncio.wait(running, return_when=asyncio.FIRST_COMPLETED)
+                for task in finished:
+                    window, pending = running.pop(task)
+                    articles, fetched = task.result()[:2]
+                    yield plan.complete(window, articles, fetched), pending
+        finally:
+            for task in running:
+                task.cancel()
+
+    def _start_walk(self, keep: bool = True) -> _WindowWalk:
+        """Rolling walk for a search with no start; an ``end_date`` on the client seeds its first window."""
+        if self._period:
             warnings.warn(
-                "Searches for over 100 articles ignore date ranges; "
-                "any start_date, end_date, or period set on the client will be cleared. "
-                "Keep max_results <= 100 if you need precise temporal filtering.",
+                f"Searches for over 100 articles cannot split the period '{self._period}' into date windows "
+                "and walk back in rolling 7-day windows instead. "
+                "Set start_date if you need precise temporal filtering.",
                 category=UserWarning,
-                stacklevel=2,
+                stacklevel=3,
             )
+        return _WindowWalk(self._max_results, keep=keep, end=self._end_date)
+
+    def _searchapi_params(self, key: str, page: int) -> dict:
+        return dict(
+            query=key,
+            language=self._language,
+            country=self._country,
+            start_date=self.start_date,
+            end_date=self.end_date,
+            max_results=self._max_results,
+            page=page,
+        )
+
+    def _searchapi_news(self, key: str, page: int) -> list[dict]:
+        params = self._searchapi_params(key, page)
+        if self._searchapi_concurrency:
+            return self._drop_seen(self._searchapi.collect(**params, concurrency=self._searchapi_concurrency))
+        return self._drop_seen(self._searchapi.get_news(**params))
+
+    async def _searchapi_news_async(self, key: str, page: int) -> list[dict]:
+        params = self._searchapi_params(key, page)
+        if self._searchapi_concurrency:
+            return self._drop_seen(await self._searchapi.collect_async(
+                **params, concurrency=self._searchapi_concurrency, client=self._async_http()))
+        return self._drop_seen(await asyncio.to_thread(self._searchapi.get_news, **params))
 
-        self._start_date = None
-        self._end_date = None
-
-        while len(articles) < self._max_results:
-            fetched_articles = self._get_news(f'/search?q={key}')
-            if not fetched_articles:
-                break
-
-            for article in fetched_articles:
-                if article['url'] not in seen_urls:
-                    articles.append(article)
-                    seen_urls.add(article['url'])
-                    published_date = article.get("published date")
-                    try:
-                        published_date = datetime.datetime.strptime(published_date, '%a, %d %b %Y %H:%M:%S GMT')
-                    except Exception as e:
-                        logger.warning(f"Failed to parse published date: {e}")
-                        continue
-
-                    if earliest_date is None or published_date < earliest_date:
-                        earliest_date = published_date
-
-                if len(articles) >= self._max_results:
-                    return articles
+    @staticmethod
+    def _search_query(key: str) -> str:
+        key = "%20".join(key.split(" "))
+        return '/search?q={}'.format(key)
 
-            if len(fetched_articles) < 100:
-                break
+    @staticmethod
+    def _topic_query(topic: str) -> str:
+        topic = topic.upper()
+        if topic in TOPICS:
+            return '/headlines/section/topic/' + topic + '?'
+        elif topic in SECTIONS.keys():
+            return '/topics/' + SECTIONS[topic] + '?'
+        raise InvalidConfigError(f"Invalid topic '{topic}'. Must be one of {list(TOPICS) + list(SECTIONS.keys())}.")
 
-            self._end_date = earliest_date
-            self._start_date = earliest_date - datetime.timedelta(days=7)
+    @staticmethod
+    def _location_query(location: str) -> str:
+        if location:
+            return '/headlines/section/geo/' + location + '?'
+        raise InvalidConfigError("Location cannot be empty.")
 
-        return articles
+    @staticmethod
+    def _site_key(site: str) -> str:
+        if site:
+            return "site:{}".format(site)
+        raise InvalidConfigError("Site domain cannot be empty.")
 
     @docstring_parameter(standard_output)
-    def get_top_news(self) -> list[dict]:
+    def get_top_news(self, cache_ttl: float | None = None) -> list[dict]:
         query = "?"
-        return self._get_news(query)
+        return self._cached(query, cache_ttl, lambda: self._get_news(query))
 
     @docstring_parameter(standard_output, ', '.join(TOPICS), ', '.join(SECTIONS.keys()))
-    def get_news_by_topic(self, topic: str) -> list[dict]:
-        topic = topic.upper()
-        if topic in TOPICS:
-            query = '/headlines/section/topic/' + topic + '?'
-            return self._get_news(query)
-        elif topic in SECTIONS.keys():
-            query = '/topics/' + SECTIONS[topic] + '?'
-            return self._get_news(query)
-        raise InvalidConfigError(f"Invalid topic '{topic}'. Must be one of {list(TOPICS) + list(SECTIONS.keys())}.")
+    def get_news_by_topic(self, topic: str, cache_ttl: float | None = None) -> list[dict]:
+        query = self._topic_query(topic)
+        return self._cached(query, cache_ttl, lambda: self._get_news(query))
 
     @docstring_parameter(standard_output)
-    def get_news_by_location(self, location: str) -> list[dict]:
-        if location:
-            query = '/headlines/section/geo/' + location + '?'
-            return self._get_news(query)
-        raise InvalidConfigError("Location cannot be empty.")
+    def get_news_by_location(self, location: str, cache_ttl: float | None = None) -> list[dict]:
+        query = self._location_query(location)
+        return self._cached(query, cache_ttl, lambda: self._get_news(query))
 
     @docstring_parameter(standard_output)
-    def get_news_by_site(self, site: str) -> list[dict]:
-        if site:
-            key = "site:{}".format(site)
-            return self.get_news(key)
-        raise InvalidConfigError("Site domain cannot be empty.")
+    def get_news_by_site(self, site: str, cache_ttl: float | None = None) -> list[dict]:
+        return self.get_news(self._site_key(site), cache_ttl=cache_ttl)
 
-    async def _run_in_executor(self, func, *args):
-        loop = asyncio.get_event_loop()
-        return await loop.run_in_executor(None, functools.partial(func, *args))
+    async def get_news_async(self, key: str, page: int = 1, cache_ttl: float | None = None) -> list[dict]:
+        if key:
+            return await self._cached_async(self._news_request(key, page), cache_ttl,
+                                            lambda: self._fetch_news_async(key, page))
+        raise InvalidConfigError("Search key cannot be empty.")
 
-    async def get_news_async(self, key: str, page: int = 1) -> list[dict]:
-        return await self._run_in_executor(self.get_news, key, page)
+    async def _fetch_news_async(self, key: str, page: int) -> list[dict]:
+        if self._searchapi:
+            return self._records(await self._searchapi_news_async(key, page))
+        if self._max_results > 100:
+            date_range = self._date_range()
+            if date_range is not None:
+                return await self._get_news_in_range_async(key, date_range)
+            return await self._get_news_more_than_100_async(key)
+        return await self._get_news_async(self._search_query(key))
+
+    async def get_top_news_async(self, cache_ttl: float | None = None) -> list[dict]:
+        return await self._cached_async("?", cache_ttl, lambda: self._get_news_async("?"))
+
+    async def get_news_by_topic_async(self, topic: str, cache_ttl: float | None = None) -> list[dict]:
+        query = self._topic_query(topic)
+        return await self._cached_async(query, cache_ttl, lambda: self._get_news_async(query))
+
+    async def get_news_by_location_async(self, location: str, cache_ttl: float | None = None) -> list[dict]:
+        query = self._location_query(location)
+        return await self._cached_async(query, cache_ttl, lambda: self._get_news_async(query))
+
+    async def get_news_by_site_async(self, site: str, cache_ttl: float | None = None) -> list[dict]:
+        return await self.get_news_async(self._site_key(site), cache_ttl=cache_ttl)
+
+    def _news_request(self, key: str, page: int) -> str:
+        key = ' '.join(key.split())
+        if self._searchapi:
+            return f"{key}&page={page}"
+        return self._search_query(key)
+
+    def _response_key(self, request: str) -> str:
+        """Normalised cache key: the query with whitespace and case folded, plus the settings that shape the result."""
+        request = ' '.join(urllib.parse.unquote(request).split()).casefold()
+        backend = 'rss'
+        if self._searchapi:
+            # A collected result spans several pages, so it must not answer a single-page request.
+            backend = 'searchapi-pages' if self._searchapi_concurrency else 'searchapi'
+        return (f"{backend}|{request}|{self._language}|{self._country}|{self._period}|"
+                f"{self._start_date}|{self._end_date}|{self._filter_key()}")
+
+    def _cached(self, request: str, cache_ttl: float | None, fetch) -> list[dict]:
+        if self._response_cache is None:
+            return fetch()
+        if cache_ttl is not None and cache_ttl < 0:
+            raise InvalidConfigError("cache_ttl must be >= 0.")
+        key = self._response_key(request)
+        articles = self._response_cache.get(key, max_age=cache_ttl)
+        if articles is not None:
+            return self._restore(articles)
+        articles = fetch()
+        self._response_cache.set(key, articles, ttl=cache_ttl)
+        return articles
 
-    async def get_top_news_async(self) -> list[dict]:
-        return await self._run_in_executor(self.get_top_news)
+    async def _cached_async(self, request: str, cache_ttl: float | None, fetch) -> list[dict]:
+        """Async counterpart of :meth:`_cached`; ``fetch`` returns an awaitable."""
+        if self._response_cache is None:
+            return await fetch()
+        if cache_ttl is not None and cache_ttl < 0:
+            raise InvalidConfigError("cache_ttl must be >= 0.")
+        key = self._response_key(request)
+        articles = self._response_cache.get(key, max_age=cache_ttl)
+        if articles is not None:
+            return self._restore(articles)
+        articles = await fetch()
+        self._response_cache.set(key, articles, ttl=cache_ttl)
+        return articles
 
-    async def get_news_by_topic_async(self, topic: str) -> list[dict]:
-        return await self._run_in_executor(self.get_news_by_topic, topic)
+    def iter_news(self, key: str, page: int = 1) -> Iterator[dict]:
+        """
+        Stream the results of :meth:`get_news`, yielding each article as soon as it is processed.
 
-    async def get_news_by_location_async(self, location: str) -> list[dict]:
-        return await self._run_in_executor(self.get_news_by_location, location)
+        Nothing is fetched until iteration starts. Past 100 results the rolling date
+        walk runs one window at a time without keeping the articles already yielded,
+        so memory stays flat however large ``max_results`` is. Stopping early (``break``)
+        stops further fetching and resolution.
+        """
+        if not key:
+            raise InvalidConfigError("Search key cannot be empty.")
+        if self._searchapi:
+            return self._iter_searchapi(key, page)
+        if self._max_results > 100:
+            date_range = self._date_range()
+            if date_range is not None:
+                return self._iter_range(key, date_range)
+            return self._iter_walk(key)
+        return self._iter_query(self._search_query(key))
+
+    def iter_top_news(self) -> Iterator[dict]:
+        """Stream the results of :meth:`get_top_news`."""
+        return self._iter_query("?")
+
+    def iter_news_by_topic(self, topic: str) -> Iterator[dict]:
+        """Stream the results of :meth:`get_news_by_topic`."""
+        return self._iter_query(self._topic_query(topic))
+
+    def iter_news_by_location(self, location: str) -> Iterator[dict]:
+        """Stream the results of :meth:`get_news_by_location`."""
+        return self._iter_query(self._location_query(location))
+
+    def iter_news_by_site(self, site: str) -> Iterator[dict]:
+        """Stream the results of :meth:`get_news_by_site`."""
+        return self.iter_news(self._site_key(site))
+
+    def iter_pages(self, key: str, cursor: NewsCursor | None = None,
+                   checkpoint: str | os.PathLike | None = None) -> Iterator[tuple[list[dict], NewsCursor]]:
+        """
+        Search past the ~100-result ceiling one date window at a time, with a resumable cursor.
+
+        Yields ``(articles, cursor)`` after every window: the window's new articles and a
+        :class:`NewsCursor` for the position after it. Pass a cursor back (in this or a
+        later process) to continue where the walk stopped. ``max_results`` counts articles
+        across resumed calls. Searches with a ``start_date`` or ``period`` use the
+        date-range engine, the others the rolling backward walk.
+
+        :param key: Search key
+        :param cursor: Cursor to resume from. It must belong to the same ``key``.
+        :param checkpoint: File the latest cursor is saved to. A window's cursor is saved
+            when the next window is requested, so a crash while handling a window repeats
+            it rather than losing it. If the file exists and no ``cursor`` is given, the
+            walk resumes from it.
+        """
+        cursor = self._resume_cursor(key, cursor, checkpoint)
+        return self._iter_pages(key, cursor, checkpoint)
+
+    def iter_pages_async(self, key: str, cursor: NewsCursor | None = None,
+                         checkpoint: str | os.PathLike | None = None) -> AsyncIterator[tuple[list[dict], NewsCursor]]:
+        """Async-generator version of :meth:`iter_pages`."""
+        cursor = self._resume_cursor(key, cursor, checkpoint)
+        return self._iter_pages_async(key, cursor, checkpoint)
+
+    def _resume_cursor(self, key: str, cursor: NewsCursor | None,
+                       checkpoint: str | os.PathLike | None) -> NewsCursor | None:
+        if not key:
+            raise InvalidConfigError("Search key cannot be empty.")
+        if self._searchapi:
+            raise InvalidConfigError("iter_pages walks the RSS feed; with SearchApi use get_news(key, page=...).")
+        if cursor is None and checkpoint is not None and os.path.exists(checkpoint):
+            cursor = NewsCursor.load(checkpoint)
+        if cursor is not None and cursor.query != key:
+            raise InvalidConfigError(f"Cursor belongs to the search '{cursor.query}', not '{key}'.")
+        return cursor
+
+    def _range_plan(self, cursor: NewsCursor | None) -> _DateRangePlan | None:
+        if cursor is not None:
+            return _DateRangePlan.resume(cursor, self._max_results, keep=False) if cursor.mode == 'range' else None
+        date_range = self._date_range()
+        return _DateRangePlan(*date_range, self._max_results, keep=False) if date_range is not None else None
+
+    def _resume_walk(self, cursor: NewsCursor | None) -> _WindowWalk:
+        if cursor is not None:
+            return _WindowWalk.resume(cursor, self._max_results, keep=False)
+        return self._start_walk(keep=False)
+
+    def _iter_pages(self, key: str, cursor: NewsCursor | None,
+                    checkpoint: str | os.PathLike | None) -> Iterator[tuple[list[dict], NewsCursor]]:
+        query = self._search_query(key)
+        plan = self._range_plan(cursor)
+        if plan is not None:
+            with closing(self._iter_range_pages(query, plan)) as pages:
+                for new, pending in pages:
+                    position = plan.cursor(key)
+                    pending.deliver(new)
+                    yield new, position
+                    if checkpoint is not None:
+                        position.save(checkpoint)
+            return
+        walk = self._resume_walk(cursor)
+        while not walk.done:
+            pending = _PendingKeys(self._dedup_store)
+            new = walk.take(*self._get_page(query, window=walk.window, pending=pending))
+            position = walk.cursor(key)
+            pending.deliver(new)
+            yield new, position
+            if checkpoint is not None:
+                position.save(checkpoint)
+
+    async def _iter_pages_async(self, key: str, cursor: NewsCursor | None,
+                                checkpoint: str | os.PathLike | None) -> AsyncIterator[tuple[list[dict], NewsCursor]]:
+        query = self._search_query(key)
+        plan = self._range_plan(cursor)
+        if plan is not None:
+            pages = self._iter_range_pages_async(query, plan)
+            try:
+                async for new, pending in pages:
+                    position = plan.cursor(key)
+                    pending.deliver(new)
+                    yield new, position
+                    if checkpoint is not None:
+                        position.save(checkpoint)
+            finally:
+                await pages.aclose()
+            return
+        walk = self._resume_walk(cursor)
+        while not walk.done:
+            pending = _PendingKeys(self._dedup_store)
+            new = walk.take(*await self._get_page_async(query, window=walk.window, pending=pending))
+            position = walk.cursor(key)
+            pending.deliver(new)
+            yield new, position
+            if checkpoint is not None:
+                position.save(checkpoint)
+
+    def _iter_searchapi(self, key: str, page: int) -> Iterator[dict]:
+        yield from self._records(self._searchapi_news(key, page))
+
+    def _iter_query(self, query: str, window: tuple | None = None,
+                    on_page: Callable[[int, datetime.datetime | None], None] | None = None,
+                    pending: _PendingKeys | None = None) -> Iterator[dict]:
+        """Stream one feed page.
+
+        ``on_page`` gets the entry count before filtering and their earliest
+        publication date, ahead of any article. Without ``pending`` each article's
+        dedup key is recorded as it is yielded; otherwise the caller delivers them.
+        """
+        owned = pending is None
+        if owned:
+            pending = _PendingKeys(self._dedup_store)
+        url = self._feed_url(query, window)
+        feed_data, cached = self._fetch_page(url)
+        if cached is not None and feed_data.status == 304:
+            if on_page is not None:
+                on_page(cached.entries, cached.earliest)
+            for article in self._unchanged(cached, pending):
+                if owned:
+                    pending.deliver((article,))
+                yield article
+            return
+        earliest = _earliest_published(feed_data.entries)
+        if on_page is not None:
+            on_page(len(feed_data.entries), earliest)
+        # A feed page holds at most 100 entries, so keeping them for the store is cheap.
+        articles = [] if self._validator_store is not None else None
+        keys = [] if articles is not None and self._dedup_store is not None else None
+        for article in self._iter_entries(feed_data.entries[:self._max_results], pending):
+            if articles is not None:
+                articles.append(article)
+            if keys is not None:
+                keys.append(pending.key(article))
+            # Recorded as it is handed over, so a consumer that stops early loses nothing.
+            if owned:
+                pending.deliver((article,))
+            yield article
+        self._remember(url, feed_data, articles, earliest, pending, keys)
+
+    def _iter_walk(self, key: str) -> Iterator[dict]:
+        walk = self._start_walk(keep=False)
+        while not walk.done:
+            pages, pending = [], _PendingKeys(self._dedup_store)
+            query = self._iter_query(f'/search?q={key}', walk.window,
+                                     lambda entries, earliest: pages.append((entries, earliest)), pending)
+            with closing(query) as articles:
+                for article in articles:
+                    if walk.offer(article):
+                        pending.deliver((article,))
+                        yield article
+                        if walk.done:
+                            return
+            entries, earliest = pages[0] if pages else (0, None)
+            walk.end_page(entries, earliest)
+
+    def iter_news_async(self, key: str, page: int = 1) -> AsyncIterator[dict]:
+        """Async-generator version of :meth:`iter_news`, running on the native async engine."""
+        if not key:
+            raise InvalidConfigError("Search key cannot be empty.")
+        if self._searchapi:
+            return self._iter_searchapi_async(key, page)
+        if self._max_results > 100:
+            date_range = self._date_range()
+            if date_range is not None:
+                return self._iter_range_async(key, date_range)
+            return self._iter_walk_async(key)
+        return self._iter_query_async(self._search_query(key))
+
+    def iter_top_news_async(self) -> AsyncIterator[dict]:
+        return self._iter_query_async("?")
+
+    def iter_news_by_topic_async(self, topic: str) -> AsyncIterator[dict]:
+        return self._iter_query_async(self._topic_query(topic))
+
+    def iter_news_by_location_async(self, location: str) -> AsyncIterator[dict]:
+        return self._iter_query_async(self._location_query(location))
+
+    def iter_news_by_site_async(self, site: str) -> AsyncIterator[dict]:
+        return self.iter_news_async(self._site_key(site))
+
+    async def _iter_searchapi_async(self, key: str, page: int) -> AsyncIterator[dict]:
+        for article in await self.get_news_async(key, page):
+            yield article
+
+    async def _iter_query_async(self, query: str, window: tuple | None = None,
+                                on_page: Callable[[int, datetime.datetime | None], None] | None = None,
+                                pending: _PendingKeys | None = None) -> AsyncIterator[dict]:
+        owned = pending is None
+        if owned:
+            pending = _PendingKeys(self._dedup_store)
+        url = self._feed_url(query, window)
+        feed_data, cached = await self._fetch_page_async(url)
+        if cached is not None and feed_data.status == 304:
+            if on_page is not None:
+                on_page(cached.entries, cached.earliest)
+            for article in self._unchanged(cached, pending):
+                if owned:
+                    pending.deliver((article,))
+                yield article
+            return
+        earliest = _earliest_published(feed_data.entries)
+        if on_page is not None:
+            on_page(len(feed_data.entries), earliest)
+        processed = [] if self._validator_store is not None else None
+        keys = [] if processed is not None and self._dedup_store is not None else None
+        articles = self._iter_entries_async(feed_data.entries[:self._max_results], pending)
+        try:
+            async for article in articles:
+                if processed is not None:
+                    processed.append(article)
+                if keys is not None:
+                    keys.append(pending.key(article))
+                if owned:
+                    pending.deliver((article,))
+                yield article
+        finally:
+            # Cancel in-flight entries now rather than whenever the generator is collected.
+            await articles.aclose()
+        self._remember(url, feed_data, processed, earliest, pending, keys)
+
+    async def _iter_walk_async(self, key: str) -> AsyncIterator[dict]:
+        walk = self._start_walk(keep=False)
+        while not walk.done:
+            pages, pending = [], _PendingKeys(self._dedup_store)
+            articles = self._iter_query_async(f'/search?q={key}', walk.window,
+                                              lambda entries, earliest: pages.append((entries, earliest)), pending)
+            try:
+                async for article in articles:
+                    if walk.offer(article):
+                        pending.deliver((article,))
+                        yield article
+                        if walk.done:
+                            return
+            finally:
+                await articles.aclose()
+            entries, earliest = pages[0] if pages else (0, None)
+            walk.end_page(entries, earliest)
+
+    def watch(self, feeds: Iterable[str] | Mapping[str, float], callback: Callable[[str, list[dict]], None],
+              interval: float = 300.0, max_interval: float | None = None, backoff: float = 2.0,
+              skip_existing: bool = False, stop: threading.Event | None = None) -> None:
+        """
+        Poll feeds until ``stop`` is set, handing only the articles not seen before to ``callback``.
+
+        Each feed remembers the IDs of its entries and its ``ETag``/``Last-Modified``
+        validators, so an unchanged feed costs a conditional request and a changed one
+        processes (and resolves) only its new entries. A feed that had nothing new is
+        polled less often, up to ``max_interval``; new entries reset it to its interval.
+        A failed poll is logged and counts as unchanged. Feeds are always Google News RSS.
+
+        :param feeds: Feeds to follow, or a dict mapping each feed to its own interval.
+            A feed is ``'top'``, ``'topic:TECHNOLOGY'``, ``'location:Paris'``,
+            ``'site:bbc.com'`` or a search query.
+        :param callback: Called as ``callback(feed, articles)`` after each poll that found
+            new articles
+        :param interval: Seconds between polls of a feed, defaults to 300
+        :param max_interval: Longest interval a quiet feed backs off to. Defaults to
+            eight times its interval.
+        :param backoff: Factor the interval grows by after each poll with nothing new
+        :param skip_existing: Only report entries that appear after the first poll
+        :param stop: Event that ends the loop. Without one, ``watch`` runs until interrupted.
+        """
+        watches = self._feed_watches(feeds, interval, max_interval, backoff, skip_existing)
+        while stop is None or not stop.is_set():
+            watch = min(watches, key=lambda w: w.next_at)
+            delay = watch.next_at - time.monotonic()
+            if delay > 0:
+                if stop is None:
+                    self._sleep(delay)
+                elif stop.wait(delay):
+                    return
+            articles = self._poll_feed(watch)
+            if articles:
+                callback(watch.feed, articles)
+
+    def watch_async(self, feeds: Iterable[str] | Mapping[str, float], interval: float = 300.0,
+                    max_interval: float | None = None, backoff: float = 2.0,
+                    skip_existing: bool = False) -> AsyncIterator[tuple[str, dict]]:
+        """
+        Async-iterator version of :meth:`watch`, yielding ``(feed, article)`` for every new article.
 
-    async def get_news_by_site_async(self, site: str) -> list[dict]:
-        return await self._run_in_executor(self.get_news_by_site, site)
+        Feeds that are due at the same time are polled concurrently. Stop by leaving the
+        ``async for`` loop.
+        """
+        return self._watch_async(self._feed_watches(feeds, interval, max_interval, backoff, skip_existing))
+
+    async def _watch_async(self, watches: list[_FeedWatch]) -> AsyncIterator[tuple[str, dict]]:
+        while True:
+            now = time.monotonic()
+            due = [watch for watch in watches if watch.next_at <= now]
+            if not due:
+                await self._sleep_async(min(watch.next_at for watch in watches) - now)
+                continue
+            polled = await asyncio.gather(*(self._poll_feed_async(watch) for watch in due))
+            for watch, articles in zip(due, polled):
+                for article in articles:
+                    yield watch.feed, article
+
+    def _feed_watches(self, feeds, interval: float, max_interval: float | None, backoff: float,
+                      skip_existing: bool) -> list[_FeedWatch]:
+        intervals = dict(feeds) if isinstance(feeds, Mapping) else dict.fromkeys(feeds, interval)
+        if not intervals:
+            raise InvalidConfigError("watch() needs at least one feed.")
+        if backoff < 1:
+            raise InvalidConfigError("backoff must be >= 1.")
+        now = time.monotonic()
+        watches = []
+        for feed, every in intervals.items():
+            every = interval if every is None else every
+            if every <= 0:
+                raise InvalidConfigError(f"Interval for feed '{feed}' must be > 0.")
+            longest = 8 * every if max_interval is None else max(max_interval, every)
+            watches.append(_FeedWatch(feed, self._watch_query(feed), every, longest, backoff, skip_existing, now))
+        return watches
+
+    def _watch_query(self, feed: str) -> str:
+        kind, _, value = feed.partition(':')
+        if feed == 'top':
+            return '?'
+        if kind == 'topic':
+            return self._topic_query(value)
+        if kind == 'location':
+            return self._location_query(value)
+        if feed:
+            return self._search_query(feed)
+        raise InvalidConfigError("Feed cannot be empty.")
+
+    def _poll_feed(self, watch: _FeedWatch) -> list[dict]:
+        try:
+            feed_data = self._fetch_conditional(self._feed_url(watch.query), watch.conditional())
+        except GNewsException as err:
+            logger.warning("Polling feed %r failed: %s", watch.feed, err)
+            watch.reschedule(False, time.monotonic())
+            return []
+        new = watch.new_entries(feed_data, self._max_results)
+        pending = _PendingKeys(self._dedup_store)
+        articles = self._process_entries(new, pending) if new else []
+        pending.deliver(articles)
+        watch.reschedule(bool(new), time.monotonic())
+        return articles
+
+    async def _poll_feed_async(self, watch: _FeedWatch) -> list[dict]:
+        try:
+            feed_data = await self._fetch_conditional_async(self._feed_url(watch.query), watch.conditional())
+        except GNewsException as err:
+            logger.warning("Polling feed %r failed: %s", watch.feed, err)
+            watch.reschedule(False, time.monotonic())
+            return []
+        new = watch.new_entries(feed_data, self._max_results)
+        pending = _PendingKeys(self._dedup_store)
+        articles = await self._process_entries_async(new, pending) if new else []
+        pending.deliver(articles)
+        watch.reschedule(bool(new), time.monotonic())
+        return articles
+
+    def get_news_many(self, keys: Iterable[str], kind: str = "query",
+                      concurrency: int = 10) -> dict[str, list[dict] | Exception]:
+        """
+        Run many searches of the same kind with bounded concurrency.
+
+        All requests share this client's retry/backoff settings, proxy and caches.
+
+        :param keys: Queries, topics, locations or sites, depending on ``kind``
+        :param kind: One of 'query', 'topic', 'location' or 'site', defaults to 'query'
+        :param concurrency: Maximum number of searches in flight at once
+        :return: Results keyed by input, in input order. An input that fails maps to the
+            exception it raised instead of aborting the whole batch.
+        """
+        fetch = getattr(self, self._batch_method(kind, concurrency))
+        keys = list(dict.fromkeys(keys))
+        results = {}
+        with ThreadPoolExecutor(max_workers=max(1, min(concurrency, len(keys)))) as pool:
+            futures = {key: pool.submit(fetch, key) for key in keys}
+            for key, future in futures.items():
+                try:
+                    results[key] = future.result()
+                except Exception as err:
+                    logger.debug("Batch item %r failed: %s", key, err)
+                    results[key] = err
+        return results
+
+    async def get_news_many_async(self, keys: Iterable[str], kind: str = "query",
+                                  concurrency: int = 10) -> dict[str, list[dict] | Exception]:
+        """Async version of :meth:`get_news_many`, running on the native async engine."""
+        fetch = getattr(self, self._batch_method(kind, concurrency) + "_async")
+        semaphore = asyncio.Semaphore(concurrency)
+
+        async def run_one(key):
+            async with semaphore:
+                try:
+                    return await fetch(key)
+                except Exception as err:
+                    logger.debug("Batch item %r failed: %s", key, err)
+                    return err
+
+        keys = list(dict.fromkeys(keys))
+        results = await asyncio.gather(*(run_one(key) for key in keys))
+        return dict(zip(keys, results))
+
+    def iter_news_many(self, keys: Iterable[str], kind: str = "query",
+                       concurrency: int = 10) -> Iterator[tuple[str, dict | Exception]]:
+        """
+        Stream many searches of the same kind, yielding ``(key, article)`` as soon as each article is ready.
+
+        Up to ``concurrency`` searches run at once on worker threads, each through the
+        matching ``iter_*`` method. ``keys`` is read lazily, so it can be a file or a
+        generator, and duplicates are searched once. Articles of different keys are
+        interleaved in the order they finish. Stopping early stops the workers.
+
+        :param keys: Queries, topics, locations or sites, depending on ``kind``
+        :param kind: One of 'query', 'topic', 'location' or 'site', defaults to 'query'
+        :param concurrency: Maximum number of searches in flight at once
+        :return: ``(key, article)`` pairs. A key that fails yields ``(key, exception)``
+            once, after any articles it produced, and the others keep running.
+        :raises Exception: Whatever reading ``keys`` raised, once the searches already
+            started have finished
+        """
+        stream = getattr(self, "iter_" + self._batch_method(kind, concurrency)[len("get_"):])
+        return self._iter_many(stream, keys, concurrency)
+
+    def _iter_many(self, stream, keys: Iterable[str], concurrency: int) -> Iterator[tuple[str, dict | Exception]]:
+        pending = _unique(keys)
+        lock = threading.Lock()
+        stop = threading.Event()
+        # Bounded, so workers wait for a slow consumer instead of buffering whole result sets.
+        results = queue.Queue(maxsize=concurrency * 16)
+        finished = object()
+
+        def put(item) -> bool:
+            while not stop.is_set():
+                try:
+                    results.put(item, timeout=0.1)
+                    return True
+                except queue.Full:
+                    continue
+            return False
+
+        def work() -> None:
+            error = None
+            try:
+                while not stop.is_set():
+                    try:
+                        with lock:
+                            key = next(pending, None)
+                    except Exception as err:
+                        # The keys themselves failed, e.g. a file that does not decode; no key to blame.
+                        error = err
+                        break
+                    if key is None:
+                        break
+                    try:
+                        for article in stream(key):
+                            if not put((key, article)):
+                                return
+                    except Exception as err:
+                        logger.debug("Batch item %r failed: %s", key, err)
+                        put((key, err))
+            finally:
+                put((finished, error))
+
+        workers = [threading.Thread(target=work, name=f"gnews-batch-{i}", daemon=True) for i in range(concurrency)]
+        for worker in workers:
+            worker.start()
+        try:
+            running, error = len(workers), None
+            while running:
+                key, value = results.get()
+                if key is finished:
+                    running -= 1
+                    error = error or value
+                else:
+                    yield key, value
+            if error is not None:
+                raise error
+        finally:
+            stop.set()
+
+    def iter_news_many_async(self, keys: Iterable[str], kind: str = "query",
+                             concurrency: int = 10) -> AsyncIterator[tuple[str, dict | Exception]]:
+        """Async-generator version of :meth:`iter_news_many`, running searches as tasks on the async engine."""
+        stream = getattr(self, "iter_" + self._batch_method(kind, concurrency)[len("get_"):] + "_async")
+        return self._iter_many_async(stream, keys, concurrency)
+
+    async def _iter_many_async(self, stream, keys: Iterable[str],
+                               concurrency: int) -> AsyncIterator[tuple[str, dict | Exception]]:
+        pending = _unique(keys)
+        results = asyncio.Queue(maxsize=concurrency * 16)
+        finished = object()
+
+        async def work() -> None:
+            error = None
+            try:
+                while True:
+                    try:
+                        key = next(pending, None)
+                    except Exception as err:
+                        error = err
+                        break
+                    if key is None:
+                        break
+                    try:
+                        async for article in stream(key):
+                            await results.put((key, article))
+                    except Exception as err:
+                        logger.debug("Batch item %r failed: %s", key, err)
+                        await results.put((key, err))
+            finally:
+                # A cancelled worker has no consumer left to tell.
+                if not closed:
+                    await results.put((finished, error))
+
+        closed = False
+        workers = [asyncio.ensure_future(work()) for _ in range(concurrency)]
+        try:
+            running, error = len(workers), None
+            while running:
+                key, value = await results.get()
+                if key is finished:
+                    running -= 1
+                    error = error or value
+                else:
+                    yield key, value
+            if error is not None:
+                raise error
+        finally:
+            closed = True
+            for worker in workers:
+                worker.cancel()
+
+    @staticmethod
+    def _batch_method(kind: str, concurrency: int) -> str:
+        if kind not in _BATCH_METHODS:
+            raise InvalidConfigError(f"Invalid batch kind '{kind}'. Must be one of {list(_BATCH_METHODS)}.")
+        if concurrency <= 0:
+            raise InvalidConfigError("concurrency must be a positive integer.")
+        return _BATCH_METHODS[kind]
+
+    def _async_http(self):
+        """Return an ``httpx.AsyncClient`` bound to the running loop, or ``None`` without httpx.
+
+        The client is created lazily and reused for every feed fetch and redirect
+        fallback issued from the same event loop, so connections stay pooled. When a
+        new loop takes over, such as a second ``asyncio.run``, the old client is closed.
+        """
+        loop = asyncio.get_running_loop()
+        if self._http_async is None or self._http_async_loop is not loop:
+            stale, stale_loop = self._http_async, self._http_async_loop
+            self._http_async = self._transport.new_async_client()
+            self._http_async_loop = loop
+            if stale is not None:
+                self._close_stale_client(stale, stale_loop)
+        return self._http_async
+
+    def _close_stale_client(self, client, loop: asyncio.AbstractEventLoop) -> None:
+        """Close a client left by another event loop, on that loop if it still runs, else on this one."""
+        if loop.is_running():
+            asyncio.run_coroutine_threadsafe(_aclose_quietly(client), loop)
+            return
+        task = asyncio.get_running_loop().create_task(_aclose_quietly(client))
+        # Held until done so the task is not collected half-way.
+        self._closing_clients.add(task)
+        task.add_done_callback(self._closing_clients.discard)
+
+    def close(self) -> None:
+        """Shut down the entry-processing and extraction workers and, if owned, the browser pool and transport."""
+        with self._executor_lock:
+            executor, self._executor = self._executor, None
+            process_pool, self._process_pool = self._process_pool, None
+        if executor is not None:
+            executor.shutdown(wait=True)
+        if process_pool is not None:
+            process_pool.shutdown(wait=True)
+        if self._owns_browser_pool:
+            self._browser_pool.close()
+        if self._owns_transport:
+            self._transport.close()
+
+    async def aclose(self) -> None:
+        """Close the pooled async HTTP client, then everything :meth:`close` releases."""
+        if self._http_async is not None:
+            client = self._http_async
+            self._http_async = None
+            self._http_async_loop = None
+            await client.aclose()
+        await asyncio.to_thread(self.close)
+
+    def __enter__(self) -> GNews:
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+    async def __aenter__(self) -> GNews:
+        return self
+
+    async def __aexit__(self, *exc_info) -> None:
+        await self.aclose()
 
     def save_to_json(self, articles: list[dict], path: str) -> str:
         with open(path, "w", encoding="utf-8") as f:
-            json.dump(articles, f, ensure_ascii=False, indent=2)
+            json.dump(articles, f, ensure_ascii=False, indent=2, default=_json_default)
         return path
 
     def save_to_csv(self, articles: list[dict], path: str) -> str:
+        import csv
+
         if not articles:
             open(path, "w").close()
             return path
         with open(path, "w", newline="", encoding="utf-8") as f:
-            writer = csv.DictWriter(f, fieldnames=articles[0].keys())
+            # Union of keys in first-seen order, so rows with extra fields (SearchApi) still fit.
+            fieldnames = list(dict.fromkeys(key for article in articles for key in article))
+            writer = csv.DictWriter(f, fieldnames=fieldnames)
             writer.writeheader()
             writer.writerows(articles)
         return path
@@ -406,36 +2090,167 @@ class GNews:
         """Indirection for tests to patch sleep without touching time.sleep globally."""
         time.sleep(seconds)
 
-    def _fetch_feed(self, url: str):
-        if self._proxy:
-            proxy_handler = urllib.request.ProxyHandler(self._proxy)
-            return feedparser.parse(url, agent=USER_AGENT, handlers=[proxy_handler])
-        return feedparser.parse(url, agent=USER_AGENT)
+    async def _sleep_async(self, seconds: float) -> None:
+        """Async counterpart of :meth:`_sleep`; yields to the event loop while waiting."""
+        await asyncio.sleep(seconds)
+
+    def _throttle(self) -> None:
+        """Wait for a token from the Google News rate limiter, if one is configured."""
+        wait = self._rate_limiter.reserve() if self._rate_limiter is not None else 0.0
+        if wait > 0:
+            self._sleep(wait)
+
+    async def _throttle_async(self) -> None:
+        wait = self._rate_limiter.reserve() if self._rate_limiter is not None else 0.0
+        if wait > 0:
+            await self._sleep_async(wait)
+
+    def _fetch_feed(self, url: str, etag: str | None = None, modified: str | None = None):
+        return self._transport.fetch_feed(url, etag, modified)
+
+    async def _fetch_feed_async(self, url: str, etag: str | None = None, modified: str | None = None):
+        client = self._async_http()
+        if client is None:
+            # httpx is an optional extra; without it fall back to the blocking fetch in a worker thread.
+            return await asyncio.to_thread(self._fetch_feed, url, etag, modified)
+        response = await client.get(url, headers=conditional_headers(etag, modified))
+        return parse_feed(response.status_code, response.content, response.headers)
+
+    def _feed_url(self, query: str, window: tuple | None = None) -> str:
+        return BASE_URL + query + self._ceid(searching=query.startswith('/search'), window=window)
+
+    def _retry_delay(self, attempt: int, attempts: int) -> float:
+        """Return the backoff before the next attempt after a 429, or raise once attempts run out."""
+        if attempt >= attempts - 1:
+            raise RateLimitError(
+                f"Rate limit exceeded while fetching news (attempt {attempt + 1}/{attempts})."
+            )
+        delay = self._backoff_delay(attempt)
+        logger.warning(
+            "Google News returned 429; backing off %.2fs before retry %d/%d",
+            delay, attempt + 2, attempts,
+        )
+        return delay
+
+    def _fetch_page(self, url: str) -> tuple:
+        """Fetch a feed with 429 retries; returns ``(feed_data, cached)``.
+
+        ``cached`` is the stored :class:`CachedFeed` whose validators made the request
+        conditional, or None.
+        """
+        cached = self._validator_store.get(self._validator_key(url)) if self._validator_store is not None else None
+        conditional = cached.request_kwargs() if cached is not None else {}
+        return self._fetch_conditional(url, conditional), cached
 
-    def _get_news(self, query: str) -> list[dict]:
-        url = BASE_URL + query + self._ceid()
+    def _fetch_conditional(self, url: str, conditional: dict):
+        """Fetch a feed with the given ``etag``/``modified`` validators, retrying on 429."""
         attempts = self._max_retries + 1
-        last_error: RateLimitError | None = None
         for attempt in range(attempts):
             try:
-                feed_data = self._fetch_feed(url)
+                self._throttle()
+                feed_data = self._fetch_feed(url, **conditional)
                 if feed_data.status == 429:
-                    last_error = RateLimitError(
-                        f"Rate limit exceeded while fetching news (attempt {attempt + 1}/{attempts})."
-                    )
-                    if attempt < attempts - 1:
-                        delay = self._backoff_delay(attempt)
-                        logger.warning(
-                            "Google News returned 429; backing off %.2fs before retry %d/%d",
-                            delay, attempt + 2, attempts,
-                        )
-                        self._sleep(delay)
-                        continue
-                    raise last_error
-                return [item for item in map(self._process, feed_data.entries[:self._max_results]) if item]
+                    self._sleep(self._retry_delay(attempt, attempts))
+                    continue
+                return feed_data
             except RateLimitError:
                 raise
             except Exception as err:
                 raise NetworkError(f"Failed to fetch or parse news feed: {err}") from err
         # unreachable, but appease static checkers
-        raise last_error if last_error else NetworkError("Failed to fetch news feed.")
+        raise NetworkError("Failed to fetch news feed.")
+
+    def _get_news(self, query: str, window: tuple | None = None) -> list[dict]:
+        pending = _PendingKeys(self._dedup_store)
+        articles = self._get_page(query, window, pending)[0]
+        pending.deliver(articles)
+        return articles
+
+    def _get_page(self, query: str, window: tuple | None = None,
+                  pending: _PendingKeys | None = None) -> tuple[list[dict], int, datetime.datetime | None]:
+        """Fetch and process one feed page; returns ``(articles, entries, earliest)``.
+
+        ``entries`` is the number of feed items before filtering, which tells whether
+        the page hit the ~100-result ceiling, and ``earliest`` their earliest
+        publication date. On a 304 the stored articles and figures stand in. Dedup
+        keys go to ``pending``; the caller delivers the articles it returns.
+        """
+        url = self._feed_url(query, window)
+        feed_data, cached = self._fetch_page(url)
+        if cached is not None and feed_data.status == 304:
+            return self._unchanged(cached, pending), cached.entries, cached.earliest
+        articles = self._process_entries(feed_data.entries[:self._max_results], pending)
+        earliest = _earliest_published(feed_data.entries)
+        self._remember(url, feed_data, articles, earliest, pending)
+        return articles, len(feed_data.entries), earliest
+
+    def _validator_key(self, url: str) -> str:
+        return f"{url}#{self._filter_key()}"
+
+    def _filter_key(self) -> str:
+        # Stored articles depend on the filters and limit as well as the request.
+        return f"{self._max_results}:{self._exclude_index.fingerprint}:{self._include_index.fingerprint}"
+
+    def _remember(self, url: str, feed_data, articles: list[dict], earliest: datetime.datetime | None,
+                  pending: _PendingKeys | None, keys: list[int | None] | None = None) -> None:
+        """Store a processed page for 304s; ``keys`` are the articles' dedup keys if already delivered."""
+        if self._validator_store is None:
+            return
+        etag, modified = getattr(feed_data, 'etag', None), getattr(feed_data, 'modified', None)
+        if etag or modified:
+            if self._dedup_store is not None and keys is None:
+                keys = [pending.key(article) if pending is not None else None for article in articles]
+            # Stored as copies so a caller changing its articles cannot alter a later 304.
+            stored = [_detached(article) for article in articles]
+            self._validator_store.set(self._validator_key(url),
+                                      CachedFeed(etag, modified, stored, len(feed_data.entries), earliest, keys))
+
+    def _restore(self, articles: list[dict]) -> list[dict]:
+        """Articles of an unchanged feed, converted back to this client's article type."""
+        if self._compact_articles:
+            return [a if isinstance(a, Article) else Article(a) for a in articles]
+        if self._lazy_urls:
+            return [a if isinstance(a, LazyArticle) or not google_article_id(a['url'])
+                    else LazyArticle(a, self._resolve_link) for a in articles]
+        return list(articles)
+
+    async def _fetch_page_async(self, url: str) -> tuple:
+        """Async counterpart of :meth:`_fetch_page`."""
+        cached = self._validator_store.get(self._validator_key(url)) if self._validator_store is not None else None
+        conditional = cached.request_kwargs() if cached is not None else {}
+        return await self._fetch_conditional_async(url, conditional), cached
+
+    async def _fetch_conditional_async(self, url: str, conditional: dict):
+        attempts = self._max_retries + 1
+        for attempt in range(attempts):
+            try:
+                await self._throttle_async()
+                feed_data = await self._fetch_feed_async(url, **conditional)
+                if feed_data.status == 429:
+                    await self._sleep_async(self._retry_delay(attempt, attempts))
+                    continue
+                return feed_data
+            except RateLimitError:
+                raise
+            except Exception as err:
+                raise NetworkError(f"Failed to fetch or parse news feed: {err}") from err
+        # unreachable, but appease static checkers
+        raise NetworkError("Failed to fetch news feed.")
+
+    async def _get_news_async(self, query: str, window: tuple | None = None) -> list[dict]:
+        pending = _PendingKeys(self._dedup_store)
+        articles = (await self._get_page_async(query, window, pending))[0]
+        pending.deliver(articles)
+        return articles
+
+    async def _get_page_async(self, query: str, window: tuple | None = None,
+                              pending: _PendingKeys | None = None) -> tuple[list[dict], int, datetime.datetime | None]:
+        """Async counterpart of :meth:`_get_page`."""
+        url = self._feed_url(query, window)
+        feed_data, cached = await self._fetch_page_async(url)
+        if cached is not None and feed_data.status == 304:
+            return self._unchanged(cached, pending), cached.entries, cached.earliest
+        articles = await self._process_entries_async(feed_data.entries[:self._max_results], pending)
+        earliest = _earliest_published(feed_data.entries)
+        self._remember(url, feed_data, articles, earliest, pending)
+        return articles, len(feed_data.entries), earliest
@@ -0,0 +1,210 @@
+from __future__ import annotations
+
+import asyncio
+import atexit
+import logging
+import os
+import threading
+import weakref
+
+from gnews.exceptions import InvalidConfigError
+from gnews.utils.utils import _PLAYWRIGHT_LAUNCH_ARGS, _PLAYWRIGHT_USER_AGENT, _navigate_url, _proxy_server
+
+logger = logging.getLogger(__name__)
+
+_POOLS: weakref.WeakSet = weakref.WeakSet()
+
+
+@atexit.register
+def _close_pools() -> None:
+    for pool in list(_POOLS):
+        pool.close()
+
+
+class BrowserPool:
+    """Long-lived headless Chromium used to resolve Google News redirect URLs.
+
+    Playwright's async API runs on a private event loop in a background thread, so
+    the pool can be shared by sync callers on any thread and by coroutines on any
+    event loop. Each navigation gets its own isolated browser context.
+
+    :param max_pages: Maximum number of contexts open at once
+    :param max_navigations: Recycle the browser after this many navigations
+    :param proxies: urllib-style proxy dict applied to every context
+    :param timeout: Seconds a sync :meth:`resolve` call waits before giving up
+    """
+
+    def __init__(self, max_pages: int = 4, max_navigations: int = 200,
+                 proxies: dict | None = None, timeout: float = 60.0) -> None:
+        if max_pages <= 0 or max_navigations <= 0:
+            raise InvalidConfigError("max_pages and max_navigations must be positive integers.")
+        self.max_pages = max_pages
+        self.max_navigations = max_navigations
+        self.timeout = timeout
+        server = _proxy_server(proxies)
+        self._proxy = {"server": server} if server else None
+        self._lock = threading.Lock()
+        self._reset()
+        _POOLS.add(self)
+
+    def _reset(self) -> None:
+        self._loop: asyncio.AbstractEventLoop | None = None
+        self._thread: threading.Thread | None = None
+        self._pid = os.getpid()
+        self._playwright = None
+        self._browser = None
+        self._navigations = 0
+        self._in_flight: dict = {}
+        self._retired: set = set()
+        self._semaphore = asyncio.Semaphore(self.max_pages)
+        self._launch_lock = asyncio.Lock()
+        self.launches = 0
+
+    def _ensure_loop(self) -> asyncio.AbstractEventLoop:
+        with self._lock:
+            if self._pid != os.getpid():
+                # The pool thread does not survive fork; start over in the child.
+                self._reset()
+            if self._loop is None:
+                self._loop = asyncio.new_event_loop()
+                self._thread = threading.Thread(target=self._loop.run_forever,
+                                                name="gnews-browser-pool", daemon=True)
+                self._thread.start()
+            return self._loop
+
+    @staticmethod
+    def _available() -> bool:
+        try:
+            import playwright.async_api  # noqa: F401
+        except ImportError:
+            return False
+        return True
+
+    def resolve(self, url: str, rate_limiter=None) -> str | None:
+        """Follow a Google News link in the pool; returns the publisher URL or None.
+
+        With a ``rate_limiter``, each navigation waits for one of its tokens first.
+        """
+        if not self._available():
+            return None
+        future = asyncio.run_coroutine_threadsafe(self._navigate(url, rate_limiter), self._ensure_loop())
+        try:
+            return future.result(self.timeout)
+        except Exception as e:
+            future.cancel()
+            logger.debug(f"Browser pool resolution failed: {e}")
+            return None
+
+    async def resolve_async(self, url: str, rate_limiter=None) -> str | None:
+        """Async version of :meth:`resolve` for use from any event loop."""
+        if not self._available():
+            return None
+        future = asyncio.run_coroutine_threadsafe(self._navigate(url, rate_limiter), self._ensure_loop())
+        try:
+            return await asyncio.wait_for(asyncio.wrap_future(future), self.timeout)
+        except Exception as e:
+            future.cancel()
+            logger.debug(f"Browser pool resolution failed: {e}")
+            return None
+
+    async def _acquire_browser(self):
+        from playwright.async_api import async_playwright
+
+        async with self._launch_lock:
+            if self._playwright is None:
+                self._playwright = await async_playwright().start()
+            if self._browser is None or not self._browser.is_connected():
+                self._browser = await self._playwright.chromium.launch(headless=True, args=_PLAYWRIGHT_LAUNCH_ARGS)
+                self._navigations = 0
+                self.launches += 1
+            browser = self._browser
+            self._navigations += 1
+            if self._navigations >= self.max_navigations:
+                # Retire it; it is closed once its last in-flight page finishes.
+                self._browser = None
+                self._retired.add(browser)
+            self._in_flight[browser] = self._in_flight.get(browser, 0) + 1
+            return browser
+
+    async def _release_browser(self, browser) -> None:
+        self._in_flight[browser] -= 1
+        if not browser.is_connected() and browser is self._browser:
+            # Crashed; the next navigation launches a fresh one.
+            self._browser = None
+            self._retired.add(browser)
+        if browser in self._retired and not self._in_flight[browser]:
+            self._retired.discard(browser)
+            del self._in_flight[browser]
+            try:
+                await browser.close()
+            except Exception as e:
+                logger.debug(f"Closing retired browser failed: {e}")
+
+    async def _navigate(self, url: str, rate_limiter=None) -> str | None:
+        from playwright.async_api import TimeoutError as PWTimeout
+
+        async with self._semaphore:
+            try:
+                browser = await self._acquire_browser()
+            except Exception as e:
+                logger.debug(f"Browser launch failed: {e}")
+                return None
+            try:
+                context = await browser.new_context(user_agent=_PLAYWRIGHT_USER_AGENT, proxy=self._proxy)
+                try:
+                    page = await context.new_page()
+                    if rate_limiter is not None:
+                        await rate_limiter.acquire_async()
+                    await page.goto(_navigate_url(url), wait_until="domcontentloaded", timeout=15000)
+                    try:
+                        await page.wait_for_url(lambda u: "news.google.com" not in u, timeout=10000)
+                    except PWTimeout:
+                        pass
+                    real_url = page.url
+                finally:
+                    try:
+                        await context.close()
+                    except Exception:
+                        pass
+                return real_url if "news.google.com" not in real_url else None
+            except Exception as e:
+                logger.debug(f"Playwright URL resolution failed: {e}")
+                return None
+            finally:
+                await self._release_browser(browser)
+
+    async def _shutdown(self) -> None:
+        browsers = set(self._retired)
+        if self._browser is not None:
+            browsers.add(self._browser)
+        for browser in browsers:
+            try:
+                await browser.close()
+            except Exception as e:
+                logger.debug(f"Closing browser failed: {e}")
+        if self._playwright is not None:
+            try:
+                await self._playwright.stop()
+            except Exception as e:
+                logger.debug(f"Stopping Playwright failed: {e}")
+
+    def close(self) -> None:
+        """Close every browser and stop the pool thread. The pool restarts on next use."""
+        with self._lock:
+            loop, thread = self._loop, self._thread
+            if loop is None or self._pid != os.getpid():
+                return
+            try:
+                asyncio.run_coroutine_threadsafe(self._shutdown(), loop).result(30)
+            except Exception as e:
+                logger.debug(f"Browser pool shutdown failed: {e}")
+            loop.call_soon_threadsafe(loop.stop)
+            thread.join(30)
+            loop.close()
+            self._reset()
+
+    def __enter__(self) -> BrowserPool:
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
@@ -0,0 +1,294 @@
+from __future__ import annotations
+
+import json
+import logging
+import os
+import re
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
+
+from gnews.article import _detached, _json_default
+from gnews.exceptions import InvalidConfigError
+
+logger = logging.getLogger(__name__)
+
+_ARTICLE_ID_REGEX = re.compile(r'^https?://(?:www\.)?news\.google\.com/(?:rss/)?articles/([^/?#]+)')
+
+
+def google_article_id(url: str) -> str | None:
+    """Return the article ID of a ``news.google.com/rss/articles/...`` link, or None."""
+    match = _ARTICLE_ID_REGEX.match(url or '')
+    return match.group(1) if match else None
+
+
+class _SQLiteStore:
+    """Thin wrapper around a SQLite file that many threads and processes can share.
+
+    Each process opens its own connection (a connection inherited across ``fork``
+    is never reused) in WAL mode with a busy timeout, and threads within a process
+    serialise on a lock. Statements run in autocommit mode so every write is atomic.
+    """
+
+    _schema: str = ''
+
+    def __init__(self, path: str) -> None:
+        self._path = os.fspath(path)
+        self._lock = threading.Lock()
+        self._conn: sqlite3.Connection | None = None
+        self._pid: int | None = None
+
+    def _connection(self) -> sqlite3.Connection:
+        if self._conn is None or self._pid != os.getpid():
+            conn = sqlite3.connect(self._path, timeout=30, isolation_level=None, check_same_thread=False)
+            if self._path != ':memory:':
+                conn.execute('PRAGMA journal_mode=WAL')
+            conn.execute('PRAGMA synchronous=NORMAL')
+            conn.executescript(self._schema)
+            self._conn = conn
+            self._pid = os.getpid()
+        return self._conn
+
+    def _execute(self, sql: str, params: tuple = ()) -> list[tuple]:
+        with self._lock:
+            return self._connection().execute(sql, params).fetchall()
+
+    def close(self) -> None:
+        with self._lock:
+            if self._conn is not None and self._pid == os.getpid():
+                self._conn.close()
+            self._conn = None
+
+
+class ResolutionCache(_SQLiteStore):
+    """Persistent cache of resolved Google News article URLs, keyed by Google article ID.
+
+    :param path: SQLite database file. Worker processes on one machine can point at the
+        same file; ``':memory:'`` keeps the cache private to this instance.
+    :param ttl: Seconds a successful resolution stays valid, defaults to 7 days
+    :param failure_ttl: Seconds a failed resolution is remembered, so it is not retried
+        on every fetch, defaults to 1 hour
+    :param max_entries: Upper bound on stored entries; the entries closest to expiry
+        are evicted first once it is exceeded
+    """
+
+    _schema = '''
+        CREATE TABLE IF NOT EXISTS resolutions (
+            article_id TEXT PRIMARY KEY,
+            url TEXT,
+            expires_at REAL NOT NULL
+        );
+        CREATE INDEX IF NOT EXISTS resolutions_expires_at ON resolutions (expires_at);
+    '''
+
+    # Eviction needs a COUNT(*), so it runs once every this many writes rather than on each one.
+    _EVICT_EVERY = 128
+
+    def __init__(self, path: str, ttl: float = 7 * 24 * 3600, failure_ttl: float = 3600,
+                 max_entries: int = 100_000) -> None:
+        if ttl <= 0 or failure_ttl <= 0:
+            raise InvalidConfigError("ttl and failure_ttl must be > 0.")
+        if max_entries <= 0:
+            raise InvalidConfigError("max_entries must be a positive integer.")
+        super().__init__(path)
+        self.ttl = ttl
+        self.failure_ttl = failure_ttl
+        self.max_entries = max_entries
+        self._writes = 0
+
+    def get(self, article_id: str) -> tuple[bool, str | None]:
+        """Look up an article ID.
+
+        :return: ``(hit, url)``. On a hit ``url`` is the resolved URL, or ``None`` when
+            the cached entry records a failed resolution.
+        """
+        try:
+            rows = self._execute('SELECT url, expires_at FROM resolutions WHERE article_id = ?', (article_id,))
+        except sqlite3.Error as e:
+            logger.debug(f"Resolution cache read failed: {e}")
+            return False, None
+        if not rows or rows[0][1] <= time.time():
+            return False, None
+        return True, rows[0][0]
+
+    def set(self, article_id: str, url: str | None) -> None:
+        """Store a resolution; pass ``url=None`` to record a failure with the short TTL."""
+        expires_at = time.time() + (self.ttl if url else self.failure_ttl)
+        try:
+            self._execute('INSERT OR REPLACE INTO resolutions (article_id, url, expires_at) VALUES (?, ?, ?)',
+                          (article_id, url, expires_at))
+            self._writes += 1
+            if self._writes % self._EVICT_EVERY == 0:
+                self.evict()
+        except sqlite3.Error as e:
+            logger.debug(f"Resolution cache write failed: {e}")
+
+    def evict(self) -> None:
+        """Drop expired entries, then trim to ``max_entries``."""
+        self._execute('DELETE FROM resolutions WHERE expires_at <= ?', (time.time(),))
+        (count,), = self._execute('SELECT COUNT(*) FROM resolutions')
+        if count > self.max_entries:
+            self._execute('DELETE FROM resolutions WHERE article_id IN '
+                          '(SELECT article_id FROM resolutions ORDER BY expires_at LIMIT ?)',
+                          (count - self.max_entries,))
+
+    def clear(self) -> None:
+        self._execute('DELETE FROM resolutions')
+
+    def __len__(self) -> int:
+        (count,), = self._execute('SELECT COUNT(*) FROM resolutions WHERE expires_at > ?', (time.time(),))
+        return count
+
+
+class _SQLiteResponses(_SQLiteStore):
+    """Disk layer of :class:`ResponseCache`."""
+
+    _schema = '''
+        CREATE TABLE IF NOT EXISTS responses (
+            key TEXT PRIMARY KEY,
+            articles TEXT NOT NULL,
+            stored_at REAL NOT NULL,
+            expires_at REAL NOT NULL
+        );
+        CREATE INDEX IF NOT EXISTS responses_expires_at ON responses (expires_at);
+    '''
+
+
+class ResponseCache:
+    """Two-layer TTL cache of query results: an in-memory LRU over an optional SQLite file.
+
+    A hit returns the articles of an earlier call without fetching, parsing or
+    resolving anything. Articles are copied on the way in and out, so changing a
+    returned article never alters what later hits see. Hits and misses are counted
+    on the instance.
+
+    :param ttl: Seconds a stored result stays fresh, defaults to 5 minutes. Individual
+        calls can override it with ``cache_ttl``.
+    :param max_entries: Results kept in memory; the least recently used go first
+    :param path: SQLite database file for a second layer shared across runs and worker
+        processes. Memory only when omitted.
+    :param max_disk_entries: Upper bound on results stored in the SQLite layer
+    """
+
+    _EVICT_EVERY = 128
+
+    def __init__(self, ttl: float = 300, max_entries: int = 1024, path: str | None = None,
+                 max_disk_entries: int = 100_000) -> None:
+        if ttl <= 0:
+            raise InvalidConfigError("ttl must be > 0.")
+        if max_entries <= 0 or max_disk_entries <= 0:
+            raise InvalidConfigError("max_entries and max_disk_entries must be positive integers.")
+        self.ttl = ttl
+        self.max_entries = max_entries
+        self.max_disk_entries = max_disk_entries
+        self._memory: OrderedDict[str, tuple[float, float, list]] = OrderedDict()
+        self._disk = _SQLiteResponses(path) if path is not None else None
+        self._lock = threading.Lock()
+        self._writes = 0
+        self.hits = 0
+        self.misses = 0
+        self.disk_hits = 0
+
+    @staticmethod
+    def _fresh(stored_at: float, expires_at: float, max_age: float | None, now: float) -> bool:
+        return now - stored_at < max_age if max_age is not None else now < expires_at
+
+    def get(self, key: str, max_age: float | None = None) -> list | None:
+        """Return the stored articles for ``key``, or None on a miss.
+
+        :param max_age: Treat entries older than this many seconds as stale, instead of
+            the TTL they were stored with
+        """
+        now = time.time()
+        with self._lock:
+            entry = self._memory.get(key)
+            if entry is not None and self._fresh(entry[0], entry[1], max_age, now):
+                self._memory.move_to_end(key)
+                self.hits += 1
+                articles = entry[2]
+            else:
+                articles = None
+        if articles is not None:
+            return [_detached(article) for article in articles]
+        articles = self._get_disk(key, max_age, now)
+        with self._lock:
+            if articles is None:
+                self.misses += 1
+                return None
+            self.hits += 1
+            self.disk_hits += 1
+        return articles
+
+    def _get_disk(self, key: str, max_age: float | None, now: float) -> list | None:
+        if self._disk is None:
+            return None
+        try:
+            rows = self._disk._execute('SELECT articles, stored_at, expires_at FROM responses WHERE key = ?', (key,))
+        except sqlite3.Error as e:
+            logger.debug(f"Response cache read failed: {e}")
+            return None
+        if not rows or not self._fresh(rows[0][1], rows[0][2], max_age, now):
+            return None
+        articles = json.loads(rows[0][0])
+        self._set_memory(key, (rows[0][1], rows[0][2], articles))
+        return [_detached(article) for article in articles]
+
+    def set(self, key: str, articles: list, ttl: float | None = None) -> None:
+        """Store the articles of a call; a ``ttl`` of 0 or less stores nothing."""
+        ttl = self.ttl if ttl is None else ttl
+        if ttl <= 0:
+            return
+        stored_at = time.time()
+        entry = (stored_at, stored_at + ttl, [_detached(article) for article in articles])
+        self._set_memory(key, entry)
+        if self._disk is None:
+            return
+        try:
+            self._disk._execute('INSERT OR REPLACE INTO responses (key, articles, stored_at, expires_at) '
+                                'VALUES (?, ?, ?, ?)',
+                                (key, json.dumps(entry[2], ensure_ascii=False, default=_json_default),
+                                 entry[0], entry[1]))
+            self._writes += 1
+            if self._writes % self._EVICT_EVERY == 0:
+                self.evict()
+        except sqlite3.Error as e:
+            logger.debug(f"Response cache write failed: {e}")
+
+    def _set_memory(self, key: str, entry: tuple) -> None:
+        with self._lock:
+            self._memory[key] = entry
+            self._memory.move_to_end(key)
+            while len(self._memory) > self.max_entries:
+                self._memory.popitem(last=False)
+
+    def evict(self) -> None:
+        """Drop expired entries from both layers, then trim the SQLite layer to ``max_disk_entries``."""
+        now = time.time()
+        with self._lock:
+            for key in [key for key, entry in self._memory.items() if entry[1] <= now]:
+                del self._memory[key]
+        if self._disk is None:
+            return
+        self._disk._execute('DELETE FROM responses WHERE expires_at <= ?', (now,))
+        (count,), = self._disk._execute('SELECT COUNT(*) FROM responses')
+        if count > self.max_disk_entries:
+            self._disk._execute('DELETE FROM responses WHERE key IN '
+                                '(SELECT key FROM responses ORDER BY expires_at LIMIT ?)',
+                                (count - self.max_disk_entries,))
+
+    def stats(self) -> dict:
+        """Hit and miss counters, and the number of results held in memory."""
+        with self._lock:
+            return {'hits': self.hits, 'misses': self.misses, 'disk_hits': self.disk_hits,
+                    'memory_entries': len(self._memory)}
+
+    def clear(self) -> None:
+        with self._lock:
+            self._memory.clear()
+        if self._disk is not None:
+            self._disk._execute('DELETE FROM responses')
+
+    def close(self) -> None:
+        if self._disk is not None:
+            self._disk.close()
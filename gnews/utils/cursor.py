@@ -0,0 +1,104 @@
+from __future__ import annotations
+
+import base64
+import hashlib
+import json
+import os
+import tempfile
+
+from gnews.exceptions import InvalidConfigError
+
+_DIGEST_SIZE = 8
+
+
+def url_digest(url: str) -> bytes:
+    """Short, stable digest of an article URL used to remember what a walk has seen."""
+    return hashlib.blake2b(url.encode('utf-8'), digest_size=_DIGEST_SIZE).digest()
+
+
+class NewsCursor:
+    """Serializable position of a search walked one date window at a time.
+
+    Produced by :meth:`GNews.iter_pages` after every window and accepted back by it
+    to continue where the walk stopped, in the same or a later process. It records
+    which windows are left, how many articles were returned and digests of the URLs
+    already seen, so a resumed walk neither repeats nor skips articles.
+
+    :param query: Search key the cursor belongs to
+    :param mode: ``'walk'`` for the rolling backward walk, ``'range'`` for the
+        date-range engine
+    :param state: Engine state: the next window and earliest date for a walk, the
+        windows still to fetch and the density estimate for a range
+    :param seen: Digests of the URLs the engine still dedups against
+    :param count: Articles returned so far, counted against ``max_results``
+    :param done: True once there is nothing left to fetch
+    """
+
+    __slots__ = ('query', 'mode', 'state', 'seen', 'count', 'done')
+
+    VERSION = 1
+
+    def __init__(self, query: str, mode: str, state: dict, seen: set[bytes] | None = None,
+                 count: int = 0, done: bool = False) -> None:
+        if mode not in ('walk', 'range'):
+            raise InvalidConfigError(f"Unknown cursor mode '{mode}'.")
+        self.query = query
+        self.mode = mode
+        self.state = state
+        self.seen = set(seen or ())
+        self.count = count
+        self.done = done
+
+    def to_dict(self) -> dict:
+        return {
+            'version': self.VERSION,
+            'query': self.query,
+            'mode': self.mode,
+            'state': self.state,
+            'seen': base64.b64encode(b''.join(sorted(self.seen))).decode('ascii'),
+            'count': self.count,
+            'done': self.done,
+        }
+
+    @classmethod
+    def from_dict(cls, data: dict) -> NewsCursor:
+        if not isinstance(data, dict) or data.get('version') != cls.VERSION:
+            raise InvalidConfigError("Unsupported or corrupt news cursor.")
+        try:
+            blob = base64.b64decode(data['seen'])
+            seen = {blob[i:i + _DIGEST_SIZE] for i in range(0, len(blob), _DIGEST_SIZE)}
+            return cls(data['query'], data['mode'], data['state'], seen, int(data['count']), bool(data['done']))
+        except (KeyError, TypeError, ValueError) as e:
+            raise InvalidConfigError(f"Corrupt news cursor: {e}") from e
+
+    def to_json(self) -> str:
+        return json.dumps(self.to_dict())
+
+    @classmethod
+    def from_json(cls, text: str) -> NewsCursor:
+        try:
+            data = json.loads(text)
+        except ValueError as e:
+            raise InvalidConfigError(f"Corrupt news cursor: {e}") from e
+        return cls.from_dict(data)
+
+    def save(self, path: str | os.PathLike) -> None:
+        """Write the cursor to ``path`` atomically, so a crash mid-write keeps the previous one."""
+        path = os.fspath(path)
+        fd, tmp = tempfile.mkstemp(dir=os.path.dirname(os.path.abspath(path)), prefix='.cursor-')
+        try:
+            with os.fdopen(fd, 'w', encoding='utf-8') as f:
+                f.write(self.to_json())
+            os.replace(tmp, path)
+        except BaseException:
+            os.unlink(tmp)
+            raise
+
+    @classmethod
+    def load(cls, path: str | os.PathLike) -> NewsCursor:
+        with open(path, encoding='utf-8') as f:
+            return cls.from_json(f.read())
+
+    def __repr__(self) -> str:
+        return (f"NewsCursor(query={self.query!r}, mode={self.mode!r}, count={self.count}, "
+                f"seen={len(self.seen)}, done={self.done})")
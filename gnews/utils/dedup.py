@@ -0,0 +1,204 @@
+from __future__ import annotations
+
+import hashlib
+import logging
+import math
+import os
+import sqlite3
+import struct
+import tempfile
+import threading
+import time
+import urllib.parse
+
+from gnews.exceptions import InvalidConfigError
+from gnews.utils.cache import _SQLiteStore, google_article_id
+
+logger = logging.getLogger(__name__)
+
+_TRACKING_PARAMS = ('utm_', 'fbclid', 'gclid', 'mc_cid', 'mc_eid')
+
+
+def canonical_url(url: str) -> str:
+    """Normalise a publisher URL so trivially different links to one article compare equal.
+
+    Lowercases the scheme and host, drops the fragment, tracking parameters and a
+    trailing slash.
+    """
+    parts = urllib.parse.urlsplit(url.strip())
+    query = '&'.join(param for param in parts.query.split('&')
+                     if param and not param.lower().startswith(_TRACKING_PARAMS))
+    path = parts.path.rstrip('/') if parts.path != '/' else ''
+    return urllib.parse.urlunsplit((parts.scheme.lower(), parts.netloc.lower(), path, query, ''))
+
+
+def dedup_key(url: str) -> int:
+    """64-bit key of an article: its Google News article ID if it has one, else its canonical URL.
+
+    The key is a signed integer so it fits a SQLite ``INTEGER`` column.
+    """
+    article_id = google_article_id(url)
+    text = 'g:' + article_id if article_id else 'u:' + canonical_url(url)
+    return int.from_bytes(hashlib.blake2b(text.encode('utf-8'), digest_size=8).digest(), 'big', signed=True)
+
+
+class SQLiteDedupStore(_SQLiteStore):
+    """Exact record of the articles already returned, persisted in SQLite.
+
+    Stores one 64-bit key per article, so a million articles take a few tens of
+    megabytes on disk. Worker processes on one machine can share the file. If the
+    database cannot be read an article counts as new, so nothing is lost.
+
+    :param path: SQLite database file, or ``':memory:'``
+    :param ttl: Seconds an article is remembered. Defaults to None (forever).
+    """
+
+    _schema = '''
+        CREATE TABLE IF NOT EXISTS seen (
+            key INTEGER PRIMARY KEY,
+            seen_at REAL NOT NULL
+        );
+        CREATE INDEX IF NOT EXISTS seen_seen_at ON seen (seen_at);
+    '''
+
+    _EVICT_EVERY = 1024
+
+    def __init__(self, path: str, ttl: float | None = None) -> None:
+        if ttl is not None and ttl <= 0:
+            raise InvalidConfigError("ttl must be > 0.")
+        super().__init__(path)
+        self.ttl = ttl
+        self._writes = 0
+
+    def __contains__(self, key: int) -> bool:
+        oldest = time.time() - self.ttl if self.ttl is not None else 0.0
+        try:
+            return bool(self._execute('SELECT 1 FROM seen WHERE key = ? AND seen_at >= ?', (key, oldest)))
+        except sqlite3.Error as e:
+            logger.debug(f"Dedup store read failed: {e}")
+            return False
+
+    def add(self, key: int) -> None:
+        try:
+            self._execute('INSERT OR REPLACE INTO seen (key, seen_at) VALUES (?, ?)', (key, time.time()))
+            self._writes += 1
+            if self.ttl is not None and self._writes % self._EVICT_EVERY == 0:
+                self.evict()
+        except sqlite3.Error as e:
+            logger.debug(f"Dedup store write failed: {e}")
+
+    def evict(self) -> None:
+        """Forget articles older than ``ttl``."""
+        if self.ttl is not None:
+            self._execute('DELETE FROM seen WHERE seen_at < ?', (time.time() - self.ttl,))
+
+    def clear(self) -> None:
+        self._execute('DELETE FROM seen')
+
+    def __len__(self) -> int:
+        (count,), = self._execute('SELECT COUNT(*) FROM seen')
+        return count
+
+
+class BloomDedupStore:
+    """Memory-bounded record of the articles already returned, as a Bloom filter.
+
+    The filter is sized up front for ``capacity`` articles at ``error_rate``: about
+    1.8 MB for a million articles at 0.1%. It never forgets an article, but a new
+    article is wrongly taken as seen (and dropped) with probability ``error_rate``,
+    rising once more than ``capacity`` articles were added.
+
+    :param capacity: Number of articles the filter is sized for
+    :param error_rate: False-positive rate at ``capacity``
+    :param path: File the filter is loaded from, if it exists, and saved to by
+        :meth:`save` and :meth:`close`. A saved filter keeps the size it was created with.
+    """
+
+    _MAGIC = b'GNBF1'
+    _HEADER = struct.Struct('>QIQ')
+
+    def __init__(self, capacity: int = 1_000_000, error_rate: float = 0.001,
+                 path: str | os.PathLike | None = None) -> None:
+        if capacity <= 0:
+            raise InvalidConfigError("capacity must be a positive integer.")
+        if not 0 < error_rate < 1:
+            raise InvalidConfigError("error_rate must be between 0 and 1.")
+        self.path = os.fspath(path) if path is not None else None
+        self._lock = threading.Lock()
+        if self.path is not None and os.path.exists(self.path):
+            self._load(self.path)
+            return
+        self.size = math.ceil(-capacity * math.log(error_rate) / math.log(2) ** 2)
+        self.hashes = max(1, round(self.size / capacity * math.log(2)))
+        self._bits = bytearray((self.size + 7) // 8)
+        self._count = 0
+
+    def _positions(self, key: int):
+        key &= 0xFFFFFFFFFFFFFFFF
+        # Double hashing: the two halves of the 64-bit key give every probe position.
+        low, high = key & 0xFFFFFFFF, (key >> 32) | 1
+        return [(low + i * high) % self.size for i in range(self.hashes)]
+
+    def __contains__(self, key: int) -> bool:
+        bits = self._bits
+        return all(bits[pos >> 3] & (1 << (pos & 7)) for pos in self._positions(key))
+
+    def add(self, key: int) -> None:
+        positions = self._positions(key)
+        with self._lock:
+            bits = self._bits
+            added = False
+            for pos in positions:
+                mask = 1 << (pos & 7)
+                if not bits[pos >> 3] & mask:
+                    bits[pos >> 3] |= mask
+                    added = True
+            if added:
+                self._count += 1
+
+    def clear(self) -> None:
+        with self._lock:
+            self._bits = bytearray(len(self._bits))
+            self._count = 0
+
+    def __len__(self) -> int:
+        """Approximate number of distinct articles added."""
+        return self._count
+
+    def save(self, path: str | os.PathLike | None = None) -> None:
+        """Write the filter to ``path`` (defaults to the one it was created with) atomically."""
+        path = os.fspath(path) if path is not None else self.path
+        if path is None:
+            raise InvalidConfigError("BloomDedupStore has no path to save to.")
+        with self._lock:
+            data = self._MAGIC + self._HEADER.pack(self.size, self.hashes, self._count) + bytes(self._bits)
+        fd, tmp = tempfile.mkstemp(dir=os.path.dirname(os.path.abspath(path)), prefix='.bloom-')
+        try:
+            with os.fdopen(fd, 'wb') as f:
+                f.write(data)
+            os.replace(tmp, path)
+        except BaseException:
+            os.unlink(tmp)
+            raise
+
+    def _load(self, path: str) -> None:
+        with open(path, 'rb') as f:
+            data = f.read()
+        header_end = len(self._MAGIC) + self._HEADER.size
+        if not data.startswith(self._MAGIC) or len(data) < header_end:
+            raise InvalidConfigError(f"{path} is not a saved BloomDedupStore.")
+        self.size, self.hashes, self._count = self._HEADER.unpack(data[len(self._MAGIC):header_end])
+        self._bits = bytearray(data[header_end:])
+        if len(self._bits) != (self.size + 7) // 8:
+            raise InvalidConfigError(f"{path} is truncated.")
+
+    def close(self) -> None:
+        """Save the filter if it has a path."""
+        if self.path is not None:
+            self.save()
+
+    def __enter__(self) -> BloomDedupStore:
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
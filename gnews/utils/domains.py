@@ -0,0 +1,68 @@
+from __future__ import annotations
+
+import hashlib
+from collections.abc import Iterable
+
+
+def _hostname(url: str) -> str:
+    # Cheaper than urllib.parse.urlsplit; only the host is needed.
+    _, sep, rest = url.partition('://')
+    if not sep:
+        rest = url
+    for delimiter in '/?#':
+        rest = rest.split(delimiter, 1)[0]
+    rest = rest.rsplit('@', 1)[-1].split(':', 1)[0]
+    return rest.lower().rstrip('.')
+
+
+def normalize_domain(website: str) -> str:
+    """Reduce ``'https://www.Example.com/news'`` to ``'example.com'``."""
+    host = _hostname(website.strip())
+    return host[4:] if host.startswith('www.') else host
+
+
+class DomainIndex:
+    """Compiled set of websites, matched by hostname suffix.
+
+    ``'example.com'`` matches ``example.com``, ``www.example.com`` and any other
+    subdomain, over http or https. A lookup costs one set probe per hostname label,
+    however many domains the index holds.
+    """
+
+    __slots__ = ('_domains', '_fingerprint')
+
+    def __init__(self, websites: Iterable[str] = ()) -> None:
+        self._domains = frozenset(domain for domain in map(normalize_domain, websites) if domain)
+        self._fingerprint: str | None = None
+
+    @property
+    def fingerprint(self) -> str:
+        """Digest of the domains that is stable across processes, for keying caches."""
+        if self._fingerprint is None:
+            self._fingerprint = hashlib.sha1('\n'.join(sorted(self._domains)).encode()).hexdigest()[:16]
+        return self._fingerprint
+
+    def matches(self, url: str) -> bool:
+        """Return True if the host of ``url`` (or a bare hostname) is in the index."""
+        if not self._domains or not url:
+            return False
+        host = _hostname(url)
+        while host:
+            if host in self._domains:
+                return True
+            host = host.partition('.')[2]
+        return False
+
+    __contains__ = matches
+
+    def __len__(self) -> int:
+        return len(self._domains)
+
+    def __bool__(self) -> bool:
+        return bool(self._domains)
+
+    def __iter__(self):
+        return iter(self._domains)
+
+    def __repr__(self) -> str:
+        return f"DomainIndex({len(self._domains)} domains)"
@@ -0,0 +1,208 @@
+from __future__ import annotations
+
+import csv
+import gzip
+import io
+import json
+import os
+from collections.abc import AsyncIterable, Iterable, Mapping
+
+from gnews.article import _json_default
+from gnews.exceptions import InvalidConfigError
+
+#: CSV columns: the keys every backend produces, then the extra SearchApi fields.
+#: A publisher dict is split into ``publisher`` (its title) and ``publisher href``.
+CSV_FIELDS = (
+    'title', 'description', 'published date', 'url', 'publisher', 'publisher href',
+    'iso_date', 'thumbnail', 'favicon', 'rank',
+)
+
+_FORMATS = {'.jsonl': 'jsonl', '.ndjson': 'jsonl', '.csv': 'csv'}
+_COMPRESSIONS = {'.gz': 'gzip', '.zst': 'zstd'}
+
+
+def _record(article: Mapping) -> dict:
+    # Indexing (not dict()) so a LazyArticle hands out its resolved url.
+    return {key: article[key] for key in article}
+
+
+def _csv_row(article: Mapping) -> dict:
+    row = _record(article)
+    publisher = row.get('publisher')
+    if isinstance(publisher, Mapping):
+        row['publisher'] = publisher.get('title', '')
+        row['publisher href'] = publisher.get('href', '')
+    return row
+
+
+class ArticleWriter:
+    """Streams articles to NDJSON or CSV files one record at a time.
+
+    Memory use does not grow with the number of articles, so a crawl of millions
+    can be written as it is fetched. Every CSV file has the same header
+    (``fields``); keys outside it are dropped and missing ones left empty.
+
+    With ``max_bytes`` or ``max_records`` the output is split into numbered files,
+    ``news.jsonl.gz`` becoming ``news-00000.jsonl.gz``, ``news-00001.jsonl.gz`` and
+    so on; :attr:`paths` lists the files written.
+
+    :param path: Output file. The format and compression are taken from its suffix
+        (``.jsonl``/``.ndjson``/``.csv``, then ``.gz``/``.zst``) unless given.
+    :param format: ``'jsonl'`` or ``'csv'``
+    :param compression: ``None``, ``'gzip'`` or ``'zstd'`` (``pip install gnews[zstd]``)
+    :param max_bytes: Start a new file once the current one reaches this many bytes
+        on disk. Compressed output is measured as the compressor flushes it, so
+        files can run over by up to one compressor buffer.
+    :param max_records: Start a new file after this many articles
+    :param fields: Keys written, in order. Defaults to :data:`CSV_FIELDS` for CSV
+        and every key of the article for NDJSON.
+    :param compresslevel: Compression level passed to gzip or zstd
+    """
+
+    def __init__(self, path: str | os.PathLike, format: str | None = None, compression: str | None = None,
+                 max_bytes: int | None = None, max_records: int | None = None,
+                 fields: Iterable[str] | None = None, compresslevel: int | None = None) -> None:
+        path = os.fspath(path)
+        base, suffix = os.path.splitext(path)
+        if suffix in _COMPRESSIONS:
+            compression = compression or _COMPRESSIONS[suffix]
+            base, suffix = os.path.splitext(base)
+            self._suffix = suffix + os.path.splitext(path)[1]
+        else:
+            self._suffix = suffix
+        format = format or _FORMATS.get(suffix, 'jsonl')
+        if format not in ('jsonl', 'csv'):
+            raise InvalidConfigError(f"Unsupported export format '{format}'. Use 'jsonl' or 'csv'.")
+        if compression not in (None, 'gzip', 'zstd'):
+            raise InvalidConfigError(f"Unsupported compression '{compression}'. Use 'gzip' or 'zstd'.")
+        if max_bytes is not None and max_bytes <= 0:
+            raise InvalidConfigError("max_bytes must be a positive integer.")
+        if max_records is not None and max_records <= 0:
+            raise InvalidConfigError("max_records must be a positive integer.")
+        if compression == 'zstd':
+            try:
+                import zstandard  # noqa: F401
+            except ImportError as e:
+                raise ImportError(
+                    "zstd compression requires zstandard. "
+                    "Install it with: pip install gnews[zstd]"
+                ) from e
+        self.path = path
+        self.format = format
+        self.compression = compression
+        self.max_bytes = max_bytes
+        self.max_records = max_records
+        self.fields = tuple(fields) if fields is not None else (CSV_FIELDS if format == 'csv' else None)
+        self.compresslevel = compresslevel
+        #: Files written so far, in order.
+        self.paths: list[str] = []
+        #: Articles written across all files.
+        self.count = 0
+        self._base = base
+        self._raw = None
+        self._stream = None
+        self._text = None
+        self._csv = None
+        self._file_records = 0
+
+    def _next_path(self) -> str:
+        if self.max_bytes is None and self.max_records is None:
+            return self.path
+        return f"{self._base}-{len(self.paths):05d}{self._suffix}"
+
+    def _open(self) -> None:
+        path = self._next_path()
+        self._raw = open(path, 'wb')
+        if self.compression == 'gzip':
+            level = 6 if self.compresslevel is None else self.compresslevel
+            self._stream = gzip.GzipFile(fileobj=self._raw, mode='wb', compresslevel=level)
+        elif self.compression == 'zstd':
+            import zstandard
+            level = 3 if self.compresslevel is None else self.compresslevel
+            self._stream = zstandard.ZstdCompressor(level=level).stream_writer(self._raw, closefd=False)
+        else:
+            self._stream = self._raw
+        # write_through hands every record to the compressor at once, so the size check sees it.
+        self._text = io.TextIOWrapper(self._stream, encoding='utf-8', newline='', write_through=True)
+        if self.format == 'csv':
+            self._csv = csv.DictWriter(self._text, fieldnames=self.fields, extrasaction='ignore')
+            self._csv.writeheader()
+        self.paths.append(path)
+        self._file_records = 0
+
+    def _close_file(self) -> None:
+        if self._text is None:
+            return
+        self._text.flush()
+        self._text.detach()
+        if self._stream is not self._raw:
+            self._stream.close()
+        self._raw.close()
+        self._raw = self._stream = self._text = self._csv = None
+
+    def _full(self) -> bool:
+        if self.max_records is not None and self._file_records >= self.max_records:
+            return True
+        return self.max_bytes is not None and self._raw.tell() >= self.max_bytes
+
+    def write(self, article: Mapping) -> None:
+        """Append one article, starting a new file first if the current one is full."""
+        if self._text is not None and self._full():
+            self._close_file()
+        if self._text is None:
+            self._open()
+        if self.format == 'csv':
+            self._csv.writerow(_csv_row(article))
+        else:
+            record = _record(article)
+            if self.fields is not None:
+                record = {key: record.get(key) for key in self.fields}
+            self._text.write(json.dumps(record, ensure_ascii=False, default=_json_default) + '\n')
+        self._file_records += 1
+        self.count += 1
+
+    def write_all(self, articles: Iterable[Mapping]) -> int:
+        """Write every article of an iterable, e.g. :meth:`GNews.iter_news`. Returns the number written."""
+        written = 0
+        for article in articles:
+            self.write(article)
+            written += 1
+        return written
+
+    async def write_all_async(self, articles: AsyncIterable[Mapping]) -> int:
+        """Write every article of an async iterable, e.g. :meth:`GNews.iter_news_async`."""
+        written = 0
+        async for article in articles:
+            # Buffered local writes; cheap next to the network fetches that feed them.
+            self.write(article)
+            written += 1
+        return written
+
+    def close(self) -> None:
+        """Flush and close the current file. An empty export still leaves one file with its header."""
+        if self._text is None and not self.paths:
+            self._open()
+        self._close_file()
+
+    def __enter__(self) -> ArticleWriter:
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+
+def write_articles(articles: Iterable[Mapping], path: str | os.PathLike, **kwargs) -> list[str]:
+    """Stream ``articles`` to ``path`` with an :class:`ArticleWriter` and return the files written.
+
+    :param kwargs: Passed to :class:`ArticleWriter`
+    """
+    with ArticleWriter(path, **kwargs) as writer:
+        writer.write_all(articles)
+    return writer.paths
+
+
+async def write_articles_async(articles: AsyncIterable[Mapping], path: str | os.PathLike, **kwargs) -> list[str]:
+    """Async counterpart of :func:`write_articles` for async generators."""
+    with ArticleWriter(path, **kwargs) as writer:
+        await writer.write_all_async(articles)
+    return writer.paths
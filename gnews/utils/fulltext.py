@@ -0,0 +1,234 @@
+from __future__ import annotations
+
+import logging
+import os
+import sqlite3
+import time
+import zlib
+from collections.abc import Callable
+
+from gnews.exceptions import InvalidConfigError
+from gnews.utils.cache import _SQLiteStore
+from gnews.utils.dedup import canonical_url
+
+logger = logging.getLogger(__name__)
+
+
+def trafilatura_module(caller: str):
+    """Import trafilatura, or explain which extra provides it."""
+    try:
+        import trafilatura
+    except ImportError as e:
+        raise ImportError(
+            f"{caller} requires trafilatura. "
+            "Install it with: pip install gnews[fulltext]"
+        ) from e
+    return trafilatura
+
+
+def extract_text(html: bytes | str) -> str | None:
+    """Main text of an article page, or None if trafilatura finds none.
+
+    A module-level function so it can run in a worker process.
+    """
+    import trafilatura
+
+    return trafilatura.extract(html, include_comments=False, include_tables=False)
+
+
+class CachedArticle:
+    """A stored article: its extracted text and the validators of the page it came from.
+
+    :param text: Extracted text, or None when extraction found nothing (a negative entry)
+    :param etag: ``ETag`` response header of the page
+    :param modified: ``Last-Modified`` response header of the page
+    :param expires_at: Time after which the page is revalidated before use
+    """
+
+    __slots__ = ('text', 'etag', 'modified', 'expires_at')
+
+    def __init__(self, text: str | None, etag: str | None, modified: str | None, expires_at: float) -> None:
+        self.text = text
+        self.etag = etag
+        self.modified = modified
+        self.expires_at = expires_at
+
+    @property
+    def fresh(self) -> bool:
+        return time.time() < self.expires_at
+
+
+class ArticleCache(_SQLiteStore):
+    """On-disk cache of full articles: the compressed page HTML and the text extracted from it.
+
+    Entries are keyed by canonical URL, so links differing only in tracking parameters,
+    fragment or a trailing slash share one entry. A stale entry is not dropped: it is
+    revalidated with ``If-None-Match``/``If-Modified-Since`` and reused on a 304. Pages
+    extraction finds no text in are remembered for ``failure_ttl``, with their HTML, so
+    :meth:`reextract` can retry them offline. Once the stored size passes ``max_bytes``
+    the least recently used entries are evicted, down to 90% of the budget so the next
+    few writes do not evict again. Triggers keep the stored size in a one-row table, so
+    checking it costs one lookup however many processes write to the file.
+
+    :param path: SQLite database file. Worker processes on one machine can share it.
+    :param ttl: Seconds an article is used without revalidation, defaults to 1 day
+    :param failure_ttl: Seconds a failed extraction is remembered, defaults to 1 hour
+    :param max_bytes: Budget for the stored HTML and text, defaults to 256 MiB
+    :param compresslevel: zlib level for the stored HTML
+    """
+
+    _schema = '''
+        CREATE TABLE IF NOT EXISTS articles (
+            url TEXT PRIMARY KEY,
+            html BLOB NOT NULL,
+            text TEXT,
+            etag TEXT,
+            modified TEXT,
+            expires_at REAL NOT NULL,
+            accessed_at REAL NOT NULL,
+            size INTEGER NOT NULL
+        );
+        CREATE INDEX IF NOT EXISTS articles_accessed_at ON articles (accessed_at);
+        CREATE TABLE IF NOT EXISTS articles_size (
+            id INTEGER PRIMARY KEY CHECK (id = 0),
+            bytes INTEGER NOT NULL
+        );
+        INSERT INTO articles_size SELECT 0, (SELECT COALESCE(SUM(size), 0) FROM articles)
+            WHERE NOT EXISTS (SELECT 1 FROM articles_size);
+        CREATE TRIGGER IF NOT EXISTS articles_size_insert AFTER INSERT ON articles BEGIN
+            UPDATE articles_size SET bytes = bytes + NEW.size;
+        END;
+        CREATE TRIGGER IF NOT EXISTS articles_size_update AFTER UPDATE OF size ON articles BEGIN
+            UPDATE articles_size SET bytes = bytes - OLD.size + NEW.size;
+        END;
+        CREATE TRIGGER IF NOT EXISTS articles_size_delete AFTER DELETE ON articles BEGIN
+            UPDATE articles_size SET bytes = bytes - OLD.size;
+        END;
+    '''
+
+    #: Eviction trims the stored size to this fraction of ``max_bytes``.
+    _LOW_WATER = 0.9
+    #: Pages loaded at a time by :meth:`reextract`.
+    _REEXTRACT_BATCH = 64
+
+    def __init__(self, path: str | os.PathLike, ttl: float = 24 * 3600, failure_ttl: float = 3600,
+                 max_bytes: int = 256 * 1024 * 1024, compresslevel: int = 6) -> None:
+        if ttl <= 0 or failure_ttl <= 0:
+            raise InvalidConfigError("ttl and failure_ttl must be > 0.")
+        if max_bytes <= 0:
+            raise InvalidConfigError("max_bytes must be a positive integer.")
+        super().__init__(path)
+        self.ttl = ttl
+        self.failure_ttl = failure_ttl
+        self.max_bytes = max_bytes
+        self.compresslevel = compresslevel
+        self.hits = 0
+        self.misses = 0
+        self.revalidated = 0
+
+    def _ttl(self, text: str | None) -> float:
+        return self.ttl if text else self.failure_ttl
+
+    def get(self, url: str) -> CachedArticle | None:
+        """Look up ``url``, fresh or stale; check :attr:`CachedArticle.fresh` before using it."""
+        key = canonical_url(url)
+        try:
+            rows = self._execute('SELECT text, etag, modified, expires_at FROM articles WHERE url = ?', (key,))
+            if rows:
+                self._execute('UPDATE articles SET accessed_at = ? WHERE url = ?', (time.time(), key))
+        except sqlite3.Error as e:
+            logger.debug(f"Article cache read failed: {e}")
+            rows = []
+        entry = CachedArticle(*rows[0]) if rows else None
+        if entry is not None and entry.fresh:
+            self.hits += 1
+        else:
+            self.misses += 1
+        return entry
+
+    def html(self, url: str) -> bytes | None:
+        """The stored page HTML of ``url``, decompressed, or None if it is not cached."""
+        rows = self._execute('SELECT html FROM articles WHERE url = ?', (canonical_url(url),))
+        return zlib.decompress(rows[0][0]) if rows else None
+
+    def set(self, url: str, html: bytes, text: str | None, etag: str | None = None,
+            modified: str | None = None) -> None:
+        """Store a downloaded page and its extracted text; ``text=None`` records a failed extraction."""
+        blob = zlib.compress(html, self.compresslevel)
+        size = len(blob) + len((text or '').encode('utf-8'))
+        now = time.time()
+        try:
+            # An upsert rather than INSERT OR REPLACE, whose implicit delete would skip the size trigger.
+            self._execute('INSERT INTO articles '
+                          '(url, html, text, etag, modified, expires_at, accessed_at, size) '
+                          'VALUES (?, ?, ?, ?, ?, ?, ?, ?) '
+                          'ON CONFLICT (url) DO UPDATE SET html = excluded.html, text = excluded.text, '
+                          'etag = excluded.etag, modified = excluded.modified, expires_at = excluded.expires_at, '
+                          'accessed_at = excluded.accessed_at, size = excluded.size',
+                          (canonical_url(url), blob, text, etag, modified, now + self._ttl(text), now, size))
+            self.evict()
+        except sqlite3.Error as e:
+            logger.debug(f"Article cache write failed: {e}")
+
+    def refresh(self, url: str, entry: CachedArticle) -> None:
+        """Mark a stale entry fresh again after the server answered 304 Not Modified."""
+        entry.expires_at = time.time() + self._ttl(entry.text)
+        self.revalidated += 1
+        try:
+            self._execute('UPDATE articles SET expires_at = ? WHERE url = ?', (entry.expires_at, canonical_url(url)))
+        except sqlite3.Error as e:
+            logger.debug(f"Article cache write failed: {e}")
+
+    def reextract(self, extract: Callable[[bytes], str | None] = extract_text) -> int:
+        """Run extraction again over every stored page, e.g. after upgrading trafilatura.
+
+        Works from the cached HTML alone, without any network access. Entries keep
+        their validators; their expiry follows the new outcome.
+
+        :param extract: Function from page HTML to text, defaults to :func:`extract_text`
+        :return: Number of entries whose text changed
+        """
+        changed = 0
+        last = ''
+        # Pages are read a batch at a time in URL order, so memory stays flat and the
+        # lock is not held while extracting.
+        while True:
+            rows = self._execute('SELECT url, html, text FROM articles WHERE url > ? ORDER BY url LIMIT ?',
+                                 (last, self._REEXTRACT_BATCH))
+            if not rows:
+                break
+            for key, blob, old in rows:
+                text = extract(zlib.decompress(blob))
+                if text == old:
+                    continue
+                size = len(blob) + len((text or '').encode('utf-8'))
+                self._execute('UPDATE articles SET text = ?, size = ?, expires_at = ? WHERE url = ?',
+                              (text, size, time.time() + self._ttl(text), key))
+                changed += 1
+            last = rows[-1][0]
+        self.evict()
+        return changed
+
+    def evict(self) -> None:
+        """Once the stored size passes ``max_bytes``, drop the least recently used entries down to 90% of it."""
+        if self.size() <= self.max_bytes:
+            return
+        self._execute('DELETE FROM articles WHERE url IN (SELECT url FROM ('
+                      'SELECT url, SUM(size) OVER (ORDER BY accessed_at DESC, url) AS total FROM articles'
+                      ') WHERE total > ?)', (int(self.max_bytes * self._LOW_WATER),))
+
+    def size(self) -> int:
+        """Bytes of HTML and text stored."""
+        (total,), = self._execute('SELECT bytes FROM articles_size')
+        return total
+
+    def stats(self) -> dict:
+        return {'hits': self.hits, 'misses': self.misses, 'revalidated': self.revalidated,
+                'entries': len(self), 'bytes': self.size()}
+
+    def clear(self) -> None:
+        self._execute('DELETE FROM articles')
+
+    def __len__(self) -> int:
+        (count,), = self._execute('SELECT COUNT(*) FROM articles')
+        return count
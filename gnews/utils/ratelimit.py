@@ -0,0 +1,154 @@
+from __future__ import annotations
+
+import asyncio
+import logging
+from abc import ABC, abstractmethod
+import sqlite3
+import threading
+import time
+
+from gnews.exceptions import InvalidConfigError
+from gnews.utils.cache import _SQLiteStore
+
+logger = logging.getLogger(__name__)
+
+
+def _take(tokens: float, updated: float, now: float, rate: float, burst: float) -> tuple[float, float]:
+    """Refill a bucket up to ``now`` and take one token; returns ``(tokens, wait)``.
+
+    The balance may go negative: a caller that finds the bucket empty books the next
+    token and waits for it, so callers are served in arrival order without polling.
+    """
+    tokens = min(burst, tokens + max(0.0, now - updated) * rate) - 1
+    return tokens, max(0.0, -tokens / rate)
+
+
+class _TokenBucket(ABC):
+    def __init__(self, rate: float, burst: float | None) -> None:
+        if rate <= 0:
+            raise InvalidConfigError("rate must be > 0.")
+        burst = max(1.0, rate) if burst is None else burst
+        if burst < 1:
+            raise InvalidConfigError("burst must be >= 1.")
+        self.rate = rate
+        self.burst = burst
+
+    @abstractmethod
+    def reserve(self) -> float:
+        """Take a token and return the seconds to wait before using it."""
+
+    def acquire(self) -> None:
+        """Block until a token is available."""
+        wait = self.reserve()
+        if wait > 0:
+            time.sleep(wait)
+
+    async def acquire_async(self) -> None:
+        """Wait for a token without blocking the event loop."""
+        wait = self.reserve()
+        if wait > 0:
+            await asyncio.sleep(wait)
+
+
+class RateLimiter(_TokenBucket):
+    """Thread-safe token bucket that spaces requests to at most ``rate`` per second.
+
+    :param rate: Tokens added per second, i.e. the sustained requests per second
+    :param burst: Bucket size, i.e. how many requests may go out back to back after
+        an idle period. Defaults to ``max(1, rate)``.
+    """
+
+    _shared: dict[str, RateLimiter] = {}
+    _shared_lock = threading.Lock()
+
+    def __init__(self, rate: float, burst: float | None = None) -> None:
+        super().__init__(rate, burst)
+        self._tokens = self.burst
+        self._updated = self._now()
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def _now() -> float:
+        return time.monotonic()
+
+    def reserve(self) -> float:
+        with self._lock:
+            now = self._now()
+            self._tokens, wait = _take(self._tokens, self._updated, now, self.rate, self.burst)
+            self._updated = now
+            return wait
+
+    @classmethod
+    def shared(cls, name: str, rate: float, burst: float | None = None) -> RateLimiter:
+        """Return the process-wide limiter called ``name``, creating it on first use.
+
+        Every caller asking for the same name draws from one bucket, so they must agree
+        on its settings: a later call with a different ``rate`` or ``burst`` raises
+        :class:`InvalidConfigError` rather than changing the budget of clients already
+        using it. Pass a ``RateLimiter`` instance instead for a separate budget.
+        """
+        requested = cls(rate, burst)
+        with cls._shared_lock:
+            limiter = cls._shared.get(name)
+            if limiter is None:
+                limiter = cls._shared[name] = requested
+            elif (limiter.rate, limiter.burst) != (requested.rate, requested.burst):
+                raise InvalidConfigError(
+                    f"Rate limiter '{name}' is already shared at rate={limiter.rate}, burst={limiter.burst}; "
+                    f"cannot reuse it with rate={requested.rate}, burst={requested.burst}. "
+                    "Pass a RateLimiter instance for a separate budget."
+                )
+            return limiter
+
+
+class SQLiteRateLimiter(_TokenBucket, _SQLiteStore):
+    """Token bucket stored in SQLite, so worker processes on one machine share a budget.
+
+    Each token is taken in its own ``BEGIN IMMEDIATE`` transaction. If the database
+    cannot be reached the request is let through rather than failed.
+
+    :param path: SQLite database file shared by the processes
+    :param rate: Tokens added per second, i.e. the sustained requests per second
+    :param burst: Bucket size. Defaults to ``max(1, rate)``.
+    :param name: Bucket name, so one file can hold budgets for several services
+    """
+
+    _schema = '''
+        CREATE TABLE IF NOT EXISTS buckets (
+            name TEXT PRIMARY KEY,
+            tokens REAL NOT NULL,
+            updated_at REAL NOT NULL
+        );
+    '''
+
+    def __init__(self, path: str, rate: float, burst: float | None = None, name: str = "default") -> None:
+        _TokenBucket.__init__(self, rate, burst)
+        _SQLiteStore.__init__(self, path)
+        self.name = name
+
+    @staticmethod
+    def _now() -> float:
+        # Wall-clock time, since the timestamp is compared across processes.
+        return time.time()
+
+    def reserve(self) -> float:
+        try:
+            with self._lock:
+                conn = self._connection()
+                conn.execute('BEGIN IMMEDIATE')
+                try:
+                    now = self._now()
+                    row = conn.execute('SELECT tokens, updated_at FROM buckets WHERE name = ?',
+                                       (self.name,)).fetchone()
+                    tokens, updated = row if row else (self.burst, now)
+                    tokens, wait = _take(tokens, updated, now, self.rate, self.burst)
+                    conn.execute('INSERT OR REPLACE INTO buckets (name, tokens, updated_at) VALUES (?, ?, ?)',
+                                 (self.name, tokens, now))
+                    conn.execute('COMMIT')
+                except BaseException:
+                    conn.execute('ROLLBACK')
+                    raise
+            return wait
+        except sqlite3.Error as e:
+            logger.debug(f"Rate limiter update failed: {e}")
+            return 0.0
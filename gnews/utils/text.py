@@ -0,0 +1,105 @@
+"""Fast HTML-to-text stripping for Google News descriptions.
+
+Google News descriptions are short, regular markup (anchors, ``<font>`` and list
+tags around plain text), so a regex pass plus :func:`html.unescape` produces the
+same text as ``BeautifulSoup(markup, "html.parser").get_text()`` at a fraction of
+the cost. Anything the fast path cannot reproduce exactly (comments, declarations,
+``<script>``/``<style>``, unterminated tags, malformed entities) is handed to
+BeautifulSoup, or to a stdlib parser when bs4 is not installed.
+"""
+from __future__ import annotations
+
+import html
+import re
+from html.entities import html5
+from html.parser import HTMLParser
+
+# Only well-formed tags; anything looser is left in place and routed to the fallback.
+_TAG = re.compile(
+    r'<[a-zA-Z][a-zA-Z0-9]*'
+    r'(?:\s+[^\s"\'>/=]+(?:\s*=\s*(?:"[^"]*"|\'[^\']*\'|[^\s"\'=<>`]+))?)*\s*/?>'
+    r'|</[a-zA-Z][a-zA-Z0-9]*\s*>'
+)
+# Markup whose text BeautifulSoup derives in ways a tag regex cannot match exactly.
+_COMPLEX = re.compile(r'<[!?]|</[^a-zA-Z]|<(?:script|style|pre|textarea)\b', re.IGNORECASE)
+_LEFTOVER_TAG = re.compile(r'</?[a-zA-Z]')
+_ASCII_SPACES = frozenset('\x20\x0a\x09\x0c\x0d')
+_CHARREF = re.compile(r'&(?:#([0-9]+);|#[xX]([0-9a-fA-F]+);|([a-zA-Z][a-zA-Z0-9]*;)|(?=[^a-zA-Z0-9#]|$))')
+# Named references html.unescape and html.parser agree on; control characters differ.
+_NAMED_REFS = frozenset(name for name, value in html5.items()
+                        if name.endswith(';') and all(ch == '\n' or ch >= ' ' for ch in value))
+
+
+def _charrefs_are_plain(text: str) -> bool:
+    """True when every ``&`` in ``text`` decodes identically under html.unescape and bs4."""
+    pos = text.find('&')
+    while pos != -1:
+        match = _CHARREF.match(text, pos)
+        if match is None:
+            return False
+        decimal, hexadecimal, name = match.groups()
+        if decimal or hexadecimal:
+            codepoint = int(decimal) if decimal else int(hexadecimal, 16)
+            if codepoint < 0x20 or codepoint == 0x7f:
+                return False
+        elif name and name not in _NAMED_REFS:
+            return False
+        pos = text.find('&', pos + 1)
+    return True
+
+
+class _TextExtractor(HTMLParser):
+    def __init__(self) -> None:
+        super().__init__(convert_charrefs=True)
+        self.parts: list[str] = []
+        self._skip = 0
+
+    def handle_starttag(self, tag, attrs):
+        if tag in ('script', 'style'):
+            self._skip += 1
+
+    def handle_endtag(self, tag):
+        if tag in ('script', 'style') and self._skip:
+            self._skip -= 1
+
+    def handle_data(self, data):
+        if not self._skip:
+            self.parts.append(data)
+
+
+def strip_html_slow(markup: str) -> str:
+    """Reference implementation: BeautifulSoup's ``get_text()``, or a stdlib parser without bs4."""
+    try:
+        from bs4 import BeautifulSoup
+    except ImportError:
+        parser = _TextExtractor()
+        parser.feed(markup)
+        parser.close()
+        text = ''.join(parser.parts)
+    else:
+        text = BeautifulSoup(markup, features="html.parser").get_text()
+    return text.replace('\xa0', ' ')
+
+
+def strip_html(markup: str) -> str:
+    """Return the text of an HTML fragment with entities decoded and ``\\xa0`` replaced by a space."""
+    if '<' not in markup and '&' not in markup and not _ASCII_SPACES.issuperset(markup):
+        return markup.replace('\xa0', ' ')
+    if _COMPLEX.search(markup):
+        return strip_html_slow(markup)
+    parts = []
+    # Each piece between two tags is one text node, which is how html.parser sees it.
+    for text in _TAG.split(markup):
+        if not text:
+            continue
+        if '<' in text and _LEFTOVER_TAG.search(text):
+            return strip_html_slow(markup)
+        if '&' in text:
+            if not _charrefs_are_plain(text):
+                return strip_html_slow(markup)
+            text = html.unescape(text)
+        if _ASCII_SPACES.issuperset(text):
+            # BeautifulSoup collapses whitespace-only text nodes.
+            text = '\n' if '\n' in text else ' '
+        parts.append(text)
+    return ''.join(parts).replace('\xa0', ' ')
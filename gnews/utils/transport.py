@@ -0,0 +1,256 @@
+from __future__ import annotations
+
+import functools
+import threading
+from contextlib import asynccontextmanager, contextmanager
+from typing import TYPE_CHECKING
+
+from gnews.exceptions import InvalidConfigError
+from gnews.utils import constants
+from gnews.utils.utils import _proxy_server
+
+if TYPE_CHECKING:
+    import feedparser
+    import requests
+
+
+def _accept_encoding() -> str:
+    # Only advertise brotli when a decoder is installed; urllib3 and httpx both pick it up.
+    for module in ('brotli', 'brotlicffi'):
+        try:
+            __import__(module)
+        except ImportError:
+            continue
+        return 'gzip, deflate, br'
+    return 'gzip, deflate'
+
+
+def conditional_headers(etag: str | None = None, modified: str | None = None) -> dict:
+    """Request headers that make a fetch conditional on the stored validators."""
+    headers = {}
+    if etag:
+        headers["If-None-Match"] = etag
+    if modified:
+        headers["If-Modified-Since"] = modified
+    return headers
+
+
+def parse_feed(status: int, content: bytes, headers) -> feedparser.FeedParserDict:
+    """Parse a downloaded feed into the shape ``feedparser.parse(url)`` returns.
+
+    feedparser only records the status and validators for requests it makes itself,
+    so they are copied over from the response.
+    """
+    import feedparser
+
+    headers = {k.lower(): v for k, v in headers.items()}
+    feed_data = feedparser.parse(b"" if status == 304 else content, response_headers=headers)
+    feed_data['status'] = status
+    for key, header in (('etag', 'etag'), ('modified', 'last-modified')):
+        if header in headers:
+            feed_data[key] = headers[header]
+    return feed_data
+
+
+class _HostSlots:
+    """Caps the requests in flight to each host; a host's semaphore is kept only while in use.
+
+    :param limit: Requests allowed in flight to one host
+    :param semaphore: ``threading.Semaphore`` or ``asyncio.Semaphore``
+    """
+
+    def __init__(self, limit: int, semaphore) -> None:
+        self.limit = limit
+        self._semaphore = semaphore
+        self._hosts: dict[tuple, list] = {}
+        self._lock = threading.Lock()
+
+    def _enter(self, url) -> tuple:
+        key = (url.scheme, url.host, url.port)
+        with self._lock:
+            entry = self._hosts.get(key)
+            if entry is None:
+                entry = self._hosts[key] = [self._semaphore(self.limit), 0]
+            entry[1] += 1
+            return key, entry[0]
+
+    def _exit(self, key: tuple) -> None:
+        with self._lock:
+            entry = self._hosts[key]
+            entry[1] -= 1
+            if not entry[1]:
+                del self._hosts[key]
+
+    @contextmanager
+    def hold(self, url):
+        key, semaphore = self._enter(url)
+        try:
+            with semaphore:
+                yield
+        finally:
+            self._exit(key)
+
+    @asynccontextmanager
+    async def hold_async(self, url):
+        key, semaphore = self._enter(url)
+        try:
+            async with semaphore:
+                yield
+        finally:
+            self._exit(key)
+
+
+@functools.lru_cache(maxsize=None)
+def _httpx_clients() -> tuple[type, type]:
+    """``httpx.Client`` and ``httpx.AsyncClient`` subclasses enforcing ``max_connections_per_host``.
+
+    httpx only limits connections across all hosts. Holding a per-host slot around
+    ``send()`` covers every request method and redirect-following, and leaves the
+    client's own transports, environment proxies included, as they are.
+    """
+    import asyncio
+
+    import httpx
+
+    class HostLimitedClient(httpx.Client):
+        def __init__(self, *, max_connections_per_host: int, **kwargs) -> None:
+            super().__init__(**kwargs)
+            self._host_slots = _HostSlots(max_connections_per_host, threading.Semaphore)
+
+        def send(self, request, **kwargs):
+            with self._host_slots.hold(request.url):
+                return super().send(request, **kwargs)
+
+    class HostLimitedAsyncClient(httpx.AsyncClient):
+        def __init__(self, *, max_connections_per_host: int, **kwargs) -> None:
+            super().__init__(**kwargs)
+            self._host_slots = _HostSlots(max_connections_per_host, asyncio.Semaphore)
+
+        async def send(self, request, **kwargs):
+            async with self._host_slots.hold_async(request.url):
+                return await super().send(request, **kwargs)
+
+    return HostLimitedClient, HostLimitedAsyncClient
+
+
+class Transport:
+    """Pooled HTTP client shared by feed fetches, the redirect fallback and SearchApi.
+
+    Connections are kept alive and reused per host, so repeat requests to
+    ``news.google.com`` skip the TCP and TLS handshakes (and the DNS lookup that
+    precedes a new connection). Responses are requested with gzip, and brotli when
+    a decoder is installed.
+
+    :param proxies: urllib-style proxy dict applied to every request
+    :param max_connections_per_host: Connections kept open to one host; further
+        requests to that host wait for a free connection. On the httpx clients
+        (``http2=True`` and :meth:`new_async_client`) it caps the requests in flight
+        to a host, which over HTTP/2 share one connection.
+    :param max_connections: Connections kept open across all hosts
+    :param http2: Use HTTP/2 where the server supports it. Requires ``httpx`` with
+        HTTP/2 support (``pip install gnews[http2]``).
+    :param timeout: Default request timeout in seconds
+    """
+
+    def __init__(self, proxies: dict | None = None, max_connections_per_host: int = 10,
+                 max_connections: int = 100, http2: bool = False, timeout: float = 30.0) -> None:
+        if max_connections_per_host <= 0 or max_connections <= 0:
+            raise InvalidConfigError("max_connections_per_host and max_connections must be positive integers.")
+        if http2:
+            try:
+                import h2  # noqa: F401
+                import httpx  # noqa: F401
+            except ImportError as e:
+                raise ImportError(
+                    "http2=True requires httpx with HTTP/2 support. "
+                    "Install it with: pip install gnews[http2]"
+                ) from e
+        self.proxies = proxies or None
+        self.max_connections_per_host = max_connections_per_host
+        self.max_connections = max_connections
+        self.http2 = http2
+        self.timeout = timeout
+        self.headers = {"User-Agent": constants.USER_AGENT, "Accept-Encoding": _accept_encoding()}
+        self._client = None
+        self._lock = threading.Lock()
+
+    def _sync_client(self):
+        with self._lock:
+            if self._client is None:
+                self._client = self._new_httpx_client() if self.http2 else self._new_session()
+            return self._client
+
+    def _new_session(self) -> requests.Session:
+        import requests
+        from requests.adapters import HTTPAdapter
+
+        session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=max(1, self.max_connections // self.max_connections_per_host),
+                              pool_maxsize=self.max_connections_per_host, pool_block=True)
+        session.mount("http://", adapter)
+        session.mount("https://", adapter)
+        session.headers.update(self.headers)
+        if self.proxies:
+            session.proxies.update(self.proxies)
+        return session
+
+    def _httpx_options(self) -> dict:
+        import httpx
+
+        return dict(
+            headers=self.headers,
+            proxy=_proxy_server(self.proxies),
+            follow_redirects=True,
+            timeout=self.timeout,
+            http2=self.http2,
+            limits=httpx.Limits(max_connections=self.max_connections,
+                                max_keepalive_connections=self.max_connections),
+            max_connections_per_host=self.max_connections_per_host,
+        )
+
+    def _new_httpx_client(self):
+        client, _ = _httpx_clients()
+        return client(**self._httpx_options())
+
+    def new_async_client(self):
+        """Return a new ``httpx.AsyncClient`` with this transport's settings, or None without httpx.
+
+        Async clients are bound to one event loop, so the caller owns and closes it.
+        """
+        try:
+            _, client = _httpx_clients()
+        except ImportError:
+            return None
+        return client(**self._httpx_options())
+
+    def get(self, url: str, params: dict | None = None, headers: dict | None = None,
+            timeout: float | None = None):
+        """GET ``url`` over the pool; returns a ``requests`` or ``httpx`` response."""
+        return self._sync_client().get(url, params=params, headers=headers,
+                                       timeout=self.timeout if timeout is None else timeout)
+
+    def head(self, url: str, timeout: float | None = None) -> str:
+        """Follow redirects from ``url`` with HEAD requests; returns the final URL."""
+        client = self._sync_client()
+        timeout = self.timeout if timeout is None else timeout
+        if self.http2:
+            return str(client.head(url, timeout=timeout).url)
+        return client.head(url, timeout=timeout, allow_redirects=True).url
+
+    def fetch_feed(self, url: str, etag: str | None = None, modified: str | None = None):
+        """Download and parse a feed, conditionally when validators are given."""
+        response = self.get(url, headers=conditional_headers(etag, modified))
+        return parse_feed(response.status_code, response.content, response.headers)
+
+    def close(self) -> None:
+        """Close pooled connections. The transport reconnects on next use."""
+        with self._lock:
+            client, self._client = self._client, None
+        if client is not None:
+            client.close()
+
+    def __enter__(self) -> Transport:
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
@@ -1,9 +1,11 @@
 from __future__ import annotations
 
+import asyncio
 import logging
 import re
 
-import requests
+from gnews.utils.cache import google_article_id
+from gnews.utils.domains import DomainIndex
 from gnews.utils.constants import AVAILABLE_COUNTRIES, AVAILABLE_LANGUAGES, GOOGLE_NEWS_REGEX
 
 logger = logging.getLogger(__name__)
@@ -17,6 +19,23 @@ def country_mapping(country):
     return AVAILABLE_COUNTRIES.get(country)
 
 
+_PLAYWRIGHT_USER_AGENT = ("Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 "
+                          "(KHTML, like Gecko) Chrome/124.0.0.0 Safari/537.36")
+_PLAYWRIGHT_LAUNCH_ARGS = ["--no-sandbox", "--disable-dev-shm-usage"]
+
+
+def _proxy_server(proxies: dict | None) -> str | None:
+    # Collapse a urllib-style proxy dict {"https": "http://host:port"} to a single server URL
+    if not proxies:
+        return None
+    return proxies.get("https") or proxies.get("http")
+
+
+def _navigate_url(url: str) -> str:
+    # Convert RSS URL to article URL for Playwright to follow JS redirect
+    return url.replace('/rss/articles/', '/articles/').split('?')[0]
+
+
 def _resolve_with_playwright(url: str, proxies: dict | None = None) -> str | None:
     try:
         from playwright.sync_api import sync_playwright, TimeoutError as PWTimeout
@@ -24,21 +43,19 @@ def _resolve_with_playwright(url: str, proxies: dict | None = None) -> str | Non
         return None
 
     try:
-        # Convert RSS URL to article URL for Playwright to follow JS redirect
-        navigate_url = url.replace('/rss/articles/', '/articles/').split('?')[0]
+        navigate_url = _navigate_url(url)
 
         # Convert urllib-style proxy dict {"https": "http://host:port"}
         # to Playwright proxy format {"server": "http://host:port"}
         playwright_proxy = None
-        if proxies:
-            server = proxies.get("https") or proxies.get("http")
-            if server:
-                playwright_proxy = {"server": server}
+        server = _proxy_server(proxies)
+        if server:
+            playwright_proxy = {"server": server}
 
         with sync_playwright() as p:
-            browser = p.chromium.launch(headless=True, args=["--no-sandbox", "--disable-dev-shm-usage"])
+            browser = p.chromium.launch(headless=True, args=_PLAYWRIGHT_LAUNCH_ARGS)
             context = browser.new_context(
-                user_agent="Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/124.0.0.0 Safari/537.36",
+                user_agent=_PLAYWRIGHT_USER_AGENT,
                 proxy=playwright_proxy,
             )
             page = context.new_page()
@@ -58,33 +75,184 @@ def _resolve_with_playwright(url: str, proxies: dict | None = None) -> str | Non
         return None
 
 
-def resolve_url(url: str, proxies: dict | None = None) -> str:
+async def _resolve_with_playwright_async(url: str, proxies: dict | None = None) -> str | None:
+    try:
+        from playwright.async_api import async_playwright, TimeoutError as PWTimeout
+    except ImportError:
+        return None
+
+    try:
+        server = _proxy_server(proxies)
+        playwright_proxy = {"server": server} if server else None
+
+        async with async_playwright() as p:
+            browser = await p.chromium.launch(headless=True, args=_PLAYWRIGHT_LAUNCH_ARGS)
+            context = await browser.new_context(
+                user_agent=_PLAYWRIGHT_USER_AGENT,
+                proxy=playwright_proxy,
+            )
+            page = await context.new_page()
+            await page.goto(_navigate_url(url), wait_until="domcontentloaded", timeout=15000)
+            try:
+                await page.wait_for_url(
+                    lambda u: "news.google.com" not in u,
+                    timeout=10000,
+                )
+            except PWTimeout:
+                pass
+            real_url = page.url
+            await browser.close()
+            return real_url if "news.google.com" not in real_url else None
+    except Exception as e:
+        logger.debug(f"Playwright URL resolution failed: {e}")
+        return None
+
+
+def _throttle(rate_limiter) -> None:
+    """Wait for a token before a request to news.google.com, if a limiter is given."""
+    if rate_limiter is not None:
+        rate_limiter.acquire()
+
+
+async def _throttle_async(rate_limiter) -> None:
+    if rate_limiter is not None:
+        await rate_limiter.acquire_async()
+
+
+def resolve_url(url: str, proxies: dict | None = None, pool=None, rate_limiter=None) -> str:
     if "news.google.com" not in url:
         return url
+    if pool is not None:
+        resolved = pool.resolve(url, rate_limiter=rate_limiter)
+        return resolved if resolved else url
     try:
         from playwright.sync_api import sync_playwright  # noqa: F401
+        _throttle(rate_limiter)
         resolved = _resolve_with_playwright(url, proxies=proxies)
         return resolved if resolved else url
     except ImportError:
         return url
 
 
-def process_url(item, exclude_websites, proxies=None):
+async def resolve_url_async(url: str, proxies: dict | None = None, pool=None, rate_limiter=None) -> str:
+    if "news.google.com" not in url:
+        return url
+    if pool is not None:
+        resolved = await pool.resolve_async(url, rate_limiter=rate_limiter)
+    else:
+        try:
+            import playwright.async_api  # noqa: F401
+        except ImportError:
+            return url
+        await _throttle_async(rate_limiter)
+        resolved = await _resolve_with_playwright_async(url, proxies=proxies)
+    return resolved if resolved else url
+
+
+def _is_excluded(source: str, exclude_websites) -> bool:
+    if not exclude_websites:
+        return False
+    if not isinstance(exclude_websites, DomainIndex):
+        exclude_websites = DomainIndex(exclude_websites)
+    return exclude_websites.matches(source)
+
+
+def _follow_redirect(url: str, proxies: dict | None = None, transport=None) -> str:
+    if transport is not None:
+        return transport.head(url, timeout=5)
+    import requests
+
+    if proxies:
+        return requests.head(url, proxies=proxies, timeout=5, allow_redirects=True).url
+    return requests.head(url, timeout=5, allow_redirects=True).url
+
+
+def _resolve_google_link(url: str, proxies: dict | None = None, pool=None, transport=None,
+                         rate_limiter=None) -> str:
+    resolved = resolve_url(url, proxies=proxies, pool=pool, rate_limiter=rate_limiter)
+    if resolved != url:
+        return resolved
+    # fallback: try HEAD redirect (may still work in some environments)
+    try:
+        _throttle(rate_limiter)
+        return _follow_redirect(url, proxies, transport)
+    except Exception:
+        return url
+
+
+async def _resolve_google_link_async(url: str, proxies: dict | None = None, client=None, pool=None,
+                                     rate_limiter=None) -> str:
+    resolved = await resolve_url_async(url, proxies=proxies, pool=pool, rate_limiter=rate_limiter)
+    if resolved != url:
+        return resolved
+    try:
+        await _throttle_async(rate_limiter)
+        if client is not None:
+            response = await client.head(url, timeout=5, follow_redirects=True)
+            return str(response.url)
+        return await asyncio.to_thread(_follow_redirect, url, proxies)
+    except Exception:
+        return url
+
+
+def _store_resolution(cache, article_id: str, resolved: str) -> None:
+    # Anything that still points at Google News is a failed resolution and gets the short TTL
+    cache.set(article_id, None if re.match(GOOGLE_NEWS_REGEX, resolved) else resolved)
+
+
+def resolve_link(url: str, proxies: dict | None = None, cache=None, pool=None, transport=None,
+                 rate_limiter=None) -> str:
+    """Resolve a Google News link to the publisher URL, consulting ``cache`` first.
+
+    Links that do not point at Google News are returned unchanged. ``transport`` is an
+    optional ``Transport`` whose pooled connections carry the HEAD redirect fallback.
+    ``rate_limiter`` is the Google News token bucket; each browser navigation and HEAD
+    request takes a token, cache hits do not.
+    """
+    if not re.match(GOOGLE_NEWS_REGEX, url):
+        return url
+    article_id = google_article_id(url) if cache is not None else None
+    if article_id:
+        hit, cached = cache.get(article_id)
+        if hit:
+            return cached or url
+    resolved = _resolve_google_link(url, proxies, pool, transport, rate_limiter)
+    if article_id:
+        _store_resolution(cache, article_id, resolved)
+    return resolved
+
+
+async def resolve_link_async(url: str, proxies: dict | None = None, client=None, cache=None, pool=None,
+                             rate_limiter=None) -> str:
+    """Async version of :func:`resolve_link`."""
+    if not re.match(GOOGLE_NEWS_REGEX, url):
+        return url
+    article_id = google_article_id(url) if cache is not None else None
+    if article_id:
+        hit, cached = cache.get(article_id)
+        if hit:
+            return cached or url
+    resolved = await _resolve_google_link_async(url, proxies, client, pool, rate_limiter)
+    if article_id:
+        _store_resolution(cache, article_id, resolved)
+    return resolved
+
+
+def process_url(item, exclude_websites, proxies=None, cache=None, pool=None, transport=None):
     source = item.get('source').get('href')
-    if not all([not re.match(website, source) for website in
-                [f'^http(s)?://(www.)?{website.lower()}.*' for website in exclude_websites]]):
+    if _is_excluded(source, exclude_websites):
         return
-    url = item.get('link')
-    if re.match(GOOGLE_NEWS_REGEX, url):
-        resolved = resolve_url(url, proxies=proxies)
-        if resolved != url:
-            return resolved
-        # fallback: try HEAD redirect (may still work in some environments)
-        try:
-            if proxies:
-                url = requests.head(url, proxies=proxies, timeout=5, allow_redirects=True).url
-            else:
-                url = requests.head(url, timeout=5, allow_redirects=True).url
-        except Exception:
-            pass
-    return url
+    return resolve_link(item.get('link'), proxies, cache, pool, transport)
+
+
+async def process_url_async(item, exclude_websites, proxies=None, client=None, cache=None, pool=None):
+    """Non-blocking counterpart of :func:`process_url`.
+
+    ``client`` is an optional ``httpx.AsyncClient`` used for the HEAD redirect
+    fallback; without one the fallback runs in a worker thread. ``pool`` is an
+    optional ``BrowserPool`` that replaces the per-URL Playwright launch.
+    """
+    source = item.get('source').get('href')
+    if _is_excluded(source, exclude_websites):
+        return
+    return await resolve_link_async(item.get('link'), proxies, client, cache, pool)
@@ -0,0 +1,156 @@
+from __future__ import annotations
+
+import datetime
+import json
+import logging
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
+
+from gnews.article import _json_default
+from gnews.exceptions import InvalidConfigError
+from gnews.utils.cache import _SQLiteStore
+
+logger = logging.getLogger(__name__)
+
+
+class CachedFeed:
+    """Validators of the last fetch of a feed, with the articles it produced.
+
+    :param etag: ``ETag`` response header, sent back as ``If-None-Match``
+    :param modified: ``Last-Modified`` response header, sent back as ``If-Modified-Since``
+    :param articles: Processed articles returned when the server answers 304
+    :param entries: Feed entries the page held before filtering, defaults to ``len(articles)``
+    :param earliest: Earliest publication date among those entries
+    :param keys: Dedup key of each article, when the client has a dedup store
+    """
+
+    __slots__ = ('etag', 'modified', 'articles', 'entries', 'earliest', 'keys')
+
+    def __init__(self, etag: str | None, modified: str | None, articles: list, entries: int | None = None,
+                 earliest: datetime.datetime | None = None, keys: list[int | None] | None = None) -> None:
+        self.etag = etag
+        self.modified = modified
+        self.articles = articles
+        self.entries = len(articles) if entries is None else entries
+        self.earliest = earliest
+        self.keys = keys
+
+    def request_kwargs(self) -> dict:
+        """Keyword arguments for ``GNews._fetch_feed`` to make the request conditional."""
+        return {key: value for key, value in (('etag', self.etag), ('modified', self.modified)) if value}
+
+
+class MemoryValidatorStore:
+    """In-process store of feed validators and processed articles, least recently used first out.
+
+    Articles are kept in memory as the client stored them: copies of the ones it
+    returned, lazily resolved URLs included, so a 304 skips serialisation.
+
+    :param max_entries: Number of feed URLs remembered
+    """
+
+    def __init__(self, max_entries: int = 1024) -> None:
+        if max_entries <= 0:
+            raise InvalidConfigError("max_entries must be a positive integer.")
+        self.max_entries = max_entries
+        self._entries: OrderedDict[str, CachedFeed] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: str) -> CachedFeed | None:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                self._entries.move_to_end(key)
+            return entry
+
+    def set(self, key: str, entry: CachedFeed) -> None:
+        with self._lock:
+            self._entries[key] = entry
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
+class SQLiteValidatorStore(_SQLiteStore):
+    """Feed validators and processed articles persisted in SQLite, shared across runs and processes.
+
+    Articles are stored as JSON and come back as plain dicts.
+
+    :param path: SQLite database file, or ``':memory:'``
+    :param max_entries: Upper bound on stored feeds; the least recently written are evicted first
+    """
+
+    _schema = '''
+        CREATE TABLE IF NOT EXISTS feeds (
+            key TEXT PRIMARY KEY,
+            etag TEXT,
+            modified TEXT,
+            articles TEXT NOT NULL,
+            entries INTEGER,
+            earliest TEXT,
+            dedup_keys TEXT,
+            updated_at REAL NOT NULL
+        );
+        CREATE INDEX IF NOT EXISTS feeds_updated_at ON feeds (updated_at);
+    '''
+
+    _EVICT_EVERY = 128
+
+    def __init__(self, path: str, max_entries: int = 10_000) -> None:
+        if max_entries <= 0:
+            raise InvalidConfigError("max_entries must be a positive integer.")
+        super().__init__(path)
+        self.max_entries = max_entries
+        self._writes = 0
+
+    def get(self, key: str) -> CachedFeed | None:
+        try:
+            rows = self._execute('SELECT etag, modified, articles, entries, earliest, dedup_keys FROM feeds '
+                                 'WHERE key = ?', (key,))
+        except sqlite3.Error as e:
+            logger.debug(f"Validator store read failed: {e}")
+            return None
+        if not rows:
+            return None
+        etag, modified, articles, entries, earliest, keys = rows[0]
+        return CachedFeed(etag, modified, json.loads(articles), entries,
+                          datetime.datetime.fromisoformat(earliest) if earliest else None,
+                          json.loads(keys) if keys is not None else None)
+
+    def set(self, key: str, entry: CachedFeed) -> None:
+        articles = json.dumps(entry.articles, ensure_ascii=False, default=_json_default)
+        earliest = entry.earliest.isoformat() if entry.earliest is not None else None
+        keys = json.dumps(entry.keys) if entry.keys is not None else None
+        try:
+            self._execute('INSERT OR REPLACE INTO feeds '
+                          '(key, etag, modified, articles, entries, earliest, dedup_keys, updated_at) '
+                          'VALUES (?, ?, ?, ?, ?, ?, ?, ?)',
+                          (key, entry.etag, entry.modified, articles, entry.entries, earliest, keys, time.time()))
+            self._writes += 1
+            if self._writes % self._EVICT_EVERY == 0:
+                self.evict()
+        except sqlite3.Error as e:
+            logger.debug(f"Validator store write failed: {e}")
+
+    def evict(self) -> None:
+        """Trim to ``max_entries``, dropping the feeds written longest ago."""
+        (count,), = self._execute('SELECT COUNT(*) FROM feeds')
+        if count > self.max_entries:
+            self._execute('DELETE FROM feeds WHERE key IN (SELECT key FROM feeds ORDER BY updated_at LIMIT ?)',
+                          (count - self.max_entries,))
+
+    def clear(self) -> None:
+        self._execute('DELETE FROM feeds')
+
+    def __len__(self) -> int:
+        (count,), = self._execute('SELECT COUNT(*) FROM feeds')
+        return count
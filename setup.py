@@ -19,11 +19,15 @@ setup(
     description='Provide an API to search for articles on Google News and returns a usable JSON response.',
     long_description=long_description,
     long_description_content_type="text/markdown",
-    packages=find_packages(),
+    packages=find_packages(exclude=["benchmarks", "benchmarks.*"]),
     install_requires=requirements,
     extras_require={
         "fulltext": ["trafilatura>=1.6", "lxml_html_clean>=0.3"],
         "playwright": ["playwright>=1.40"],
+        "async": ["httpx>=0.26"],
+        "http2": ["httpx[http2]>=0.26"],
+        "brotli": ["brotli>=1.0"],
+        "zstd": ["zstandard>=0.22"],
     },
     entry_points={
         "console_scripts": [
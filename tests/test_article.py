@@ -0,0 +1,126 @@
+import csv
+import json
+import os
+import pickle
+import tempfile
+import unittest
+from types import SimpleNamespace
+from unittest.mock import patch
+
+from gnews import Article, GNews
+from gnews.exceptions import InvalidConfigError
+
+REAL_URL = "https://www.washingtonpost.com/politics/2026/06/15/article"
+
+
+def _article(title="Title", publisher=None):
+    return {
+        "title": title,
+        "description": "Summary",
+        "published date": "Mon, 10 Jun 2026 10:00:00 GMT",
+        "url": REAL_URL,
+        "publisher": publisher or {"href": "https://www.washingtonpost.com", "title": "Washington Post"},
+    }
+
+
+def _entry(title="Title"):
+    return {
+        "title": title,
+        "link": "https://news.google.com/rss/articles/CBMi",
+        "published": "Mon, 10 Jun 2026 10:00:00 GMT",
+        "description": "<b>Summary</b>",
+        "source": {"href": "https://www.washingtonpost.com", "title": "Washington Post"},
+    }
+
+
+class TestArticle(unittest.TestCase):
+    def test_dict_access(self):
+        data = _article()
+        article = Article(data)
+        self.assertEqual(article["title"], "Title")
+        self.assertEqual(article["published date"], data["published date"])
+        self.assertEqual(article.get("missing", "x"), "x")
+        self.assertEqual(list(article.keys()), list(data))
+        self.assertEqual(dict(article), data)
+        self.assertEqual(article, data)
+        self.assertIn("url", article)
+        self.assertEqual(len(article), 5)
+        with self.assertRaises(KeyError):
+            article["missing"]
+
+    def test_attribute_access(self):
+        article = Article(_article())
+        self.assertEqual(article.title, "Title")
+        self.assertEqual(article.url, REAL_URL)
+        self.assertEqual(article.publisher["title"], "Washington Post")
+
+    def test_extra_keys_keep_their_order(self):
+        data = {"title": "T", "description": "", "published date": "", "iso_date": "2026-06-10",
+                "url": REAL_URL, "publisher": "Reuters", "thumbnail": "", "favicon": "", "rank": 2}
+        article = Article(data)
+        self.assertEqual(list(article), list(data))
+        self.assertEqual(article["rank"], 2)
+        self.assertEqual(article.to_dict(), data)
+
+    def test_immutable(self):
+        article = Article(_article())
+        with self.assertRaises(AttributeError):
+            article.title = "Other"
+        with self.assertRaises(TypeError):
+            article["title"] = "Other"
+
+    def test_publisher_interned(self):
+        first = Article(_article("One"))
+        second = Article(_article("Two"))
+        self.assertIs(first._publisher, second._publisher)
+        # Callers get their own dict, so mutating it cannot leak into other articles.
+        first["publisher"]["title"] = "Changed"
+        self.assertEqual(second["publisher"]["title"], "Washington Post")
+
+    def test_string_publisher_interned(self):
+        name = "".join(["Reu", "ters"])
+        self.assertIs(Article(_article(publisher=name)).publisher, Article(_article(publisher="Reuters")).publisher)
+
+    def test_pickle_round_trip(self):
+        article = Article(_article())
+        self.assertEqual(pickle.loads(pickle.dumps(article)), article)
+
+
+class TestCompactMode(unittest.TestCase):
+    def setUp(self):
+        self.g = GNews(compact_articles=True, max_workers=1)
+        self.feed = SimpleNamespace(status=200, entries=[_entry(f"Title {i}") for i in range(3)])
+
+    @patch("gnews.gnews.resolve_link", return_value=REAL_URL)
+    def test_get_news_returns_records(self, _):
+        with patch.object(self.g, "_fetch_feed", return_value=self.feed):
+            articles = self.g.get_news("AI")
+        self.assertEqual(len(articles), 3)
+        self.assertTrue(all(isinstance(a, Article) for a in articles))
+        self.assertEqual(articles[0]["description"], "Summary")
+        self.assertEqual(articles[0]["url"], REAL_URL)
+
+    def test_searchapi_results_converted(self):
+        g = GNews(compact_articles=True, searchapi_key="key")
+        with patch.object(g._searchapi, "get_news", return_value=[_article()]):
+            articles = g.get_news("AI")
+        self.assertIsInstance(articles[0], Article)
+
+    def test_rejects_lazy_urls(self):
+        with self.assertRaises(InvalidConfigError):
+            GNews(compact_articles=True, lazy_urls=True)
+
+    def test_save_to_json_and_csv(self):
+        articles = [Article(_article("One")), Article(_article("Two"))]
+        with tempfile.TemporaryDirectory() as tmp:
+            json_path = self.g.save_to_json(articles, os.path.join(tmp, "a.json"))
+            with open(json_path, encoding="utf-8") as f:
+                self.assertEqual(json.load(f), [dict(a) for a in articles])
+            csv_path = self.g.save_to_csv(articles, os.path.join(tmp, "a.csv"))
+            with open(csv_path, newline="", encoding="utf-8") as f:
+                rows = list(csv.DictReader(f))
+        self.assertEqual([row["title"] for row in rows], ["One", "Two"])
+
+
+if __name__ == '__main__':
+    unittest.main()
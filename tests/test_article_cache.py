@@ -0,0 +1,190 @@
+import os
+import tempfile
+import time
+import unittest
+from unittest.mock import MagicMock, patch
+
+from gnews import ArticleCache, GNews
+from gnews.exceptions import InvalidConfigError, NetworkError
+
+MOCK_HTML = b"""
+<html><body>
+<article>
+<h1>AI Transforms Healthcare</h1>
+<p>Artificial intelligence is revolutionizing how doctors diagnose diseases.</p>
+<p>New research shows that AI models outperform radiologists in detecting cancer.</p>
+<p>The study was conducted across 50 hospitals with 10,000 patients.</p>
+</article>
+</body></html>
+"""
+
+URL = "https://example.com/ai-healthcare"
+
+
+def _response(content=MOCK_HTML, status=200, headers=None):
+    return MagicMock(status_code=status, content=content, headers=headers or {})
+
+
+class TestArticleCache(unittest.TestCase):
+    def setUp(self):
+        self.tmpdir = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.tmpdir.name, "articles.db")
+
+    def tearDown(self):
+        self.tmpdir.cleanup()
+
+    def test_round_trip_by_canonical_url(self):
+        cache = ArticleCache(self.path)
+        cache.set(URL + "/?utm_source=feed#top", MOCK_HTML, "Text", etag='"v1"')
+        entry = cache.get("HTTPS://EXAMPLE.COM/ai-healthcare")
+        self.assertTrue(entry.fresh)
+        self.assertEqual((entry.text, entry.etag), ("Text", '"v1"'))
+        self.assertEqual(cache.html(URL), MOCK_HTML)
+        self.assertEqual(cache.stats()["hits"], 1)
+
+    def test_html_is_compressed(self):
+        cache = ArticleCache(self.path)
+        html = b"<p>" + b"repeated words " * 1000 + b"</p>"
+        cache.set(URL, html, None)
+        self.assertLess(cache.size(), len(html) // 10)
+
+    def test_failed_extraction_uses_failure_ttl(self):
+        cache = ArticleCache(self.path, ttl=3600, failure_ttl=60)
+        cache.set(URL, MOCK_HTML, None)
+        entry = cache.get(URL)
+        self.assertIsNone(entry.text)
+        self.assertLess(entry.expires_at, time.time() + 61)
+
+    def test_stale_entry_is_kept_for_revalidation(self):
+        cache = ArticleCache(self.path, ttl=3600)
+        cache.set(URL, MOCK_HTML, "Text")
+        with patch("gnews.utils.fulltext.time.time", return_value=time.time() + 7200):
+            entry = cache.get(URL)
+            self.assertFalse(entry.fresh)
+            cache.refresh(URL, entry)
+            self.assertTrue(cache.get(URL).fresh)
+        self.assertEqual(cache.revalidated, 1)
+
+    def test_evicts_least_recently_used_over_budget(self):
+        cache = ArticleCache(self.path, max_bytes=300)
+        for i, t in enumerate((100.0, 200.0, 300.0)):
+            with patch("gnews.utils.fulltext.time.time", return_value=t):
+                cache.set(f"https://example.com/{i}", os.urandom(60), "x" * 20)
+        with patch("gnews.utils.fulltext.time.time", return_value=400.0):
+            cache.get("https://example.com/0")
+            cache.set("https://example.com/3", os.urandom(60), "x" * 20)
+        self.assertLessEqual(cache.size(), 300)
+        self.assertIsNotNone(cache.get("https://example.com/0"))
+        self.assertIsNone(cache.get("https://example.com/1"))
+        self.assertIsNotNone(cache.get("https://example.com/3"))
+
+    def test_eviction_trims_to_low_water_mark(self):
+        cache = ArticleCache(self.path)
+        with patch("gnews.utils.fulltext.time.time", return_value=100.0):
+            cache.set(URL, b"", "x" * 100)
+        cache.max_bytes = 10 * cache.size()
+        for i in range(10):
+            with patch("gnews.utils.fulltext.time.time", return_value=101.0 + i):
+                cache.set(f"https://example.com/{i}", b"", "x" * 100)
+        # Crossing the budget evicts down to 90% of it, so the next write fits without evicting.
+        self.assertEqual(len(cache), 9)
+        self.assertIsNone(cache.get(URL))
+        cache.set("https://example.com/new", b"", "x" * 100)
+        self.assertEqual(len(cache), 10)
+
+    def test_size_tracks_replacements_and_deletes(self):
+        cache = ArticleCache(self.path)
+        cache.set(URL, MOCK_HTML, "Text")
+        cache.set(URL, MOCK_HTML, "Longer text")
+        cache.set("https://example.com/other", MOCK_HTML, None)
+        cache.reextract(lambda html: "Upgraded")
+        (total,), = cache._execute("SELECT SUM(size) FROM articles")
+        self.assertEqual(cache.size(), total)
+        cache.clear()
+        self.assertEqual(cache.size(), 0)
+
+    def test_reextract_offline(self):
+        cache = ArticleCache(self.path)
+        cache.set(URL, MOCK_HTML, None)
+        cache.set("https://example.com/other", MOCK_HTML, "Old")
+        with patch("gnews.utils.transport.Transport.get") as get:
+            changed = cache.reextract(lambda html: "Upgraded " + str(len(html)))
+        get.assert_not_called()
+        self.assertEqual(changed, 2)
+        self.assertTrue(cache.get(URL).text.startswith("Upgraded"))
+        self.assertGreater(cache.get(URL).expires_at, time.time() + 3600)
+
+    def test_reextract_in_batches(self):
+        cache = ArticleCache(self.path)
+        for i in range(5):
+            cache.set(f"https://example.com/{i}", MOCK_HTML, None)
+        with patch.object(ArticleCache, "_REEXTRACT_BATCH", 2):
+            self.assertEqual(cache.reextract(lambda html: "Text"), 5)
+        self.assertEqual({cache.get(f"https://example.com/{i}").text for i in range(5)}, {"Text"})
+
+    def test_shared_across_instances(self):
+        ArticleCache(self.path).set(URL, MOCK_HTML, "Text")
+        self.assertEqual(ArticleCache(self.path).get(URL).text, "Text")
+
+    def test_validation(self):
+        with self.assertRaises(InvalidConfigError):
+            ArticleCache(self.path, ttl=0)
+        with self.assertRaises(InvalidConfigError):
+            ArticleCache(self.path, max_bytes=0)
+
+
+class TestClientArticleCache(unittest.TestCase):
+    def setUp(self):
+        self.tmpdir = tempfile.TemporaryDirectory()
+        self.cache = ArticleCache(os.path.join(self.tmpdir.name, "articles.db"), ttl=3600)
+        self.gnews = GNews(article_cache=self.cache)
+
+    def tearDown(self):
+        self.gnews.close()
+        self.cache.close()
+        self.tmpdir.cleanup()
+
+    def test_fresh_hit_skips_network(self):
+        with patch.object(self.gnews._transport, "get", return_value=_response()) as get:
+            first = self.gnews.get_full_article(URL)
+            second = self.gnews.get_full_article(URL)
+        self.assertEqual(get.call_count, 1)
+        self.assertEqual(first, second)
+        self.assertIn("revolutionizing", second["text"])
+
+    def test_stale_entry_revalidated(self):
+        headers = {"ETag": '"v1"', "Last-Modified": "Mon, 15 Jun 2026 10:00:00 GMT"}
+        with patch.object(self.gnews._transport, "get", return_value=_response(headers=headers)):
+            self.gnews.get_full_article(URL)
+        with patch("gnews.utils.fulltext.time.time", return_value=time.time() + 7200), \
+             patch.object(self.gnews._transport, "get", return_value=_response(b"", status=304)) as get, \
+             patch("gnews.gnews.extract_text") as extract:
+            article = self.gnews.get_full_article(URL)
+        self.assertEqual(get.call_args.kwargs["headers"],
+                         {"If-None-Match": '"v1"', "If-Modified-Since": "Mon, 15 Jun 2026 10:00:00 GMT"})
+        extract.assert_not_called()
+        self.assertIn("revolutionizing", article["text"])
+
+    def test_negative_entry(self):
+        with patch.object(self.gnews._transport, "get", return_value=_response(b"<html></html>")) as get:
+            for _ in range(2):
+                with self.assertRaises(NetworkError):
+                    self.gnews.get_full_article(URL)
+        self.assertEqual(get.call_count, 1)
+
+    def test_bulk_uses_cache(self):
+        self.cache.set(URL, MOCK_HTML, "Cached text")
+        with patch.object(self.gnews._transport, "get", return_value=_response()) as get:
+            results = self.gnews.get_full_articles([URL, "https://example.com/new"], processes=0)
+        self.assertEqual(results[0]["text"], "Cached text")
+        self.assertEqual(get.call_count, 1)
+        self.assertIsNotNone(self.cache.get("https://example.com/new"))
+
+    def test_path_argument(self):
+        g = GNews(article_cache=os.path.join(self.tmpdir.name, "other.db"))
+        self.assertIsInstance(g._article_cache, ArticleCache)
+        g._article_cache.close()
+
+
+if __name__ == '__main__':
+    unittest.main()
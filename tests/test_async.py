@@ -1,8 +1,10 @@
 import asyncio
 import unittest
+from types import SimpleNamespace
 from unittest.mock import AsyncMock, patch, MagicMock
 
 from gnews import GNews
+from gnews.exceptions import RateLimitError
 
 
 SAMPLE_ARTICLES = [
@@ -27,92 +29,133 @@ def run(coro):
     return asyncio.get_event_loop().run_until_complete(coro)
 
 
+RSS_BODY = b"""<?xml version="1.0" encoding="UTF-8"?>
+<rss version="2.0"><channel><title>Google News</title>
+<item>
+<title>AI Breakthrough - TechNews</title>
+<link>https://example.com/ai</link>
+<pubDate>Mon, 10 Jun 2026 10:00:00 GMT</pubDate>
+<description>&lt;a href="https://example.com/ai"&gt;AI Breakthrough&lt;/a&gt;&amp;nbsp;&amp;nbsp;TechNews</description>
+<source url="https://technews.example.com">TechNews</source>
+</item>
+</channel></rss>
+"""
+
+
+def _feed(status: int = 200, entries=None):
+    return SimpleNamespace(status=status, entries=entries or [])
+
+
+def _entry(link: str) -> dict:
+    return {
+        "title": "Title",
+        "link": link,
+        "published": "Mon, 10 Jun 2026 10:00:00 GMT",
+        "description": "<b>Summary</b>",
+        "source": {"href": "https://example.com", "title": "Example"},
+    }
+
+
 class TestAsyncGetNews(unittest.TestCase):
-    @patch("gnews.GNews.get_news", return_value=SAMPLE_ARTICLES)
+    @patch("gnews.GNews._get_news_async", new_callable=AsyncMock, return_value=SAMPLE_ARTICLES)
     def test_async_get_news_returns_list(self, mock):
         g = GNews(max_results=2)
         result = run(g.get_news_async("AI"))
         self.assertIsInstance(result, list)
         self.assertEqual(len(result), 2)
 
-    @patch("gnews.GNews.get_news", return_value=SAMPLE_ARTICLES)
+    @patch("gnews.GNews._get_news_async", new_callable=AsyncMock, return_value=SAMPLE_ARTICLES)
     def test_async_get_news_title(self, mock):
         g = GNews(max_results=2)
         result = run(g.get_news_async("AI"))
         self.assertEqual(result[0]["title"], "AI Breakthrough")
 
-    @patch("gnews.GNews.get_news", return_value=SAMPLE_ARTICLES)
+    @patch("gnews.GNews._get_news_async", new_callable=AsyncMock, return_value=SAMPLE_ARTICLES)
     def test_async_get_news_passes_query(self, mock):
         g = GNews(max_results=2)
-        run(g.get_news_async("Python"))
-        mock.assert_called_once_with("Python", 1)
+        run(g.get_news_async("Python news"))
+        mock.assert_called_once_with("/search?q=Python%20news")
 
-    @patch("gnews.GNews.get_news", return_value=SAMPLE_ARTICLES)
-    def test_async_get_news_passes_page(self, mock):
+    @patch("gnews.GNews.get_news")
+    @patch("gnews.GNews._get_news_async", new_callable=AsyncMock, return_value=SAMPLE_ARTICLES)
+    def test_async_get_news_does_not_call_sync(self, mock_async, mock_sync):
         g = GNews(max_results=2)
-        run(g.get_news_async("Python", page=3))
-        mock.assert_called_once_with("Python", 3)
+        run(g.get_news_async("Python"))
+        mock_sync.assert_not_called()
+
+    def test_async_get_news_passes_page_to_searchapi(self):
+        g = GNews(max_results=2, searchapi_key="test-key")
+        with patch.object(g._searchapi, "get_news", return_value=SAMPLE_ARTICLES) as mock:
+            run(g.get_news_async("Python", page=3))
+        self.assertEqual(mock.call_args.kwargs["query"], "Python")
+        self.assertEqual(mock.call_args.kwargs["page"], 3)
+
+    def test_async_get_news_empty_key_raises(self):
+        from gnews.exceptions import InvalidConfigError
+        g = GNews()
+        with self.assertRaises(InvalidConfigError):
+            run(g.get_news_async(""))
 
 
 class TestAsyncGetTopNews(unittest.TestCase):
-    @patch("gnews.GNews.get_top_news", return_value=SAMPLE_ARTICLES)
+    @patch("gnews.GNews._get_news_async", new_callable=AsyncMock, return_value=SAMPLE_ARTICLES)
     def test_async_get_top_news_returns_list(self, mock):
         g = GNews(max_results=2)
         result = run(g.get_top_news_async())
         self.assertIsInstance(result, list)
         self.assertEqual(len(result), 2)
 
-    @patch("gnews.GNews.get_top_news", return_value=SAMPLE_ARTICLES)
-    def test_async_get_top_news_calls_sync(self, mock):
+    @patch("gnews.GNews._get_news_async", new_callable=AsyncMock, return_value=SAMPLE_ARTICLES)
+    def test_async_get_top_news_fetches_top_feed(self, mock):
         g = GNews()
         run(g.get_top_news_async())
-        mock.assert_called_once()
+        mock.assert_called_once_with("?")
 
 
 class TestAsyncGetNewsByTopic(unittest.TestCase):
-    @patch("gnews.GNews.get_news_by_topic", return_value=SAMPLE_ARTICLES)
+    @patch("gnews.GNews._get_news_async", new_callable=AsyncMock, return_value=SAMPLE_ARTICLES)
     def test_returns_list(self, mock):
         g = GNews()
         result = run(g.get_news_by_topic_async("TECHNOLOGY"))
         self.assertIsInstance(result, list)
 
-    @patch("gnews.GNews.get_news_by_topic", return_value=SAMPLE_ARTICLES)
+    @patch("gnews.GNews._get_news_async", new_callable=AsyncMock, return_value=SAMPLE_ARTICLES)
     def test_passes_topic(self, mock):
         g = GNews()
-        run(g.get_news_by_topic_async("BUSINESS"))
-        mock.assert_called_once_with("BUSINESS")
+        run(g.get_news_by_topic_async("business"))
+        mock.assert_called_once_with("/headlines/section/topic/BUSINESS?")
 
 
 class TestAsyncGetNewsByLocation(unittest.TestCase):
-    @patch("gnews.GNews.get_news_by_location", return_value=SAMPLE_ARTICLES)
+    @patch("gnews.GNews._get_news_async", new_callable=AsyncMock, return_value=SAMPLE_ARTICLES)
     def test_returns_list(self, mock):
         g = GNews()
         result = run(g.get_news_by_location_async("Pakistan"))
         self.assertIsInstance(result, list)
 
-    @patch("gnews.GNews.get_news_by_location", return_value=SAMPLE_ARTICLES)
+    @patch("gnews.GNews._get_news_async", new_callable=AsyncMock, return_value=SAMPLE_ARTICLES)
     def test_passes_location(self, mock):
         g = GNews()
         run(g.get_news_by_location_async("India"))
-        mock.assert_called_once_with("India")
+        mock.assert_called_once_with("/headlines/section/geo/India?")
 
 
 class TestAsyncGetNewsBySite(unittest.TestCase):
-    @patch("gnews.GNews.get_news_by_site", return_value=SAMPLE_ARTICLES)
+    @patch("gnews.GNews._get_news_async", new_callable=AsyncMock, return_value=SAMPLE_ARTICLES)
     def test_returns_list(self, mock):
         g = GNews()
         result = run(g.get_news_by_site_async("bbc.com"))
         self.assertIsInstance(result, list)
 
-    @patch("gnews.GNews.get_news_by_site", return_value=SAMPLE_ARTICLES)
+    @patch("gnews.GNews._get_news_async", new_callable=AsyncMock, return_value=SAMPLE_ARTICLES)
     def test_passes_site(self, mock):
         g = GNews()
         run(g.get_news_by_site_async("cnn.com"))
-        mock.assert_called_once_with("cnn.com")
+        mock.assert_called_once_with("/search?q=site:cnn.com")
 
 
 class TestAsyncConcurrent(unittest.TestCase):
-    @patch("gnews.GNews.get_news", return_value=SAMPLE_ARTICLES)
+    @patch("gnews.GNews._get_news_async", new_callable=AsyncMock, return_value=SAMPLE_ARTICLES)
     def test_gather_multiple_queries(self, mock):
         g = GNews()
         results = run(asyncio.gather(
@@ -123,3 +166,64 @@ class TestAsyncConcurrent(unittest.TestCase):
         self.assertEqual(len(results), 3)
         for r in results:
             self.assertIsInstance(r, list)
+
+
+class TestAsyncEngine(unittest.TestCase):
+    def test_retries_429_with_async_sleep(self):
+        g = GNews(max_retries=3, retry_backoff_base=0.01, retry_backoff_max=0.01)
+        calls = [_feed(429), _feed(200, entries=[_entry("https://example.com/a")])]
+        with patch.object(g, "_fetch_feed_async", new_callable=AsyncMock, side_effect=calls) as fetch, \
+             patch.object(g, "_sleep_async", new_callable=AsyncMock) as sleep, \
+             patch.object(g, "_sleep") as blocking_sleep:
+            result = run(g._get_news_async("/search?q=test"))
+        self.assertEqual([a["url"] for a in result], ["https://example.com/a"])
+        self.assertEqual(fetch.call_count, 2)
+        self.assertEqual(sleep.call_count, 1)
+        blocking_sleep.assert_not_called()
+
+    def test_raises_after_exhausting_retries(self):
+        g = GNews(max_retries=1, retry_backoff_base=0.01, retry_backoff_max=0.01)
+        with patch.object(g, "_fetch_feed_async", new_callable=AsyncMock, return_value=_feed(429)), \
+             patch.object(g, "_sleep_async", new_callable=AsyncMock) as sleep:
+            with self.assertRaises(RateLimitError):
+                run(g._get_news_async("/search?q=test"))
+        self.assertEqual(sleep.call_count, 1)
+
+    def test_does_not_block_on_sync_fetch(self):
+        g = GNews()
+        with patch.object(g, "_fetch_feed_async", new_callable=AsyncMock, return_value=_feed(200)), \
+             patch.object(g, "_fetch_feed") as blocking_fetch:
+            run(g._get_news_async("?"))
+        blocking_fetch.assert_not_called()
+
+    def test_walks_past_100_results(self):
+        g = GNews(max_results=150)
+        first = [dict(SAMPLE_ARTICLES[0], url=f"https://example.com/{i}") for i in range(100)]
+        second = [dict(SAMPLE_ARTICLES[1], url=f"https://example.com/{i}") for i in range(90, 190)]
+        with patch.object(g, "_get_page_async", new_callable=AsyncMock,
+                          side_effect=[(first, 100), (second, 100)]) as fetch:
+            result = run(g.get_news_async("AI"))
+        self.assertEqual(len(result), 150)
+        self.assertEqual(len({a["url"] for a in result}), 150)
+        self.assertIsNotNone(fetch.call_args_list[1].kwargs["window"])
+
+    def test_fetches_feed_over_httpx(self):
+        httpx = __import__("pytest").importorskip("httpx")
+        requested = []
+
+        def handler(request):
+            requested.append(str(request.url))
+            return httpx.Response(200, content=RSS_BODY)
+
+        async def scenario():
+            g = GNews()
+            g._http_async = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+            g._http_async_loop = asyncio.get_running_loop()
+            async with g:
+                return await g.get_top_news_async()
+
+        result = run(scenario())
+        self.assertEqual(len(result), 1)
+        self.assertEqual(result[0]["url"], "https://example.com/ai")
+        self.assertEqual(result[0]["description"], "AI Breakthrough  TechNews")
+        self.assertTrue(requested[0].startswith("https://news.google.com/rss?"))
@@ -0,0 +1,247 @@
+import asyncio
+import threading
+import time
+import unittest
+from unittest.mock import AsyncMock, patch
+
+from gnews import GNews
+from gnews.exceptions import InvalidConfigError, NetworkError
+
+
+def run(coro):
+    return asyncio.get_event_loop().run_until_complete(coro)
+
+
+def _articles_for(key):
+    return [{"title": key, "url": f"https://example.com/{key}"}]
+
+
+class TestGetNewsMany(unittest.TestCase):
+    def test_results_keyed_by_input_in_order(self):
+        g = GNews()
+        with patch.object(g, "get_news", side_effect=_articles_for):
+            results = g.get_news_many(["AI", "Python", "Pakistan"])
+        self.assertEqual(list(results), ["AI", "Python", "Pakistan"])
+        self.assertEqual(results["Python"][0]["title"], "Python")
+
+    def test_duplicate_inputs_fetched_once(self):
+        g = GNews()
+        with patch.object(g, "get_news", side_effect=_articles_for) as mock:
+            results = g.get_news_many(["AI", "AI", "Python"])
+        self.assertEqual(mock.call_count, 2)
+        self.assertEqual(len(results), 2)
+
+    def test_failure_is_per_item(self):
+        g = GNews()
+
+        def fetch(key):
+            if key == "bad":
+                raise NetworkError("boom")
+            return _articles_for(key)
+
+        with patch.object(g, "get_news", side_effect=fetch):
+            results = g.get_news_many(["good", "bad", "other"])
+        self.assertIsInstance(results["bad"], NetworkError)
+        self.assertEqual(results["other"][0]["title"], "other")
+
+    def test_kind_dispatches_to_matching_method(self):
+        g = GNews()
+        with patch.object(g, "get_news_by_topic", side_effect=_articles_for) as topic, \
+             patch.object(g, "get_news_by_site", side_effect=_articles_for) as site:
+            g.get_news_many(["BUSINESS"], kind="topic")
+            g.get_news_many(["bbc.com"], kind="site")
+        topic.assert_called_once_with("BUSINESS")
+        site.assert_called_once_with("bbc.com")
+
+    def test_invalid_topic_reported_not_raised(self):
+        g = GNews()
+        results = g.get_news_many(["NOT_A_TOPIC"], kind="topic")
+        self.assertIsInstance(results["NOT_A_TOPIC"], InvalidConfigError)
+
+    def test_concurrency_is_bounded(self):
+        g = GNews()
+        lock = threading.Lock()
+        state = {"active": 0, "peak": 0}
+
+        def fetch(key):
+            with lock:
+                state["active"] += 1
+                state["peak"] = max(state["peak"], state["active"])
+            time.sleep(0.01)
+            with lock:
+                state["active"] -= 1
+            return []
+
+        with patch.object(g, "get_news", side_effect=fetch):
+            g.get_news_many([str(i) for i in range(20)], concurrency=3)
+        self.assertLessEqual(state["peak"], 3)
+
+    def test_invalid_arguments_rejected(self):
+        g = GNews()
+        with self.assertRaises(InvalidConfigError):
+            g.get_news_many(["AI"], kind="planet")
+        with self.assertRaises(InvalidConfigError):
+            g.get_news_many(["AI"], concurrency=0)
+
+    def test_empty_batch(self):
+        self.assertEqual(GNews().get_news_many([]), {})
+
+
+class TestGetNewsManyAsync(unittest.TestCase):
+    def test_results_keyed_by_input(self):
+        g = GNews()
+
+        async def fetch(key):
+            return _articles_for(key)
+
+        with patch.object(g, "get_news_async", side_effect=fetch):
+            results = run(g.get_news_many_async(["AI", "Python"]))
+        self.assertEqual(list(results), ["AI", "Python"])
+        self.assertEqual(results["AI"][0]["title"], "AI")
+
+    def test_failure_is_per_item(self):
+        g = GNews()
+        with patch.object(g, "get_news_by_location_async", new_callable=AsyncMock,
+                          side_effect=[[], NetworkError("boom")]):
+            results = run(g.get_news_many_async(["India", "Nowhere"], kind="location"))
+        self.assertEqual(results["India"], [])
+        self.assertIsInstance(results["Nowhere"], NetworkError)
+
+    def test_concurrency_is_bounded(self):
+        g = GNews()
+        state = {"active": 0, "peak": 0}
+
+        async def fetch(key):
+            state["active"] += 1
+            state["peak"] = max(state["peak"], state["active"])
+            await asyncio.sleep(0.001)
+            state["active"] -= 1
+            return []
+
+        with patch.object(g, "get_news_async", side_effect=fetch):
+            run(g.get_news_many_async([str(i) for i in range(50)], concurrency=5))
+        self.assertEqual(state["peak"], 5)
+
+
+class TestIterNewsMany(unittest.TestCase):
+    def test_streams_tagged_articles(self):
+        g = GNews()
+        with patch.object(g, "iter_news", side_effect=lambda key: iter(_articles_for(key) * 2)):
+            pairs = list(g.iter_news_many(["AI", "Python", "AI"], concurrency=2))
+        self.assertEqual(sorted(key for key, _ in pairs), ["AI", "AI", "Python", "Python"])
+        self.assertTrue(all(article["title"] == key for key, article in pairs))
+
+    def test_article_yielded_before_other_searches_finish(self):
+        g = GNews()
+        release = threading.Event()
+
+        def stream(key):
+            if key == "slow":
+                release.wait(5)
+            yield from _articles_for(key)
+
+        with patch.object(g, "iter_news", side_effect=stream):
+            pairs = g.iter_news_many(["slow", "fast"], concurrency=2)
+            self.assertEqual(next(pairs)[0], "fast")
+            release.set()
+            self.assertEqual(next(pairs)[0], "slow")
+
+    def test_failure_is_per_item(self):
+        g = GNews()
+
+        def stream(key):
+            yield from _articles_for(key)
+            if key == "bad":
+                raise NetworkError("boom")
+
+        with patch.object(g, "iter_news", side_effect=stream):
+            pairs = list(g.iter_news_many(["bad", "good"]))
+        errors = [(key, value) for key, value in pairs if isinstance(value, Exception)]
+        self.assertEqual(len(pairs), 3)
+        self.assertEqual(errors[0][0], "bad")
+        self.assertIsInstance(errors[0][1], NetworkError)
+
+    def test_kind_dispatches_to_streaming_method(self):
+        g = GNews()
+        with patch.object(g, "iter_news_by_site", side_effect=lambda key: iter(_articles_for(key))) as site:
+            list(g.iter_news_many(["bbc.com"], kind="site"))
+        site.assert_called_once_with("bbc.com")
+
+    def test_keys_read_lazily(self):
+        g = GNews()
+        read = []
+
+        def keys():
+            for key in map(str, range(1000)):
+                read.append(key)
+                yield key
+
+        with patch.object(g, "iter_news", side_effect=lambda key: iter(_articles_for(key))):
+            pairs = g.iter_news_many(keys(), concurrency=1)
+            self.assertEqual(read, [])
+            next(pairs)
+            pairs.close()
+        # Workers wait on the bounded result queue, so the rest of the input is never read.
+        self.assertLess(len(read), 100)
+
+    def test_failing_keys_raise_instead_of_hanging(self):
+        g = GNews()
+
+        def keys():
+            yield "AI"
+            raise UnicodeDecodeError("utf-8", b"\xff", 0, 1, "invalid start byte")
+
+        pairs, raised = [], []
+
+        def consume():
+            try:
+                pairs.extend(g.iter_news_many(keys(), concurrency=2))
+            except UnicodeDecodeError as err:
+                raised.append(err)
+
+        with patch.object(g, "iter_news", side_effect=lambda key: iter(_articles_for(key))):
+            consumer = threading.Thread(target=consume, daemon=True)
+            consumer.start()
+            consumer.join(5)
+        self.assertFalse(consumer.is_alive())
+        self.assertEqual([key for key, _ in pairs], ["AI"])
+        self.assertEqual(len(raised), 1)
+
+    def test_failing_keys_raise_async(self):
+        g = GNews()
+
+        def keys():
+            yield "AI"
+            raise UnicodeDecodeError("utf-8", b"\xff", 0, 1, "invalid start byte")
+
+        async def stream(key):
+            for article in _articles_for(key):
+                yield article
+
+        pairs = []
+
+        async def collect():
+            async for pair in g.iter_news_many_async(keys(), concurrency=2):
+                pairs.append(pair)
+
+        with patch.object(g, "iter_news_async", side_effect=stream), self.assertRaises(UnicodeDecodeError):
+            asyncio.run(asyncio.wait_for(collect(), 5))
+        self.assertEqual([key for key, _ in pairs], ["AI"])
+
+    def test_async(self):
+        g = GNews()
+
+        async def stream(key):
+            for article in _articles_for(key):
+                await asyncio.sleep(0)
+                yield article
+            if key == "bad":
+                raise NetworkError("boom")
+
+        async def collect():
+            return [pair async for pair in g.iter_news_many_async(["AI", "bad", "AI"], concurrency=2)]
+
+        with patch.object(g, "iter_news_async", side_effect=stream):
+            pairs = asyncio.run(collect())
+        self.assertEqual(sorted(key for key, _ in pairs), ["AI", "bad", "bad"])
+        self.assertEqual(sum(isinstance(value, NetworkError) for _, value in pairs), 1)
@@ -0,0 +1,35 @@
+import json
+import unittest
+
+from benchmarks import make_fixtures, suite
+
+
+class TestBenchmarkSuite(unittest.TestCase):
+    def test_every_benchmark_runs_on_fixtures(self):
+        report = suite.run_suite(scale=0.01, repeat=1)
+        self.assertEqual([r["name"] for r in report["results"]], list(suite.BENCHMARKS))
+        for result in report["results"]:
+            self.assertGreater(result["items"], 0)
+            self.assertGreater(result["per_item_us"], 0)
+            self.assertGreater(result["peak_memory_bytes"], 0)
+        json.dumps(report)
+
+    def test_walker_collects_requested_articles(self):
+        items, run = suite.BENCHMARKS["walker"](0.3)
+        self.assertEqual(len(run()), items)
+
+    def test_fixtures_match_generator(self):
+        rss, searchapi = make_fixtures.generate(2026)
+        with open(suite.RSS_FIXTURE, encoding="utf-8") as f:
+            self.assertEqual(f.read(), rss)
+        with open(suite.SEARCHAPI_FIXTURE, encoding="utf-8") as f:
+            self.assertEqual(json.load(f), searchapi)
+
+    def test_compare_against_baseline(self):
+        report = {"results": [{"name": "clean", "per_item_us": 3.0}, {"name": "new", "per_item_us": 1.0}]}
+        baseline = {"results": [{"name": "clean", "per_item_us": 2.0}]}
+        self.assertEqual(suite.compare(report, baseline), {"clean": 1.5})
+
+
+if __name__ == '__main__':
+    unittest.main()
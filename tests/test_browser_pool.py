@@ -0,0 +1,197 @@
+import asyncio
+import threading
+import unittest
+from concurrent.futures import ThreadPoolExecutor
+from unittest.mock import AsyncMock, MagicMock, patch
+
+from gnews import BrowserPool, GNews
+from gnews.exceptions import InvalidConfigError
+from gnews.utils.utils import process_url
+
+GOOGLE_NEWS_URL = "https://news.google.com/rss/articles/CBMirwFBVV95cUxQ"
+REAL_URL = "https://www.washingtonpost.com/politics/2026/06/15/article"
+
+
+class FakePage:
+    def __init__(self, browser):
+        self._browser = browser
+        self.url = "about:blank"
+
+    async def goto(self, url, **kwargs):
+        if self._browser.crash_next:
+            self._browser.crash_next = False
+            self._browser.connected = False
+            raise RuntimeError("Target closed")
+        await asyncio.sleep(0.005)
+        self.url = REAL_URL
+
+    async def wait_for_url(self, predicate, **kwargs):
+        return None
+
+
+class FakeContext:
+    def __init__(self, browser):
+        self._browser = browser
+
+    async def new_page(self):
+        return FakePage(self._browser)
+
+    async def close(self):
+        self._browser.tracker.close_context()
+
+
+class FakeBrowser:
+    def __init__(self, tracker):
+        self.tracker = tracker
+        self.connected = True
+        self.closed = False
+        self.crash_next = False
+
+    def is_connected(self):
+        return self.connected and not self.closed
+
+    async def new_context(self, **kwargs):
+        self.tracker.open_context(kwargs)
+        return FakeContext(self)
+
+    async def close(self):
+        self.closed = True
+
+
+class Tracker:
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.browsers = []
+        self.open = 0
+        self.peak = 0
+        self.context_kwargs = []
+        self.stopped = False
+
+    def open_context(self, kwargs):
+        with self.lock:
+            self.open += 1
+            self.peak = max(self.peak, self.open)
+            self.context_kwargs.append(kwargs)
+
+    def close_context(self):
+        with self.lock:
+            self.open -= 1
+
+
+def fake_playwright(tracker):
+    chromium = MagicMock()
+
+    async def launch(**kwargs):
+        browser = FakeBrowser(tracker)
+        tracker.browsers.append(browser)
+        return browser
+
+    chromium.launch = launch
+    playwright = MagicMock(chromium=chromium)
+
+    async def stop():
+        tracker.stopped = True
+
+    playwright.stop = stop
+
+    async def start():
+        return playwright
+
+    return MagicMock(return_value=MagicMock(start=start))
+
+
+class TestBrowserPool(unittest.TestCase):
+    def setUp(self):
+        self.tracker = Tracker()
+        patcher = patch("playwright.async_api.async_playwright", fake_playwright(self.tracker))
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def test_single_launch_for_many_urls(self):
+        with BrowserPool() as pool:
+            results = [pool.resolve(GOOGLE_NEWS_URL) for _ in range(10)]
+        self.assertEqual(results, [REAL_URL] * 10)
+        self.assertEqual(len(self.tracker.browsers), 1)
+
+    def test_recycles_after_max_navigations(self):
+        with BrowserPool(max_navigations=3) as pool:
+            for _ in range(7):
+                pool.resolve(GOOGLE_NEWS_URL)
+        self.assertEqual(len(self.tracker.browsers), 3)
+        self.assertTrue(all(b.closed for b in self.tracker.browsers))
+
+    def test_relaunches_after_crash(self):
+        with BrowserPool() as pool:
+            pool.resolve(GOOGLE_NEWS_URL)
+            self.tracker.browsers[0].crash_next = True
+            self.assertIsNone(pool.resolve(GOOGLE_NEWS_URL))
+            self.assertEqual(pool.resolve(GOOGLE_NEWS_URL), REAL_URL)
+        self.assertEqual(len(self.tracker.browsers), 2)
+
+    def test_caps_open_pages(self):
+        with BrowserPool(max_pages=2) as pool, ThreadPoolExecutor(max_workers=8) as executor:
+            results = list(executor.map(pool.resolve, [GOOGLE_NEWS_URL] * 16))
+        self.assertEqual(results, [REAL_URL] * 16)
+        self.assertLessEqual(self.tracker.peak, 2)
+        self.assertEqual(self.tracker.open, 0)
+
+    def test_resolve_async_from_another_loop(self):
+        async def scenario(pool):
+            return await asyncio.gather(*(pool.resolve_async(GOOGLE_NEWS_URL) for _ in range(5)))
+
+        with BrowserPool() as pool:
+            results = asyncio.new_event_loop().run_until_complete(scenario(pool))
+        self.assertEqual(results, [REAL_URL] * 5)
+        self.assertEqual(len(self.tracker.browsers), 1)
+
+    def test_close_shuts_everything_down(self):
+        pool = BrowserPool()
+        pool.resolve(GOOGLE_NEWS_URL)
+        thread = pool._thread
+        pool.close()
+        self.assertTrue(self.tracker.browsers[0].closed)
+        self.assertTrue(self.tracker.stopped)
+        self.assertFalse(thread.is_alive())
+
+    def test_navigations_wait_for_rate_limiter(self):
+        limiter = MagicMock()
+        limiter.acquire_async = AsyncMock()
+        with BrowserPool() as pool:
+            for _ in range(3):
+                pool.resolve(GOOGLE_NEWS_URL, rate_limiter=limiter)
+            pool.resolve(GOOGLE_NEWS_URL)
+        self.assertEqual(limiter.acquire_async.await_count, 3)
+
+    def test_proxy_applied_to_contexts(self):
+        with BrowserPool(proxies={"https": "http://proxy:3128"}) as pool:
+            pool.resolve(GOOGLE_NEWS_URL)
+        self.assertEqual(self.tracker.context_kwargs[0]["proxy"], {"server": "http://proxy:3128"})
+
+    def test_invalid_config_rejected(self):
+        with self.assertRaises(InvalidConfigError):
+            BrowserPool(max_pages=0)
+
+
+class TestPoolIntegration(unittest.TestCase):
+    def test_process_url_uses_pool(self):
+        pool = MagicMock()
+        pool.resolve.return_value = REAL_URL
+        item = {"link": GOOGLE_NEWS_URL, "source": {"href": "https://www.washingtonpost.com"}}
+        with patch("gnews.utils.utils._resolve_with_playwright") as per_url:
+            self.assertEqual(process_url(item, [], pool=pool), REAL_URL)
+        pool.resolve.assert_called_once_with(GOOGLE_NEWS_URL, rate_limiter=None)
+        per_url.assert_not_called()
+
+    def test_client_owns_default_pool(self):
+        g = GNews()
+        self.assertIsInstance(g._browser_pool, BrowserPool)
+        with patch.object(g._browser_pool, "close") as close:
+            g.close()
+        close.assert_called_once()
+
+    def test_client_does_not_close_shared_pool(self):
+        pool = BrowserPool()
+        g = GNews(browser_pool=pool)
+        with patch.object(pool, "close") as close:
+            g.close()
+        close.assert_not_called()
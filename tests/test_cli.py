@@ -113,3 +113,80 @@ class TestCLILocation(unittest.TestCase):
         out = run_cli("location", "Pakistan", "--json")
         data = json.loads(out)
         self.assertEqual(len(data), 2)
+
+
+class TestCLIWatch(unittest.TestCase):
+    def test_watch_streams_ndjson_tagged_with_feed(self):
+        def watch(feeds, callback, **kwargs):
+            callback("top", SAMPLE_ARTICLES[:1])
+            callback("topic:BUSINESS", SAMPLE_ARTICLES[1:])
+            raise KeyboardInterrupt
+
+        with patch("gnews.GNews.watch", side_effect=watch) as mock:
+            out = run_cli("watch", "top", "topic:BUSINESS", "--interval", "60", "--json")
+        lines = [json.loads(line) for line in out.splitlines()]
+        self.assertEqual([(r["feed"], r["title"]) for r in lines],
+                         [("top", "AI Breakthrough"), ("topic:BUSINESS", "Stock Market Up")])
+        self.assertEqual(mock.call_args.args[0], ["top", "topic:BUSINESS"])
+        self.assertEqual(mock.call_args.kwargs["interval"], 60.0)
+
+
+class TestCLIBatch(unittest.TestCase):
+    def test_batch_streams_ndjson_and_reports_errors(self):
+        from gnews.exceptions import NetworkError
+
+        def iter_many(keys, kind, concurrency):
+            for key in keys:
+                if key == "bad":
+                    yield key, NetworkError("boom")
+                else:
+                    yield key, SAMPLE_ARTICLES[0]
+
+        err = StringIO()
+        with patch("gnews.GNews.iter_news_many", side_effect=iter_many) as mock, \
+             patch("sys.stdin", StringIO("AI\n\n# comment\nbad\nPython\n")), patch("sys.stderr", err):
+            out = run_cli("batch", "--concurrency", "4")
+        lines = [json.loads(line) for line in out.splitlines()]
+        self.assertEqual([r["query"] for r in lines], ["AI", "Python"])
+        self.assertEqual(lines[0]["title"], "AI Breakthrough")
+        self.assertIn("bad: boom", err.getvalue())
+        self.assertEqual(mock.call_args.kwargs, {"kind": "query", "concurrency": 4})
+
+    def test_batch_reads_file(self):
+        import os
+        import tempfile
+        with tempfile.TemporaryDirectory() as tmp:
+            path = os.path.join(tmp, "topics.txt")
+            with open(path, "w") as f:
+                f.write("BUSINESS\nSPORTS\n")
+            with patch("gnews.GNews.iter_news_by_topic", side_effect=lambda key: iter([{"title": key}])):
+                out = run_cli("batch", path, "--kind", "topic")
+        self.assertEqual(sorted(json.loads(line)["title"] for line in out.splitlines()), ["BUSINESS", "SPORTS"])
+
+    def test_batch_missing_file_is_a_usage_error(self):
+        err = StringIO()
+        with patch("sys.stderr", err), self.assertRaises(SystemExit) as exit_, \
+             patch("gnews.GNews.iter_news_many") as mock:
+            from gnews.cli import main
+            with patch("sys.argv", ["gnews", "batch", "/nonexistent/keys.txt"]):
+                main()
+        self.assertEqual(exit_.exception.code, 2)
+        self.assertIn("cannot read /nonexistent/keys.txt", err.getvalue())
+        mock.assert_not_called()
+
+    def test_batch_undecodable_file_reported(self):
+        import os
+        import tempfile
+        err = StringIO()
+        with tempfile.TemporaryDirectory() as tmp:
+            path = os.path.join(tmp, "keys.txt")
+            with open(path, "wb") as f:
+                f.write(b"AI\n\xff\xfe\n")
+            with patch("gnews.GNews.iter_news", side_effect=lambda key: iter([{"title": key}])), \
+                 patch("sys.stderr", err), patch("sys.argv", ["gnews", "batch", path]), \
+                 self.assertRaises(SystemExit) as exit_:
+                from gnews.cli import main
+                with patch("sys.stdout", StringIO()):
+                    main()
+        self.assertEqual(exit_.exception.code, 1)
+        self.assertIn("can't decode", err.getvalue())
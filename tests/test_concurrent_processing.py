@@ -0,0 +1,118 @@
+import asyncio
+import threading
+import time
+import unittest
+from types import SimpleNamespace
+from unittest.mock import patch
+
+from gnews import GNews
+from gnews.exceptions import InvalidConfigError
+
+
+def _entries(n):
+    return [{"title": f"Title {i}", "link": f"https://example.com/{i}", "published": "",
+             "description": "", "source": {"href": "https://example.com", "title": "Example"}}
+            for i in range(n)]
+
+
+def _feed(n):
+    return SimpleNamespace(status=200, entries=_entries(n))
+
+
+class TestConcurrentProcessing(unittest.TestCase):
+    def test_preserves_feed_order(self):
+        g = GNews(max_workers=8)
+
+        def slow_resolve(url, *args, **kwargs):
+            # later entries finish first
+            time.sleep(0.02 * (10 - int(url.rsplit("/", 1)[1])) / 10)
+            return url
+
+        with patch.object(g, "_fetch_feed", return_value=_feed(10)), \
+             patch("gnews.gnews.resolve_link", side_effect=slow_resolve):
+            articles = g._get_news("?")
+        self.assertEqual([a["title"] for a in articles], [f"Title {i}" for i in range(10)])
+
+    def test_latency_is_slowest_entry_not_sum(self):
+        g = GNews(max_workers=10)
+
+        def slow_resolve(url, *args, **kwargs):
+            time.sleep(0.1)
+            return url
+
+        with patch.object(g, "_fetch_feed", return_value=_feed(10)), \
+             patch("gnews.gnews.resolve_link", side_effect=slow_resolve):
+            start = time.perf_counter()
+            g._get_news("?")
+            elapsed = time.perf_counter() - start
+        self.assertLess(elapsed, 0.5)
+
+    def test_worker_limit_respected(self):
+        g = GNews(max_workers=3)
+        lock = threading.Lock()
+        state = {"active": 0, "peak": 0}
+
+        def slow_resolve(url, *args, **kwargs):
+            with lock:
+                state["active"] += 1
+                state["peak"] = max(state["peak"], state["active"])
+            time.sleep(0.01)
+            with lock:
+                state["active"] -= 1
+            return url
+
+        with patch.object(g, "_fetch_feed", return_value=_feed(20)), \
+             patch("gnews.gnews.resolve_link", side_effect=slow_resolve):
+            g._get_news("?")
+        self.assertLessEqual(state["peak"], 3)
+
+    def test_failure_drops_only_that_entry(self):
+        g = GNews()
+
+        def flaky_resolve(url, *args, **kwargs):
+            if url.endswith("/3"):
+                raise RuntimeError("boom")
+            return url
+
+        with patch.object(g, "_fetch_feed", return_value=_feed(5)), \
+             patch("gnews.gnews.resolve_link", side_effect=flaky_resolve):
+            articles = g._get_news("?")
+        self.assertEqual([a["title"] for a in articles], ["Title 0", "Title 1", "Title 2", "Title 4"])
+
+    def test_close_shuts_down_workers(self):
+        g = GNews()
+        with patch.object(g, "_fetch_feed", return_value=_feed(3)), \
+             patch("gnews.gnews.resolve_link", side_effect=lambda url, *a, **k: url):
+            g._get_news("?")
+        executor = g._executor
+        g.close()
+        self.assertIsNone(g._executor)
+        self.assertTrue(executor._shutdown)
+
+    def test_invalid_max_workers_rejected(self):
+        with self.assertRaises(InvalidConfigError):
+            GNews(max_workers=0)
+
+
+class TestConcurrentProcessingAsync(unittest.TestCase):
+    def test_preserves_order_and_bounds_concurrency(self):
+        g = GNews(max_workers=4)
+        state = {"active": 0, "peak": 0}
+
+        async def slow_resolve(url, *args, **kwargs):
+            state["active"] += 1
+            state["peak"] = max(state["peak"], state["active"])
+            await asyncio.sleep(0.001 * (20 - int(url.rsplit("/", 1)[1])))
+            state["active"] -= 1
+            if url.endswith("/7"):
+                raise RuntimeError("boom")
+            return url
+
+        async def fetch(url):
+            return _feed(20)
+
+        with patch.object(g, "_fetch_feed_async", side_effect=fetch), \
+             patch("gnews.gnews.resolve_link_async", side_effect=slow_resolve):
+            articles = asyncio.new_event_loop().run_until_complete(g._get_news_async("?"))
+        self.assertEqual([a["title"] for a in articles], [f"Title {i}" for i in range(20) if i != 7])
+        self.assertEqual(state["peak"], 4)
@@ -0,0 +1,207 @@
+import asyncio
+import os
+import tempfile
+import unittest
+from unittest.mock import AsyncMock, patch
+
+import feedparser
+
+from gnews import Article, GNews, MemoryValidatorStore, SQLiteValidatorStore
+from gnews.exceptions import InvalidConfigError
+from gnews.utils.validators import CachedFeed
+
+ETAG = '"abc123"'
+MODIFIED = "Mon, 10 Jun 2026 10:00:00 GMT"
+
+
+def _feed(status=200, n=3, etag=ETAG, modified=MODIFIED):
+    feed = feedparser.FeedParserDict(status=status, entries=[
+        feedparser.FeedParserDict(title=f"Title {i}", link=f"https://example.com/{i}", published="",
+                                  description="<b>Summary</b>",
+                                  source={"href": "https://example.com", "title": "Example"})
+        for i in range(n if status == 200 else 0)])
+    if etag:
+        feed["etag"] = etag
+    if modified:
+        feed["modified"] = modified
+    return feed
+
+
+def _identity(url, *args, **kwargs):
+    return url
+
+
+class TestMemoryValidatorStore(unittest.TestCase):
+    def test_lru_eviction(self):
+        store = MemoryValidatorStore(max_entries=2)
+        for key in ("a", "b"):
+            store.set(key, CachedFeed(ETAG, None, []))
+        store.get("a")
+        store.set("c", CachedFeed(ETAG, None, []))
+        self.assertIsNone(store.get("b"))
+        self.assertIsNotNone(store.get("a"))
+        self.assertEqual(len(store), 2)
+
+    def test_rejects_non_positive_size(self):
+        with self.assertRaises(InvalidConfigError):
+            MemoryValidatorStore(max_entries=0)
+
+    def test_request_kwargs_skip_missing_validators(self):
+        self.assertEqual(CachedFeed(ETAG, None, []).request_kwargs(), {"etag": ETAG})
+        self.assertEqual(CachedFeed(None, None, []).request_kwargs(), {})
+
+
+class TestSQLiteValidatorStore(unittest.TestCase):
+    def setUp(self):
+        self.tmpdir = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.tmpdir.name, "feeds.sqlite")
+
+    def tearDown(self):
+        self.tmpdir.cleanup()
+
+    def test_round_trip_across_instances(self):
+        store = SQLiteValidatorStore(self.path)
+        store.set("feed", CachedFeed(ETAG, MODIFIED, [Article({"title": "T", "url": "u"})], 100))
+        store.close()
+        other = SQLiteValidatorStore(self.path)
+        entry = other.get("feed")
+        other.close()
+        self.assertEqual((entry.etag, entry.modified, entry.entries), (ETAG, MODIFIED, 100))
+        self.assertEqual(entry.articles, [{"title": "T", "url": "u"}])
+
+    def test_evicts_oldest(self):
+        store = SQLiteValidatorStore(":memory:", max_entries=2)
+        for key in ("a", "b", "c"):
+            store.set(key, CachedFeed(ETAG, None, []))
+        store.evict()
+        self.assertIsNone(store.get("a"))
+        self.assertEqual(len(store), 2)
+
+
+class TestConditionalFetch(unittest.TestCase):
+    def setUp(self):
+        self.g = GNews(validator_store=MemoryValidatorStore(), max_workers=1)
+
+    @patch("gnews.gnews.resolve_link", side_effect=_identity)
+    def test_sends_validators_and_reuses_articles_on_304(self, resolve):
+        with patch.object(self.g, "_fetch_feed", side_effect=[_feed(), _feed(304)]) as fetch:
+            first = self.g.get_top_news()
+            second = self.g.get_top_news()
+        self.assertEqual(fetch.call_args_list[0].kwargs, {})
+        self.assertEqual(fetch.call_args_list[1].kwargs, {"etag": ETAG, "modified": MODIFIED})
+        self.assertEqual(second, first)
+        self.assertEqual(resolve.call_count, 3)
+
+    @patch("gnews.gnews.resolve_link", side_effect=_identity)
+    def test_changing_returned_articles_does_not_alter_304(self, _):
+        with patch.object(self.g, "_fetch_feed", side_effect=[_feed(), _feed(304), _feed(304)]):
+            first = self.g.get_top_news()
+            original = [dict(a, publisher=dict(a["publisher"])) for a in first]
+            first[0]["url"] = "https://changed.example.com"
+            first[0]["publisher"]["title"] = "Changed"
+            second = self.g.get_top_news()
+            second[1].pop("title")
+            third = self.g.get_top_news()
+        self.assertEqual(second[0], original[0])
+        self.assertEqual(third, original)
+
+    @patch("gnews.gnews.resolve_link", side_effect=_identity)
+    def test_304_reports_entries_before_filtering(self, _):
+        # The walk past 100 results judges a page by its raw size, not by what survived the filters.
+        self.g.exclude_websites = ["example.com"]
+        with patch.object(self.g, "_fetch_feed", side_effect=[_feed(n=5), _feed(304)]):
+            self.assertEqual(self.g._get_page("?"), ([], 5, None))
+            self.assertEqual(self.g._get_page("?"), ([], 5, None))
+        pages = []
+        with patch.object(self.g, "_fetch_feed", return_value=_feed(304)):
+            list(self.g._iter_query("?", on_page=lambda *page: pages.append(page)))
+        self.assertEqual(pages, [(5, None)])
+
+    @patch("gnews.gnews.resolve_link", side_effect=_identity)
+    def test_changed_feed_is_processed(self, resolve):
+        with patch.object(self.g, "_fetch_feed", side_effect=[_feed(n=1), _feed(n=2, etag='"new"')]) as fetch:
+            self.g.get_top_news()
+            articles = self.g.get_top_news()
+        self.assertEqual(len(articles), 2)
+        self.assertEqual(fetch.call_args_list[1].kwargs["etag"], ETAG)
+
+    @patch("gnews.gnews.resolve_link", side_effect=_identity)
+    def test_feed_without_validators_not_stored(self, _):
+        with patch.object(self.g, "_fetch_feed", return_value=_feed(etag=None, modified=None)) as fetch:
+            self.g.get_top_news()
+            self.g.get_top_news()
+        self.assertEqual(fetch.call_args_list[1].kwargs, {})
+
+    @patch("gnews.gnews.resolve_link", side_effect=_identity)
+    def test_key_depends_on_filters(self, _):
+        with patch.object(self.g, "_fetch_feed", return_value=_feed()) as fetch:
+            self.g.get_top_news()
+            self.g.exclude_websites = ["example.com"]
+            self.g.get_top_news()
+        self.assertEqual(fetch.call_args_list[1].kwargs, {})
+
+    @patch("gnews.gnews.resolve_link", side_effect=_identity)
+    def test_streaming_stores_only_complete_pages(self, _):
+        with patch.object(self.g, "_fetch_feed", side_effect=[_feed(), _feed(), _feed(304)]) as fetch:
+            next(self.g.iter_top_news())
+            list(self.g.iter_top_news())
+            self.assertEqual(len(list(self.g.iter_top_news())), 3)
+        self.assertEqual([bool(call.kwargs) for call in fetch.call_args_list], [False, False, True])
+
+    def test_sqlite_path_restores_records(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            path = os.path.join(tmp, "feeds.sqlite")
+            with patch("gnews.gnews.resolve_link", side_effect=_identity):
+                g = GNews(validator_store=path, max_workers=1)
+                with patch.object(g, "_fetch_feed", return_value=_feed()):
+                    g.get_top_news()
+                g._validator_store.close()
+            compact = GNews(validator_store=path, compact_articles=True)
+            with patch.object(compact, "_fetch_feed", return_value=_feed(304)):
+                articles = compact.get_top_news()
+            compact._validator_store.close()
+        self.assertEqual(len(articles), 3)
+        self.assertIsInstance(articles[0], Article)
+        self.assertEqual(articles[0]["description"], "Summary")
+
+    def test_async_304(self):
+        calls = [_feed(), _feed(304)]
+        with patch.object(self.g, "_fetch_feed_async", new_callable=AsyncMock, side_effect=calls) as fetch, \
+             patch("gnews.gnews.resolve_link_async", new_callable=AsyncMock, side_effect=_identity) as resolve:
+            first = asyncio.run(self.g.get_top_news_async())
+            second = asyncio.run(self.g.get_top_news_async())
+        self.assertEqual(fetch.call_args_list[1].kwargs, {"etag": ETAG, "modified": MODIFIED})
+        self.assertEqual(second, first)
+        self.assertEqual(resolve.call_count, 3)
+
+
+class TestConditionalHttpx(unittest.TestCase):
+    def test_sends_headers_and_reads_validators(self):
+        httpx = __import__("pytest").importorskip("httpx")
+        seen = []
+
+        def handler(request):
+            seen.append(dict(request.headers))
+            if request.headers.get("if-none-match") == ETAG:
+                return httpx.Response(304)
+            return httpx.Response(200, content=b"<rss><channel></channel></rss>",
+                                  headers={"ETag": ETAG, "Last-Modified": MODIFIED})
+
+        async def scenario():
+            g = GNews()
+            g._http_async = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+            g._http_async_loop = asyncio.get_running_loop()
+            fresh = await g._fetch_feed_async("https://news.google.com/rss")
+            unchanged = await g._fetch_feed_async("https://news.google.com/rss", etag=fresh.etag,
+                                                  modified=fresh.modified)
+            await g.aclose()
+            return fresh, unchanged
+
+        fresh, unchanged = asyncio.run(scenario())
+        self.assertEqual((fresh.status, fresh.etag, fresh.modified), (200, ETAG, MODIFIED))
+        self.assertEqual(unchanged.status, 304)
+        self.assertEqual(seen[1]["if-modified-since"], MODIFIED)
+
+
+if __name__ == '__main__':
+    unittest.main()
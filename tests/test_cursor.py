@@ -0,0 +1,178 @@
+import asyncio
+import datetime
+import os
+import tempfile
+import unittest
+from unittest.mock import AsyncMock, patch
+
+from gnews import GNews, NewsCursor
+from gnews.exceptions import InvalidConfigError
+from gnews.utils.cursor import url_digest
+
+DAY = datetime.timedelta(days=1)
+START = datetime.datetime(2026, 1, 1)
+
+
+def _page(start, n=100, day=20):
+    return [{"title": f"T{i}", "url": f"https://example.com/{i}",
+             "published date": f"Mon, {day:02d} Jun 2026 10:00:00 GMT"} for i in range(start, start + n)]
+
+
+def _fed(*pages):
+    """``_get_page`` results for whole feed pages: the articles and their entry count."""
+    return [(page, len(page)) for page in pages]
+
+
+def _range_page(query, window=None, pending=None):
+    """Three articles per day, so every window is sparse and never split."""
+    start, end = window
+    days = [start + i * DAY for i in range((end - start).days)]
+    articles = [{"title": "T", "url": f"https://example.com/{day:%Y%m%d}/{i}"} for day in days for i in range(3)]
+    return articles, len(articles)
+
+
+class TestNewsCursor(unittest.TestCase):
+    def test_json_round_trip(self):
+        cursor = NewsCursor("AI", "walk", {"window": None, "earliest_date": None},
+                            {url_digest("https://a"), url_digest("https://b")}, count=2)
+        restored = NewsCursor.from_json(cursor.to_json())
+        self.assertEqual((restored.query, restored.mode, restored.count, restored.done), ("AI", "walk", 2, False))
+        self.assertEqual(restored.seen, cursor.seen)
+
+    def test_corrupt_cursor_rejected(self):
+        with self.assertRaises(InvalidConfigError):
+            NewsCursor.from_json("{not json")
+        with self.assertRaises(InvalidConfigError):
+            NewsCursor.from_dict({"version": 99})
+        with self.assertRaises(InvalidConfigError):
+            NewsCursor("AI", "sideways", {})
+
+    def test_save_and_load(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            path = os.path.join(tmp, "cursor.json")
+            NewsCursor("AI", "walk", {}, count=5).save(path)
+            NewsCursor("AI", "walk", {}, count=7).save(path)
+            self.assertEqual(NewsCursor.load(path).count, 7)
+            self.assertEqual(os.listdir(tmp), ["cursor.json"])
+
+
+class TestWalkCursor(unittest.TestCase):
+    def test_resume_continues_walk(self):
+        g = GNews(max_results=250, max_workers=1)
+        with patch.object(g, "_get_page", side_effect=_fed(_page(0, day=20))) as fetch:
+            articles, cursor = next(g.iter_pages("AI"))
+        self.assertIsNone(fetch.call_args.kwargs["window"])
+        self.assertEqual(len(articles), 100)
+        self.assertEqual(cursor.count, 100)
+
+        cursor = NewsCursor.from_json(cursor.to_json())
+        resumed = GNews(max_results=250, max_workers=1)
+        pages = [_page(90, day=13), _page(190, day=6)]
+        with patch.object(resumed, "_get_page", side_effect=_fed(*pages)) as fetch:
+            rest = list(resumed.iter_pages("AI", cursor=cursor))
+        window = fetch.call_args_list[0].kwargs["window"]
+        self.assertEqual(window[1], datetime.datetime(2026, 6, 20, 10))
+        new = [article for page, _ in rest for article in page]
+        # The overlap with the window before the cursor is dropped; max_results spans both calls.
+        self.assertEqual(len(new), 150)
+        self.assertNotIn("https://example.com/90", {a["url"] for a in new})
+        self.assertTrue(rest[-1][1].done)
+
+    def test_article_repeated_across_three_windows_returned_once(self):
+        g = GNews(max_results=1000, max_workers=1)
+        pages = [_page(0, day=20), _page(0, n=50, day=13) + _page(100, n=50, day=13),
+                 _page(0, n=30, day=6) + _page(150, n=70, day=6), _page(0, n=10, day=1)]
+        with patch.object(g, "_get_page", side_effect=_fed(*pages)):
+            articles = g.get_news("AI")
+        urls = [a["url"] for a in articles]
+        self.assertEqual(len(urls), 220)
+        self.assertEqual(len(set(urls)), 220)
+
+    def test_resume_remembers_every_window(self):
+        g = GNews(max_results=1000, max_workers=1)
+        with patch.object(g, "_get_page", side_effect=_fed(_page(0, day=20), _page(100, day=13))):
+            pages = g.iter_pages("AI")
+            next(pages)
+            _, cursor = next(pages)
+            pages.close()
+        self.assertEqual(len(cursor.seen), 200)
+
+        resumed = GNews(max_results=1000, max_workers=1)
+        third = _page(0, n=40, day=6) + _page(200, n=60, day=6)
+        with patch.object(resumed, "_get_page", side_effect=_fed(third, _page(0, n=5, day=1))):
+            rest = list(resumed.iter_pages("AI", cursor=NewsCursor.from_json(cursor.to_json())))
+        self.assertEqual([a["url"] for page, _ in rest for a in page],
+                         [f"https://example.com/{i}" for i in range(200, 260)])
+
+    def test_checkpoint_saved_when_next_window_requested(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            path = os.path.join(tmp, "walk.json")
+            g = GNews(max_results=1000, max_workers=1)
+            with patch.object(g, "_get_page", side_effect=_fed(_page(0, day=20), _page(100, day=13))):
+                pages = g.iter_pages("AI", checkpoint=path)
+                next(pages)
+                self.assertFalse(os.path.exists(path))
+                next(pages)
+                pages.close()
+            self.assertEqual(NewsCursor.load(path).count, 100)
+
+            # Resuming from the file repeats the window that was not acknowledged.
+            with patch.object(g, "_get_page", return_value=_fed(_page(100, n=10, day=13))[0]) as fetch:
+                articles, cursor = next(g.iter_pages("AI", checkpoint=path))
+            self.assertEqual(len(articles), 10)
+            self.assertIsNotNone(fetch.call_args.kwargs["window"])
+
+    def test_cursor_must_match_query(self):
+        with self.assertRaises(InvalidConfigError):
+            GNews().iter_pages("AI", cursor=NewsCursor("ML", "walk", {}))
+
+    def test_searchapi_not_supported(self):
+        with self.assertRaises(InvalidConfigError):
+            GNews(searchapi_key="key").iter_pages("AI")
+
+    def test_async_resume(self):
+        g = GNews(max_results=150, max_workers=1)
+        cursor = NewsCursor("AI", "walk", {"window": ["2026-06-13T10:00:00", "2026-06-20T10:00:00"],
+                                           "earliest_date": "2026-06-20T10:00:00"}, count=100)
+        with patch.object(g, "_get_page_async", new_callable=AsyncMock, return_value=_fed(_page(200, day=13))[0]) as fetch:
+            async def collect():
+                return [page async for page in g.iter_pages_async("AI", cursor=cursor)]
+            pages = asyncio.run(collect())
+        self.assertEqual(fetch.call_args.kwargs["window"][0], datetime.datetime(2026, 6, 13, 10))
+        self.assertEqual(len(pages[0][0]), 50)
+
+
+class TestRangeCursor(unittest.TestCase):
+    def _client(self):
+        return GNews(max_results=1000, max_workers=2, start_date=START, end_date=START + 60 * DAY)
+
+    def test_interrupted_range_resumes_without_gaps_or_repeats(self):
+        g = self._client()
+        seen = []
+        with patch.object(g, "_get_page", side_effect=_range_page):
+            pages = g.iter_pages("AI")
+            articles, cursor = next(pages)
+            seen.extend(articles)
+            pages.close()
+        self.assertEqual(cursor.mode, "range")
+        self.assertFalse(cursor.done)
+
+        resumed = self._client()
+        with patch.object(resumed, "_get_page", side_effect=_range_page):
+            for articles, cursor in resumed.iter_pages("AI", cursor=NewsCursor.from_json(cursor.to_json())):
+                seen.extend(articles)
+        urls = [a["url"] for a in seen]
+        self.assertEqual(len(urls), 60 * 3)
+        self.assertEqual(len(set(urls)), len(urls))
+        self.assertTrue(cursor.done)
+
+    def test_finished_cursor_yields_nothing(self):
+        g = self._client()
+        done = NewsCursor("AI", "range", {"pending": [], "density": None}, done=True)
+        with patch.object(g, "_get_page") as fetch:
+            self.assertEqual(list(g.iter_pages("AI", cursor=done)), [])
+        fetch.assert_not_called()
+
+
+if __name__ == '__main__':
+    unittest.main()
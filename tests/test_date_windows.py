@@ -0,0 +1,181 @@
+import asyncio
+import datetime
+import threading
+import unittest
+import warnings
+from unittest.mock import patch
+
+from gnews import GNews
+from gnews.gnews import _DateRangePlan
+
+DAY = datetime.timedelta(days=1)
+START = datetime.datetime(2026, 1, 1)
+
+
+def _corpus(per_day):
+    """Articles keyed by day; ``per_day`` maps day offset -> number of articles."""
+    return {START + offset * DAY: [{"title": f"{offset}-{i}", "url": f"https://example.com/{offset}/{i}"}
+                                   for i in range(count)]
+            for offset, count in per_day.items()}
+
+
+class _FakeFeed:
+    """Stands in for ``GNews._get_page``: a window returns at most 100 of its articles."""
+
+    def __init__(self, corpus):
+        self.corpus = corpus
+        self.windows = []
+        self.lock = threading.Lock()
+
+    def articles(self, window):
+        start, end = window
+        with self.lock:
+            self.windows.append(window)
+        found = [article for day in sorted(self.corpus, reverse=True) if start <= day < end
+                 for article in self.corpus[day]]
+        return found[:100], min(len(found), 100)
+
+    def __call__(self, query, window=None, pending=None):
+        return self.articles(window)
+
+    async def async_call(self, query, window=None, pending=None):
+        await asyncio.sleep(0)
+        return self.articles(window)
+
+
+class TestDateRangePlan(unittest.TestCase):
+    def test_initial_split_by_target(self):
+        plan = _DateRangePlan(START, START + 30 * DAY, 300)
+        windows = [plan.next_window() for _ in range(3)]
+        self.assertEqual(windows[0], (START + 20 * DAY, START + 30 * DAY))
+        self.assertEqual(windows[-1], (START, START + 10 * DAY))
+        self.assertIsNone(plan.next_window())
+
+    def test_saturated_window_split_in_half(self):
+        plan = _DateRangePlan(START, START + 8 * DAY, 100)
+        window = plan.next_window()
+        plan.complete(window, [], 100)
+        self.assertEqual(plan.next_window(), (START + 8 * DAY - 4 * DAY, START + 8 * DAY))
+
+    def test_saturated_single_day_is_final(self):
+        plan = _DateRangePlan(START, START + DAY, 500)
+        plan.complete(plan.next_window(), [], 100)
+        self.assertIsNone(plan.next_window())
+
+    def test_sparse_windows_merged(self):
+        plan = _DateRangePlan(START, START + 40 * DAY, 400)
+        plan.complete(plan.next_window(), [], 2)
+        # Remaining three untouched windows are merged into one request.
+        self.assertEqual(plan.next_window(), (START, START + 30 * DAY))
+        self.assertIsNone(plan.next_window())
+
+    def test_dedup_and_order(self):
+        plan = _DateRangePlan(START, START + 20 * DAY, 200)
+        newer, older = plan.next_window(), plan.next_window()
+        plan.complete(older, [{"url": "a"}, {"url": "b"}], 2)
+        self.assertEqual(plan.complete(newer, [{"url": "b"}, {"url": "c"}], 2), [{"url": "c"}])
+        self.assertEqual([a["url"] for a in plan.articles], ["c", "a", "b"])
+
+
+class TestRangeSearch(unittest.TestCase):
+    def setUp(self):
+        # Busy first week, sparse afterwards.
+        per_day = {offset: (60 if offset < 7 else 3) for offset in range(60)}
+        self.feed = _FakeFeed(_corpus(per_day))
+        self.total = sum(per_day.values())
+
+    def _client(self, **kwargs):
+        kwargs.setdefault("start_date", START)
+        kwargs.setdefault("end_date", START + 60 * DAY)
+        return GNews(max_results=1000, max_workers=4, **kwargs)
+
+    def test_collects_complete_range_without_duplicates(self):
+        g = self._client()
+        with patch.object(g, "_get_page", side_effect=self.feed):
+            articles = g.get_news("AI")
+        urls = [a["url"] for a in articles]
+        self.assertEqual(len(urls), self.total)
+        self.assertEqual(len(set(urls)), self.total)
+        # Every window stays inside the requested range.
+        for start, end in self.feed.windows:
+            self.assertGreaterEqual(start, START)
+            self.assertLessEqual(end, START + 60 * DAY)
+
+    def test_dates_are_honoured_not_cleared(self):
+        g = self._client()
+        with patch.object(g, "_get_page", side_effect=self.feed), warnings.catch_warnings():
+            warnings.simplefilter("error")
+            g.get_news("AI")
+        self.assertEqual(g.start_date, "2026-01-01")
+        self.assertEqual(g.end_date, "2026-03-02")
+
+    def test_stops_at_max_results(self):
+        g = GNews(max_results=150, max_workers=1, start_date=START, end_date=START + 60 * DAY)
+        with patch.object(g, "_get_page", side_effect=self.feed):
+            articles = g.get_news("AI")
+        self.assertEqual(len(articles), 150)
+
+    def test_window_query_uses_dates(self):
+        g = self._client()
+        with patch.object(g, "_fetch_page", side_effect=Exception("stop")) as fetch:
+            with self.assertRaises(Exception):
+                g.get_news("AI news")
+        url = fetch.call_args.args[0]
+        self.assertIn("/search?q=AI%20news", url)
+        self.assertIn("after%3A", url)
+        self.assertIn("before%3A", url)
+
+    def test_windows_fetched_concurrently(self):
+        g = self._client()
+        barrier = threading.Barrier(2, timeout=5)
+        calls = []
+
+        def get_page(query, window=None, pending=None):
+            # The first two windows only return once both are in flight.
+            with self.feed.lock:
+                calls.append(window)
+                first_two = len(calls) <= 2
+            if first_two:
+                barrier.wait()
+            return self.feed(query, window)
+
+        with patch.object(g, "_get_page", side_effect=get_page):
+            g.get_news("AI")
+
+    def test_streaming(self):
+        g = self._client()
+        with patch.object(g, "_get_page", side_effect=self.feed):
+            articles = list(g.iter_news("AI"))
+        self.assertEqual(len({a["url"] for a in articles}), self.total)
+
+    def test_async(self):
+        g = self._client()
+        with patch.object(g, "_get_page_async", side_effect=self.feed.async_call):
+            articles = asyncio.run(g.get_news_async("AI"))
+        self.assertEqual(len({a["url"] for a in articles}), self.total)
+
+    def test_period_gives_start(self):
+        g = GNews(max_results=200, period="7d")
+        start, end = g._date_range()
+        self.assertEqual((end - start).days, 8)
+
+    def test_end_date_only_seeds_walk(self):
+        end = START + 60 * DAY
+        g = GNews(max_results=200, end_date=end)
+        self.assertIsNone(g._date_range())
+        with patch.object(g, "_get_page", side_effect=self.feed), warnings.catch_warnings():
+            warnings.simplefilter("error")
+            g.get_news("AI")
+        self.assertEqual(self.feed.windows[0], (end - 7 * DAY, end))
+        self.assertEqual(g.end_date, "2026-03-02")
+
+    def test_unbounded_uses_walk(self):
+        g = GNews(max_results=200)
+        self.assertIsNone(g._date_range())
+        with patch.object(g, "_get_news_more_than_100", return_value=[]) as walk:
+            g.get_news("AI")
+        walk.assert_called_once()
+
+
+if __name__ == '__main__':
+    unittest.main()
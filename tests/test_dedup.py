@@ -0,0 +1,211 @@
+import os
+import tempfile
+import unittest
+from types import SimpleNamespace
+from unittest.mock import patch
+
+from gnews import BloomDedupStore, GNews, MemoryValidatorStore, SQLiteDedupStore
+from gnews.exceptions import InvalidConfigError
+from gnews.utils.dedup import canonical_url, dedup_key
+
+
+def _entries(ids):
+    return [{"title": f"Title {i}", "link": f"https://news.google.com/rss/articles/CBMi{i}?oc=5",
+             "published": "", "description": "<b>Summary</b>",
+             "source": {"href": "https://example.com", "title": "Example"}} for i in ids]
+
+
+def _feed(ids, status=200):
+    return SimpleNamespace(status=status, entries=_entries(ids), etag='"v1"')
+
+
+def _window(ids, day):
+    entries = _entries(ids)
+    for entry in entries:
+        entry["published"] = f"Mon, {day:02d} Jun 2026 10:00:00 GMT"
+    return SimpleNamespace(status=200, entries=entries)
+
+
+class TestKeys(unittest.TestCase):
+    def test_google_links_key_on_article_id(self):
+        self.assertEqual(dedup_key("https://news.google.com/rss/articles/CBMiabc?oc=5"),
+                         dedup_key("https://news.google.com/articles/CBMiabc"))
+
+    def test_canonical_url(self):
+        self.assertEqual(canonical_url("HTTPS://Example.com/story/?utm_source=x&id=3#top"),
+                         "https://example.com/story?id=3")
+        self.assertEqual(dedup_key("https://example.com/a/"), dedup_key("https://EXAMPLE.com/a?utm_medium=rss"))
+        self.assertNotEqual(dedup_key("https://example.com/a"), dedup_key("https://example.com/b"))
+
+    def test_key_fits_sqlite_integer(self):
+        key = dedup_key("https://example.com/a")
+        self.assertTrue(-2 ** 63 <= key < 2 ** 63)
+
+
+class TestSQLiteDedupStore(unittest.TestCase):
+    def setUp(self):
+        self.tmpdir = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.tmpdir.name, "seen.sqlite")
+
+    def tearDown(self):
+        self.tmpdir.cleanup()
+
+    def test_persists_across_instances(self):
+        store = SQLiteDedupStore(self.path)
+        store.add(dedup_key("https://example.com/a"))
+        store.close()
+        other = SQLiteDedupStore(self.path)
+        self.assertIn(dedup_key("https://example.com/a"), other)
+        self.assertNotIn(dedup_key("https://example.com/b"), other)
+        self.assertEqual(len(other), 1)
+        other.close()
+
+    @patch("gnews.utils.dedup.time.time")
+    def test_ttl(self, now):
+        now.return_value = 1000.0
+        store = SQLiteDedupStore(":memory:", ttl=60)
+        store.add(1)
+        now.return_value = 1100.0
+        self.assertNotIn(1, store)
+        store.evict()
+        self.assertEqual(len(store), 0)
+
+    def test_validation(self):
+        with self.assertRaises(InvalidConfigError):
+            SQLiteDedupStore(":memory:", ttl=0)
+
+
+class TestBloomDedupStore(unittest.TestCase):
+    def test_no_false_negatives_and_bounded_false_positives(self):
+        store = BloomDedupStore(capacity=5000, error_rate=0.01)
+        keys = [dedup_key(f"https://example.com/{i}") for i in range(5000)]
+        for key in keys:
+            store.add(key)
+        self.assertTrue(all(key in store for key in keys))
+        false_positives = sum(dedup_key(f"https://other.example/{i}") in store for i in range(20000))
+        self.assertLess(false_positives / 20000, 0.02)
+
+    def test_sized_from_capacity_and_error_rate(self):
+        store = BloomDedupStore(capacity=1_000_000, error_rate=0.001)
+        self.assertLess(len(store._bits), 2 * 1024 * 1024)
+        self.assertEqual(store.hashes, 10)
+
+    def test_save_and_reload(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            path = os.path.join(tmp, "seen.bloom")
+            with BloomDedupStore(capacity=1000, path=path) as store:
+                store.add(42)
+            reloaded = BloomDedupStore(capacity=1000, path=path)
+            self.assertIn(42, reloaded)
+            self.assertEqual(len(reloaded), 1)
+
+    def test_rejects_other_files(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            path = os.path.join(tmp, "junk")
+            with open(path, "wb") as f:
+                f.write(b"not a filter")
+            with self.assertRaises(InvalidConfigError):
+                BloomDedupStore(path=path)
+
+    def test_validation(self):
+        with self.assertRaises(InvalidConfigError):
+            BloomDedupStore(capacity=0)
+        with self.assertRaises(InvalidConfigError):
+            BloomDedupStore(error_rate=1.5)
+
+
+class TestClientDedup(unittest.TestCase):
+    def test_seen_entries_dropped_before_resolution(self):
+        g = GNews(dedup_store=SQLiteDedupStore(":memory:"), max_workers=1)
+        with patch.object(g, "_fetch_feed", side_effect=[_feed([1, 2, 3]), _feed([2, 3, 4])]), \
+             patch("gnews.gnews.resolve_link", side_effect=lambda url, *a, **k: url) as resolve, \
+             patch.object(g, "_clean", wraps=g._clean) as clean:
+            first = g.get_top_news()
+            second = g.get_top_news()
+        self.assertEqual(len(first), 3)
+        self.assertEqual([a["title"] for a in second], ["Title 4"])
+        self.assertEqual(resolve.call_count, 4)
+        self.assertEqual(clean.call_count, 4)
+
+    def test_path_creates_sqlite_store(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            g = GNews(dedup_store=os.path.join(tmp, "seen.sqlite"))
+            self.assertIsInstance(g._dedup_store, SQLiteDedupStore)
+            g._dedup_store.close()
+
+    def test_unchanged_feed_returns_nothing_new(self):
+        g = GNews(dedup_store=BloomDedupStore(capacity=1000), validator_store=MemoryValidatorStore(),
+                  max_workers=1)
+        with patch.object(g, "_fetch_feed", side_effect=[_feed([1, 2]), _feed([], status=304)]), \
+             patch("gnews.gnews.resolve_link", side_effect=lambda url, *a, **k: url):
+            self.assertEqual(len(g.get_top_news()), 2)
+            self.assertEqual(g.get_top_news(), [])
+
+    def test_failed_entries_not_recorded(self):
+        g = GNews(dedup_store=SQLiteDedupStore(":memory:"), max_workers=1)
+        with patch.object(g, "_fetch_feed", return_value=_feed([1])), \
+             patch("gnews.gnews.resolve_link", side_effect=[RuntimeError("boom"), "https://example.com/1"]):
+            self.assertEqual(g.get_top_news(), [])
+            self.assertEqual(len(g.get_top_news()), 1)
+
+    def test_seen_entry_does_not_end_walk_past_100(self):
+        for streaming in (False, True):
+            with self.subTest(streaming=streaming):
+                store = SQLiteDedupStore(":memory:")
+                store.add(dedup_key("https://news.google.com/rss/articles/CBMi5?oc=5"))
+                g = GNews(max_results=300, max_workers=1, lazy_urls=True, dedup_store=store)
+                pages = [_window(range(0, 100), 20), _window(range(100, 200), 13),
+                         _window(range(200, 300), 6), _window(range(300, 310), 1)]
+                with patch.object(g, "_fetch_feed", side_effect=pages) as fetch:
+                    articles = list(g.iter_news("AI")) if streaming else g.get_news("AI")
+                # One entry of the first window was seen before; the walk still moves on to older windows.
+                self.assertEqual(len(articles), 300)
+                self.assertEqual(fetch.call_count, 4)
+
+    def test_entries_cut_by_max_results_come_back(self):
+        for streaming in (False, True):
+            with self.subTest(streaming=streaming):
+                store = SQLiteDedupStore(":memory:")
+                runs = []
+                for _ in range(2):
+                    g = GNews(max_results=150, max_workers=1, lazy_urls=True, dedup_store=store)
+                    pages = [_window(range(0, 100), 20), _window(range(100, 200), 13), _window(range(200, 230), 6)]
+                    with patch.object(g, "_fetch_feed", side_effect=pages):
+                        runs.append(list(g.iter_news("AI")) if streaming else g.get_news("AI"))
+                # Only the 150 articles returned are recorded; the rest of the second page is still new.
+                self.assertEqual([len(articles) for articles in runs], [150, 80])
+                self.assertEqual(len(store), 230)
+
+    def test_entries_left_by_early_break_come_back(self):
+        g = GNews(dedup_store=SQLiteDedupStore(":memory:"), max_workers=2)
+        with patch.object(g, "_fetch_feed", side_effect=[_feed([1, 2, 3]), _feed([1, 2, 3])]), \
+             patch("gnews.gnews.resolve_link", side_effect=lambda url, *a, **k: url):
+            for article in g.iter_top_news():
+                break
+            rest = g.get_top_news()
+        self.assertEqual(article["title"], "Title 1")
+        self.assertEqual([a["title"] for a in rest], ["Title 2", "Title 3"])
+
+    def test_seen_page_does_not_end_later_walk(self):
+        store = SQLiteDedupStore(":memory:")
+        g = GNews(max_results=100, max_workers=1, lazy_urls=True, dedup_store=store)
+        with patch.object(g, "_fetch_feed", return_value=_window(range(0, 100), 20)):
+            self.assertEqual(len(g.get_news("AI")), 100)
+        g = GNews(max_results=200, max_workers=1, lazy_urls=True, dedup_store=store)
+        pages = [_window(range(0, 100), 20), _window(range(100, 200), 13), _window([], 6)]
+        with patch.object(g, "_fetch_feed", side_effect=pages) as fetch:
+            articles = g.get_news("AI")
+        # The first window is all seen, but its dates still move the walk on to the older one.
+        self.assertEqual(len(articles), 100)
+        self.assertEqual(fetch.call_count, 3)
+
+    def test_searchapi_results_filtered(self):
+        g = GNews(searchapi_key="key", dedup_store=SQLiteDedupStore(":memory:"))
+        results = [{"url": "https://example.com/a"}, {"url": "https://example.com/b"}]
+        with patch.object(g._searchapi, "get_news", side_effect=[results, results + [{"url": "https://example.com/c"}]]):
+            g.get_news("AI")
+            self.assertEqual(g.get_news("AI"), [{"url": "https://example.com/c"}])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,85 @@
+import unittest
+
+from gnews import GNews
+from gnews.exceptions import InvalidConfigError
+from gnews.utils.domains import DomainIndex, normalize_domain
+from gnews.utils.utils import process_url
+
+
+def _entry(href):
+    return {"title": "T", "link": f"{href}/story", "published": "", "description": "",
+            "source": {"href": href, "title": "Publisher"}}
+
+
+class TestNormalizeDomain(unittest.TestCase):
+    def test_strips_scheme_www_path_and_case(self):
+        self.assertEqual(normalize_domain("https://www.Example.com/news?x=1"), "example.com")
+
+    def test_bare_domain(self):
+        self.assertEqual(normalize_domain("cnn.com"), "cnn.com")
+
+    def test_strips_port(self):
+        self.assertEqual(normalize_domain("http://example.com:8080"), "example.com")
+
+
+class TestDomainIndex(unittest.TestCase):
+    def setUp(self):
+        self.index = DomainIndex(["cnn.com", "www.foxnews.com", "https://BBC.co.uk"])
+
+    def test_matches_http_and_https(self):
+        self.assertTrue(self.index.matches("http://cnn.com"))
+        self.assertTrue(self.index.matches("https://cnn.com"))
+
+    def test_matches_with_and_without_www(self):
+        self.assertTrue(self.index.matches("https://www.cnn.com"))
+        self.assertTrue(self.index.matches("https://foxnews.com"))
+        self.assertTrue(self.index.matches("https://www.bbc.co.uk/news"))
+
+    def test_matches_subdomains(self):
+        self.assertTrue(self.index.matches("https://edition.cnn.com"))
+
+    def test_does_not_match_lookalikes(self):
+        self.assertFalse(self.index.matches("https://notcnn.com"))
+        self.assertFalse(self.index.matches("https://cnn.com.evil.net"))
+        self.assertFalse(self.index.matches("https://co.uk"))
+
+    def test_hostname_case_insensitive(self):
+        self.assertTrue(self.index.matches("https://WWW.CNN.COM"))
+
+    def test_empty_index_matches_nothing(self):
+        self.assertFalse(DomainIndex().matches("https://cnn.com"))
+        self.assertFalse(DomainIndex())
+
+    def test_large_index(self):
+        index = DomainIndex(f"site{i}.com" for i in range(10_000))
+        self.assertEqual(len(index), 10_000)
+        self.assertTrue(index.matches("https://www.site9999.com"))
+        self.assertFalse(index.matches("https://site10000.com"))
+
+
+class TestGNewsWebsiteFilters(unittest.TestCase):
+    def test_exclusion_compiled_on_init_and_set(self):
+        g = GNews(exclude_websites=["cnn.com"])
+        self.assertIsNone(g._process(_entry("https://www.cnn.com")))
+        g.exclude_websites = ["bbc.com"]
+        self.assertIsNotNone(g._process(_entry("https://www.cnn.com")))
+        self.assertIsNone(g._process(_entry("https://bbc.com")))
+
+    def test_include_only_allowlist(self):
+        g = GNews(include_websites=["reuters.com", "apnews.com"])
+        self.assertIsNotNone(g._process(_entry("https://www.reuters.com")))
+        self.assertIsNone(g._process(_entry("https://cnn.com")))
+
+    def test_exclusion_applies_on_top_of_allowlist(self):
+        g = GNews(include_websites=["reuters.com"], exclude_websites=["uk.reuters.com"])
+        self.assertIsNotNone(g._process(_entry("https://www.reuters.com")))
+        self.assertIsNone(g._process(_entry("https://uk.reuters.com")))
+
+    def test_include_websites_must_be_list(self):
+        g = GNews()
+        with self.assertRaises(InvalidConfigError):
+            g.include_websites = "reuters.com"
+
+    def test_process_url_still_accepts_a_list(self):
+        self.assertIsNone(process_url(_entry("https://www.cnn.com"), ["cnn.com"]))
+        self.assertEqual(process_url(_entry("https://bbc.com"), ["cnn.com"]), "https://bbc.com/story")
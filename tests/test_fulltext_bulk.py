@@ -0,0 +1,136 @@
+import asyncio
+import unittest
+from unittest.mock import MagicMock, patch
+
+from gnews import GNews
+from gnews.exceptions import InvalidConfigError, NetworkError
+
+MOCK_HTML = b"""
+<html><body>
+<article>
+<h1>AI Transforms Healthcare</h1>
+<p>Artificial intelligence is revolutionizing how doctors diagnose diseases.</p>
+<p>New research shows that AI models outperform radiologists in detecting cancer.</p>
+<p>The study was conducted across 50 hospitals with 10,000 patients.</p>
+</article>
+</body></html>
+"""
+
+
+def _response(content, status=200, headers=None):
+    return MagicMock(status_code=status, content=content, headers=headers or {})
+
+
+def _pages(url, *args, **kwargs):
+    if "missing" in url:
+        return _response(b"", status=404)
+    if "empty" in url:
+        return _response(b"<html><body></body></html>")
+    return _response(MOCK_HTML)
+
+
+URLS = ["https://example.com/a", "https://example.com/missing", "https://example.com/empty",
+        "https://example.com/b"]
+
+
+class TestGetFullArticles(unittest.TestCase):
+    def setUp(self):
+        self.gnews = GNews()
+        self.addCleanup(self.gnews.close)
+
+    def test_results_in_input_order_with_errors(self):
+        with patch.object(self.gnews._transport, "get", side_effect=_pages):
+            results = self.gnews.get_full_articles(URLS, processes=0)
+        self.assertEqual(len(results), 4)
+        self.assertEqual(results[0]["url"], URLS[0])
+        self.assertIn("revolutionizing", results[0]["text"])
+        self.assertIsInstance(results[1], NetworkError)
+        self.assertIn("download", str(results[1]))
+        self.assertIsInstance(results[2], NetworkError)
+        self.assertIn("extract", str(results[2]))
+        self.assertEqual(results[3]["url"], URLS[3])
+
+    def test_transport_error_is_per_url(self):
+        def get(url, *args, **kwargs):
+            if url.endswith("a"):
+                raise ConnectionError("reset")
+            return _response(MOCK_HTML)
+
+        with patch.object(self.gnews._transport, "get", side_effect=get):
+            results = self.gnews.get_full_articles(URLS[::3], processes=0)
+        self.assertIsInstance(results[0], NetworkError)
+        self.assertEqual(results[1]["url"], URLS[3])
+
+    def test_process_pool_extraction(self):
+        with patch.object(self.gnews._transport, "get", side_effect=_pages):
+            results = self.gnews.get_full_articles(URLS, processes=2)
+        self.assertIn("revolutionizing", results[3]["text"])
+        self.assertIsInstance(results[2], NetworkError)
+        pool = self.gnews._process_pool
+        self.assertIsNotNone(pool)
+        # Forking would copy the client's download threads' locks into the workers.
+        self.assertIn(pool._mp_context.get_start_method(), ("forkserver", "spawn"))
+        # The pool is reused across calls and shut down with the client.
+        with patch.object(self.gnews._transport, "get", side_effect=_pages):
+            self.gnews.get_full_articles(URLS[:1], processes=2)
+        self.assertIs(self.gnews._process_pool, pool)
+        self.gnews.close()
+        self.assertIsNone(self.gnews._process_pool)
+
+    def test_empty_input(self):
+        self.assertEqual(self.gnews.get_full_articles([], processes=0), [])
+
+    def test_validation(self):
+        with self.assertRaises(InvalidConfigError):
+            self.gnews.get_full_articles(URLS, concurrency=0)
+        with self.assertRaises(InvalidConfigError):
+            self.gnews.get_full_articles(URLS, processes=-1)
+
+    def test_requires_trafilatura(self):
+        with patch.dict("sys.modules", {"trafilatura": None}):
+            with self.assertRaises(ImportError) as ctx:
+                self.gnews.get_full_articles(URLS)
+        self.assertIn("pip install gnews[fulltext]", str(ctx.exception))
+
+
+class TestIterFullArticlesAsync(unittest.TestCase):
+    def setUp(self):
+        self.gnews = GNews()
+        self.addCleanup(self.gnews.close)
+
+    def _collect(self, urls, **kwargs):
+        async def collect():
+            return [item async for item in self.gnews.iter_full_articles_async(urls, **kwargs)]
+        return asyncio.run(collect())
+
+    def test_streams_every_url(self):
+        with patch.object(self.gnews, "_async_http", return_value=None), \
+             patch.object(self.gnews._transport, "get", side_effect=_pages):
+            results = dict(self._collect(URLS, processes=0))
+        self.assertEqual(set(results), set(URLS))
+        self.assertIn("revolutionizing", results[URLS[0]]["text"])
+        self.assertIsInstance(results[URLS[1]], NetworkError)
+
+    def test_uses_async_client(self):
+        async def get(url, **kwargs):
+            return _response(MOCK_HTML)
+
+        client = MagicMock(get=MagicMock(side_effect=get))
+        with patch.object(self.gnews, "_async_http", return_value=client):
+            results = self._collect(URLS[:2], processes=0, concurrency=1)
+        self.assertEqual(client.get.call_count, 2)
+        self.assertTrue(all(isinstance(result, dict) for _, result in results))
+
+    def test_completion_order(self):
+        async def get(url, **kwargs):
+            await asyncio.sleep(0.05 if url.endswith("a") else 0)
+            return _response(MOCK_HTML)
+
+        client = MagicMock(get=MagicMock(side_effect=get))
+        with patch.object(self.gnews, "_async_http", return_value=client):
+            results = self._collect([URLS[0], URLS[3]], processes=0)
+        self.assertEqual([url for url, _ in results], [URLS[3], URLS[0]])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,48 @@
+import subprocess
+import sys
+import unittest
+
+import gnews
+
+
+def _run(script):
+    return subprocess.run([sys.executable, "-c", script], capture_output=True, text=True, check=True)
+
+
+def _loaded(statement, modules):
+    script = f"{statement}\nimport sys\nprint(' '.join(m for m in {modules!r} if m in sys.modules))"
+    return _run(script).stdout.split()
+
+
+class TestLazyImports(unittest.TestCase):
+    # Which modules load is checked rather than how long it takes; timing lives in benchmarks/bench_import.py.
+    def test_import_gnews_loads_only_the_package(self):
+        script = "import sys\nbefore = set(sys.modules)\nimport gnews\nprint(' '.join(set(sys.modules) - before))"
+        self.assertEqual(sorted(_run(script).stdout.split()), ["gnews", "gnews.exceptions"])
+
+    def test_import_gnews_loads_nothing_heavy(self):
+        heavy = ("feedparser", "bs4", "requests", "urllib.request", "csv", "asyncio", "sqlite3",
+                 "gnews.gnews", "gnews.backends.searchapi")
+        self.assertEqual(_loaded("import gnews", heavy), [])
+
+    def test_client_defers_network_and_parsing_dependencies(self):
+        deferred = ("feedparser", "bs4", "requests", "urllib.request", "csv", "gnews.backends.searchapi")
+        self.assertEqual(_loaded("from gnews import GNews; GNews()", deferred), [])
+
+    def test_cli_help_does_not_load_client(self):
+        self.assertEqual(_loaded("import gnews.cli", ("gnews.gnews", "requests", "feedparser")), [])
+
+    def test_public_names_resolve(self):
+        for name in gnews.__all__:
+            self.assertIsNotNone(getattr(gnews, name))
+        self.assertIn("GNews", dir(gnews))
+        with self.assertRaises(AttributeError):
+            gnews.NotAThing
+
+    def test_user_agent_built_on_first_use(self):
+        from gnews.utils import constants
+        self.assertIn(constants.USER_AGENT, constants.USER_AGENTS)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,94 @@
+import asyncio
+import json
+import unittest
+from types import SimpleNamespace
+from unittest.mock import patch
+
+from gnews import GNews, LazyArticle
+
+GOOGLE_NEWS_URL = "https://news.google.com/rss/articles/CBMirwFBVV95cUxQ"
+REAL_URL = "https://www.washingtonpost.com/politics/2026/06/15/article"
+
+
+def _entry(link=GOOGLE_NEWS_URL, href="https://www.washingtonpost.com"):
+    return {
+        "title": "Title",
+        "link": link,
+        "published": "Mon, 10 Jun 2026 10:00:00 GMT",
+        "description": "<b>Summary</b>",
+        "source": {"href": href, "title": "Washington Post"},
+    }
+
+
+class TestLazyArticle(unittest.TestCase):
+    def test_url_resolved_on_first_access_only(self):
+        calls = []
+
+        def resolver(url):
+            calls.append(url)
+            return REAL_URL
+
+        article = LazyArticle({"title": "T", "url": GOOGLE_NEWS_URL}, resolver)
+        self.assertFalse(article.resolved)
+        self.assertEqual(article["title"], "T")
+        self.assertEqual(calls, [])
+        self.assertEqual(article["url"], REAL_URL)
+        self.assertEqual(article.get("url"), REAL_URL)
+        self.assertEqual(calls, [GOOGLE_NEWS_URL])
+        self.assertTrue(article.resolved)
+        self.assertEqual(article.link, GOOGLE_NEWS_URL)
+
+    def test_serialises_stored_url_without_resolving(self):
+        article = LazyArticle({"url": GOOGLE_NEWS_URL}, lambda url: self.fail("resolved"))
+        self.assertEqual(json.loads(json.dumps(article))["url"], GOOGLE_NEWS_URL)
+
+    def test_is_a_dict(self):
+        article = LazyArticle({"url": GOOGLE_NEWS_URL}, lambda url: REAL_URL)
+        self.assertIsInstance(article, dict)
+        self.assertEqual(article.get("missing", "x"), "x")
+
+
+class TestLazyMode(unittest.TestCase):
+    def setUp(self):
+        self.g = GNews(lazy_urls=True)
+        self.feed = SimpleNamespace(status=200, entries=[_entry() for _ in range(5)])
+
+    @patch("gnews.utils.utils._resolve_google_link", return_value=REAL_URL)
+    def test_get_news_does_not_resolve(self, mock_resolve):
+        with patch.object(self.g, "_fetch_feed", return_value=self.feed):
+            articles = self.g.get_news("AI")
+        mock_resolve.assert_not_called()
+        self.assertEqual(len(articles), 5)
+        self.assertEqual(articles[0]["title"], "Title")
+
+    @patch("gnews.utils.utils._resolve_google_link", return_value=REAL_URL)
+    def test_bulk_resolve_only_kept_items(self, mock_resolve):
+        with patch.object(self.g, "_fetch_feed", return_value=self.feed):
+            articles = self.g.get_news("AI")
+        kept = self.g.resolve(articles[:2])
+        self.assertEqual(mock_resolve.call_count, 2)
+        self.assertEqual([a["url"] for a in kept], [REAL_URL, REAL_URL])
+        self.assertFalse(articles[2].resolved)
+
+    @patch("gnews.utils.utils._resolve_google_link_async")
+    def test_bulk_resolve_async(self, mock_resolve):
+        async def resolved(*args):
+            return REAL_URL
+
+        mock_resolve.side_effect = resolved
+        with patch.object(self.g, "_fetch_feed", return_value=self.feed):
+            articles = self.g.get_news("AI")
+        asyncio.new_event_loop().run_until_complete(self.g.resolve_async(articles[:3]))
+        self.assertEqual(mock_resolve.call_count, 3)
+        self.assertTrue(all(a.resolved for a in articles[:3]))
+        self.assertEqual(articles[0]["url"], REAL_URL)
+
+    def test_excluded_sites_still_filtered(self):
+        g = GNews(lazy_urls=True, exclude_websites=["washingtonpost.com"])
+        self.assertIsNone(g._process(_entry()))
+
+    @patch("gnews.utils.utils._resolve_google_link", return_value=REAL_URL)
+    def test_eager_mode_unchanged(self, mock_resolve):
+        article = GNews()._process(_entry())
+        self.assertNotIsInstance(article, LazyArticle)
+        self.assertEqual(article["url"], REAL_URL)
@@ -0,0 +1,215 @@
+import asyncio
+import os
+import tempfile
+import threading
+import unittest
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, MagicMock, patch
+
+from gnews import GNews, RateLimiter, ResolutionCache, SQLiteRateLimiter
+from gnews.backends.searchapi import SearchApiBackend
+from gnews.exceptions import InvalidConfigError
+
+GOOGLE_NEWS_URL = "https://news.google.com/rss/articles/CBMirwFBVV95cUxQ"
+REAL_URL = "https://www.washingtonpost.com/politics/2026/06/15/article"
+
+
+class _Clock:
+    def __init__(self, now=1000.0):
+        self.now = now
+
+    def __call__(self):
+        return self.now
+
+
+class TestRateLimiter(unittest.TestCase):
+    def setUp(self):
+        self.clock = _Clock()
+        patcher = patch.object(RateLimiter, "_now", self.clock)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def test_burst_then_spaced(self):
+        limiter = RateLimiter(rate=2, burst=3)
+        self.assertEqual([limiter.reserve() for _ in range(3)], [0.0, 0.0, 0.0])
+        # An empty bucket books the next tokens: callers queue up 0.5s apart.
+        self.assertAlmostEqual(limiter.reserve(), 0.5)
+        self.assertAlmostEqual(limiter.reserve(), 1.0)
+
+    def test_refills_over_time(self):
+        limiter = RateLimiter(rate=1)
+        self.assertEqual(limiter.reserve(), 0.0)
+        self.assertAlmostEqual(limiter.reserve(), 1.0)
+        self.clock.now += 5
+        # Refill is capped at the burst size.
+        self.assertEqual(limiter.reserve(), 0.0)
+        self.assertAlmostEqual(limiter.reserve(), 1.0)
+
+    def test_threads_share_bucket(self):
+        limiter = RateLimiter(rate=10, burst=1)
+        waits = []
+        lock = threading.Lock()
+
+        def worker():
+            wait = limiter.reserve()
+            with lock:
+                waits.append(wait)
+
+        threads = [threading.Thread(target=worker) for _ in range(20)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        self.assertEqual(sorted(round(w, 6) for w in waits), [round(i / 10, 6) for i in range(20)])
+
+    def test_validation(self):
+        with self.assertRaises(InvalidConfigError):
+            RateLimiter(rate=0)
+        with self.assertRaises(InvalidConfigError):
+            RateLimiter(rate=1, burst=0.5)
+
+    def test_shared_by_name(self):
+        first = RateLimiter.shared("test-shared", 5)
+        second = RateLimiter.shared("test-shared", 5)
+        self.assertIs(first, second)
+        self.assertIsNot(RateLimiter.shared("test-other", 5), first)
+
+    def test_shared_rejects_conflicting_settings(self):
+        limiter = RateLimiter.shared("test-conflict", 5)
+        with self.assertRaises(InvalidConfigError):
+            RateLimiter.shared("test-conflict", 2)
+        with self.assertRaises(InvalidConfigError):
+            RateLimiter.shared("test-conflict", 5, burst=10)
+        self.assertEqual((limiter.rate, limiter.burst), (5, 5))
+
+    def test_bucket_base_is_abstract(self):
+        from gnews.utils.ratelimit import _TokenBucket
+        with self.assertRaises(TypeError):
+            _TokenBucket(1, None)
+
+    def test_acquire_async_waits(self):
+        limiter = RateLimiter(rate=1, burst=1)
+        limiter.reserve()
+        with patch("gnews.utils.ratelimit.asyncio.sleep", new_callable=AsyncMock) as sleep:
+            asyncio.run(limiter.acquire_async())
+        sleep.assert_awaited_once_with(1.0)
+
+
+class TestSQLiteRateLimiter(unittest.TestCase):
+    def setUp(self):
+        self.tmpdir = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.tmpdir.name, "limits.sqlite")
+        self.clock = _Clock()
+        patcher = patch.object(SQLiteRateLimiter, "_now", self.clock)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def tearDown(self):
+        self.tmpdir.cleanup()
+
+    def test_instances_share_bucket(self):
+        one = SQLiteRateLimiter(self.path, rate=2, burst=1)
+        two = SQLiteRateLimiter(self.path, rate=2, burst=1)
+        self.assertEqual(one.reserve(), 0.0)
+        self.assertAlmostEqual(two.reserve(), 0.5)
+        self.assertAlmostEqual(one.reserve(), 1.0)
+        self.clock.now += 10
+        self.assertEqual(two.reserve(), 0.0)
+        one.close()
+        two.close()
+
+    def test_buckets_are_named(self):
+        google = SQLiteRateLimiter(self.path, rate=1, name="google")
+        searchapi = SQLiteRateLimiter(self.path, rate=1, name="searchapi")
+        self.assertEqual(google.reserve(), 0.0)
+        self.assertEqual(searchapi.reserve(), 0.0)
+        google.close()
+        searchapi.close()
+
+    def test_unreachable_database_lets_request_through(self):
+        limiter = SQLiteRateLimiter(os.path.join(self.tmpdir.name, "missing", "limits.sqlite"), rate=1)
+        self.assertEqual(limiter.reserve(), 0.0)
+
+
+class TestClientRateLimit(unittest.TestCase):
+    def test_feed_requests_wait_for_token(self):
+        limiter = MagicMock(spec=RateLimiter)
+        limiter.reserve.return_value = 0.25
+        g = GNews(rate_limit=limiter)
+        feed = SimpleNamespace(status=200, entries=[])
+        with patch.object(g, "_fetch_feed", return_value=feed), patch.object(g, "_sleep") as sleep:
+            g.get_top_news()
+        sleep.assert_called_once_with(0.25)
+
+    def test_retries_take_a_token_each(self):
+        limiter = MagicMock(spec=RateLimiter)
+        limiter.reserve.return_value = 0.0
+        g = GNews(rate_limit=limiter, max_retries=2)
+        feeds = [SimpleNamespace(status=429, entries=[]), SimpleNamespace(status=200, entries=[])]
+        with patch.object(g, "_fetch_feed", side_effect=feeds), patch.object(g, "_sleep"):
+            g.get_top_news()
+        self.assertEqual(limiter.reserve.call_count, 2)
+
+    def test_async_feed_requests_wait_for_token(self):
+        limiter = MagicMock(spec=RateLimiter)
+        limiter.reserve.return_value = 0.5
+        g = GNews(rate_limit=limiter)
+        feed = SimpleNamespace(status=200, entries=[])
+        with patch.object(g, "_fetch_feed_async", new_callable=AsyncMock, return_value=feed), \
+             patch.object(g, "_sleep_async", new_callable=AsyncMock) as sleep:
+            asyncio.run(g.get_top_news_async())
+        sleep.assert_awaited_once_with(0.5)
+
+    def test_link_resolution_takes_a_token_except_on_cache_hits(self):
+        limiter = MagicMock(spec=RateLimiter)
+        pool = MagicMock()
+        pool.resolve.return_value = None
+        g = GNews(rate_limit=limiter, url_cache=ResolutionCache(":memory:"), browser_pool=pool)
+        with patch.object(g._transport, "head", return_value=REAL_URL) as head:
+            self.assertEqual(g._resolve_link(GOOGLE_NEWS_URL), REAL_URL)
+            self.assertEqual(g._resolve_link(GOOGLE_NEWS_URL), REAL_URL)
+        # The pool takes its own token per navigation; the HEAD fallback takes one here.
+        pool.resolve.assert_called_once_with(GOOGLE_NEWS_URL, rate_limiter=limiter)
+        head.assert_called_once()
+        limiter.acquire.assert_called_once()
+
+    def test_async_link_resolution_takes_a_token(self):
+        limiter = MagicMock(spec=RateLimiter)
+        limiter.acquire_async = AsyncMock()
+        pool = MagicMock()
+        pool.resolve_async = AsyncMock(return_value=None)
+        client = MagicMock()
+        client.head = AsyncMock(return_value=SimpleNamespace(url=REAL_URL))
+        g = GNews(rate_limit=limiter, browser_pool=pool)
+        with patch.object(g, "_async_http", return_value=client):
+            article = asyncio.run(g._process_async({"title": "T - Pub", "link": GOOGLE_NEWS_URL, "published": "",
+                                                    "source": {"href": "https://pub.example", "title": "Pub"}}))
+        self.assertEqual(article["url"], REAL_URL)
+        pool.resolve_async.assert_awaited_once_with(GOOGLE_NEWS_URL, rate_limiter=limiter)
+        limiter.acquire_async.assert_awaited_once()
+
+    def test_number_uses_process_wide_bucket(self):
+        first, second = GNews(rate_limit=3), GNews(rate_limit=3)
+        self.assertIs(first._rate_limiter, second._rate_limiter)
+        self.assertIsNone(GNews()._rate_limiter)
+
+    def test_invalid_rate(self):
+        with self.assertRaises(InvalidConfigError):
+            GNews(rate_limit=0)
+
+    def test_searchapi_requests_acquire(self):
+        limiter = MagicMock(spec=RateLimiter)
+        backend = SearchApiBackend("key", rate_limiter=limiter)
+        response = SimpleNamespace(status_code=200, text="", json=lambda: {"organic_results": []})
+        with patch("gnews.backends.searchapi.requests.get", return_value=response):
+            backend.get_news("AI")
+        limiter.acquire.assert_called_once()
+
+    def test_searchapi_rate_limit_wired(self):
+        limiter = RateLimiter(rate=1)
+        g = GNews(searchapi_key="key", searchapi_rate_limit=limiter)
+        self.assertIs(g._searchapi._rate_limiter, limiter)
+
+
+if __name__ == '__main__':
+    unittest.main()
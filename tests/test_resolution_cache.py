@@ -0,0 +1,124 @@
+import os
+import tempfile
+import unittest
+from unittest.mock import patch
+
+from gnews import GNews, ResolutionCache
+from gnews.exceptions import InvalidConfigError
+from gnews.utils.cache import google_article_id
+from gnews.utils.utils import process_url
+
+ARTICLE_ID = "CBMirwFBVV95cUxQ"
+GOOGLE_NEWS_URL = f"https://news.google.com/rss/articles/{ARTICLE_ID}?oc=5"
+REAL_URL = "https://www.washingtonpost.com/politics/2026/06/15/article"
+ITEM = {"link": GOOGLE_NEWS_URL, "source": {"href": "https://www.washingtonpost.com"}}
+
+
+class TestGoogleArticleId(unittest.TestCase):
+    def test_extracts_id_from_rss_link(self):
+        self.assertEqual(google_article_id(GOOGLE_NEWS_URL), ARTICLE_ID)
+
+    def test_extracts_id_from_article_link(self):
+        self.assertEqual(google_article_id(f"https://news.google.com/articles/{ARTICLE_ID}"), ARTICLE_ID)
+
+    def test_non_google_url(self):
+        self.assertIsNone(google_article_id(REAL_URL))
+
+
+class TestResolutionCache(unittest.TestCase):
+    def setUp(self):
+        self.tmpdir = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.tmpdir.name, "urls.sqlite")
+        self.cache = ResolutionCache(self.path, ttl=100, failure_ttl=10)
+
+    def tearDown(self):
+        self.cache.close()
+        self.tmpdir.cleanup()
+
+    def test_miss_then_hit(self):
+        self.assertEqual(self.cache.get(ARTICLE_ID), (False, None))
+        self.cache.set(ARTICLE_ID, REAL_URL)
+        self.assertEqual(self.cache.get(ARTICLE_ID), (True, REAL_URL))
+
+    def test_entries_expire_after_ttl(self):
+        with patch("gnews.utils.cache.time.time", return_value=1000.0):
+            self.cache.set(ARTICLE_ID, REAL_URL)
+        with patch("gnews.utils.cache.time.time", return_value=1099.0):
+            self.assertEqual(self.cache.get(ARTICLE_ID), (True, REAL_URL))
+        with patch("gnews.utils.cache.time.time", return_value=1101.0):
+            self.assertEqual(self.cache.get(ARTICLE_ID), (False, None))
+
+    def test_failures_use_short_ttl(self):
+        with patch("gnews.utils.cache.time.time", return_value=1000.0):
+            self.cache.set(ARTICLE_ID, None)
+        with patch("gnews.utils.cache.time.time", return_value=1005.0):
+            self.assertEqual(self.cache.get(ARTICLE_ID), (True, None))
+        with patch("gnews.utils.cache.time.time", return_value=1011.0):
+            self.assertEqual(self.cache.get(ARTICLE_ID), (False, None))
+
+    def test_evict_bounds_size(self):
+        cache = ResolutionCache(":memory:", max_entries=3)
+        for i in range(10):
+            cache.set(f"id-{i}", f"https://example.com/{i}")
+        cache.evict()
+        self.assertEqual(len(cache), 3)
+        self.assertEqual(cache.get("id-9"), (True, "https://example.com/9"))
+        self.assertEqual(cache.get("id-0"), (False, None))
+
+    def test_shared_between_instances_on_same_file(self):
+        other = ResolutionCache(self.path)
+        try:
+            self.cache.set(ARTICLE_ID, REAL_URL)
+            self.assertEqual(other.get(ARTICLE_ID), (True, REAL_URL))
+        finally:
+            other.close()
+
+    def test_invalid_config_rejected(self):
+        with self.assertRaises(InvalidConfigError):
+            ResolutionCache(":memory:", ttl=0)
+        with self.assertRaises(InvalidConfigError):
+            ResolutionCache(":memory:", max_entries=0)
+
+
+class TestProcessUrlWithCache(unittest.TestCase):
+    def setUp(self):
+        self.cache = ResolutionCache(":memory:")
+
+    @patch("gnews.utils.utils._resolve_google_link", return_value=REAL_URL)
+    def test_resolution_stored_and_reused(self, mock_resolve):
+        self.assertEqual(process_url(ITEM, [], cache=self.cache), REAL_URL)
+        self.assertEqual(process_url(ITEM, [], cache=self.cache), REAL_URL)
+        mock_resolve.assert_called_once()
+        self.assertEqual(self.cache.get(ARTICLE_ID), (True, REAL_URL))
+
+    @patch("gnews.utils.utils._resolve_google_link", return_value=GOOGLE_NEWS_URL)
+    def test_failure_cached_and_not_retried(self, mock_resolve):
+        self.assertEqual(process_url(ITEM, [], cache=self.cache), GOOGLE_NEWS_URL)
+        self.assertEqual(process_url(ITEM, [], cache=self.cache), GOOGLE_NEWS_URL)
+        mock_resolve.assert_called_once()
+        self.assertEqual(self.cache.get(ARTICLE_ID), (True, None))
+
+    @patch("gnews.utils.utils._resolve_google_link", return_value=REAL_URL)
+    def test_excluded_site_skips_cache(self, mock_resolve):
+        self.assertIsNone(process_url(ITEM, ["washingtonpost.com"], cache=self.cache))
+        mock_resolve.assert_not_called()
+        self.assertEqual(len(self.cache), 0)
+
+
+class TestGNewsUrlCacheOption(unittest.TestCase):
+    def test_path_creates_cache(self):
+        with tempfile.TemporaryDirectory() as tmpdir:
+            g = GNews(url_cache=os.path.join(tmpdir, "urls.sqlite"))
+            self.assertIsInstance(g._url_cache, ResolutionCache)
+            g._url_cache.close()
+
+    def test_disabled_by_default(self):
+        self.assertIsNone(GNews()._url_cache)
+
+    @patch("gnews.utils.utils._resolve_google_link", return_value=REAL_URL)
+    def test_process_uses_client_cache(self, mock_resolve):
+        g = GNews(url_cache=ResolutionCache(":memory:"))
+        entry = dict(ITEM, title="T", description="D", published="")
+        self.assertEqual(g._process(entry)["url"], REAL_URL)
+        self.assertEqual(g._process(entry)["url"], REAL_URL)
+        mock_resolve.assert_called_once()
@@ -0,0 +1,153 @@
+import asyncio
+import os
+import tempfile
+import unittest
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, patch
+
+from gnews import Article, GNews, ResponseCache
+from gnews.exceptions import InvalidConfigError
+
+
+def _feed(n=3):
+    return SimpleNamespace(status=200, entries=[
+        {"title": f"Title {i}", "link": f"https://example.com/{i}", "published": "", "description": "",
+         "source": {"href": "https://example.com", "title": "Example"}} for i in range(n)])
+
+
+def _identity(url, *args, **kwargs):
+    return url
+
+
+class TestResponseCache(unittest.TestCase):
+    def test_hit_and_miss_counters(self):
+        cache = ResponseCache(ttl=60)
+        self.assertIsNone(cache.get("k"))
+        cache.set("k", [{"title": "T"}])
+        self.assertEqual(cache.get("k"), [{"title": "T"}])
+        self.assertEqual(cache.stats(), {"hits": 1, "misses": 1, "disk_hits": 0, "memory_entries": 1})
+
+    def test_expiry(self):
+        cache = ResponseCache(ttl=60)
+        with patch("gnews.utils.cache.time.time", return_value=1000.0):
+            cache.set("k", [])
+        with patch("gnews.utils.cache.time.time", return_value=1059.0):
+            self.assertEqual(cache.get("k"), [])
+            self.assertIsNone(cache.get("k", max_age=30))
+        with patch("gnews.utils.cache.time.time", return_value=1061.0):
+            self.assertIsNone(cache.get("k"))
+
+    def test_zero_ttl_stores_nothing(self):
+        cache = ResponseCache()
+        cache.set("k", [], ttl=0)
+        self.assertIsNone(cache.get("k"))
+
+    def test_lru_bound(self):
+        cache = ResponseCache(max_entries=2)
+        for key in ("a", "b", "c"):
+            cache.set(key, [])
+        self.assertIsNone(cache.get("a"))
+        self.assertEqual(cache.stats()["memory_entries"], 2)
+
+    def test_disk_layer_survives_instances(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            path = os.path.join(tmp, "responses.sqlite")
+            first = ResponseCache(path=path)
+            first.set("k", [Article({"title": "T", "url": "u"})])
+            first.close()
+            second = ResponseCache(path=path)
+            self.assertEqual(second.get("k"), [{"title": "T", "url": "u"}])
+            self.assertEqual(second.disk_hits, 1)
+            # Promoted to memory: the next hit does not touch SQLite.
+            self.assertEqual(second.get("k"), [{"title": "T", "url": "u"}])
+            self.assertEqual(second.disk_hits, 1)
+            second.close()
+
+    def test_validation(self):
+        with self.assertRaises(InvalidConfigError):
+            ResponseCache(ttl=0)
+        with self.assertRaises(InvalidConfigError):
+            ResponseCache(max_entries=0)
+
+
+class TestCachedQueries(unittest.TestCase):
+    def setUp(self):
+        self.cache = ResponseCache(ttl=60)
+        self.g = GNews(response_cache=self.cache, max_workers=1)
+
+    @patch("gnews.gnews.resolve_link", side_effect=_identity)
+    def test_hit_skips_fetch_and_resolution(self, resolve):
+        with patch.object(self.g, "_fetch_feed", return_value=_feed()) as fetch:
+            first = self.g.get_news("OpenAI")
+            second = self.g.get_news("  openai ")
+        self.assertEqual(fetch.call_count, 1)
+        self.assertEqual(resolve.call_count, 3)
+        self.assertEqual(second, first)
+        self.assertEqual((self.cache.hits, self.cache.misses), (1, 1))
+
+    @patch("gnews.gnews.resolve_link", side_effect=_identity)
+    def test_changing_returned_articles_does_not_alter_cache(self, _):
+        with patch.object(self.g, "_fetch_feed", return_value=_feed()):
+            first = self.g.get_news("OpenAI")
+            first[0]["url"] = "https://changed.example.com"
+            first[0]["publisher"]["title"] = "Changed"
+            first[1].pop("title")
+            second = self.g.get_news("OpenAI")
+            second[2]["title"] = "Changed"
+            third = self.g.get_news("OpenAI")
+        for articles in (second, third):
+            self.assertEqual(articles[0]["url"], "https://example.com/0")
+            self.assertEqual(articles[0]["publisher"]["title"], "Example")
+            self.assertEqual(articles[1]["title"], "Title 1")
+        self.assertEqual(third[2]["title"], "Title 2")
+
+    def test_lazy_articles_copied(self):
+        g = GNews(response_cache=ResponseCache(ttl=60), lazy_urls=True)
+        with patch.object(g, "_fetch_feed", return_value=_feed()):
+            first = g.get_news("OpenAI")
+            first[0]["title"] = "Changed"
+            second = g.get_news("OpenAI")
+        self.assertEqual(second[0]["title"], "Title 0")
+        self.assertEqual(second[0].link, "https://example.com/0")
+
+    @patch("gnews.gnews.resolve_link", side_effect=_identity)
+    def test_key_includes_settings(self, _):
+        with patch.object(self.g, "_fetch_feed", return_value=_feed()) as fetch:
+            self.g.get_news_by_topic("WORLD")
+            self.g.country = "Pakistan"
+            self.g.get_news_by_topic("world")
+            self.g.max_results = 5
+            self.g.get_news_by_topic("world")
+        self.assertEqual(fetch.call_count, 3)
+
+    @patch("gnews.gnews.resolve_link", side_effect=_identity)
+    def test_per_call_ttl(self, _):
+        with patch.object(self.g, "_fetch_feed", return_value=_feed()) as fetch:
+            self.g.get_top_news()
+            self.g.get_top_news(cache_ttl=0)
+            self.g.get_top_news()
+        self.assertEqual(fetch.call_count, 2)
+        with self.assertRaises(InvalidConfigError):
+            self.g.get_top_news(cache_ttl=-1)
+
+    def test_backend_in_key(self):
+        g = GNews(response_cache=self.cache, searchapi_key="key")
+        with patch.object(g._searchapi, "get_news", return_value=[{"url": "u"}]) as search:
+            g.get_news("AI")
+            g.get_news("ai")
+            g.get_news("AI", page=2)
+        self.assertEqual(search.call_count, 2)
+
+    def test_async_shares_cache(self):
+        with patch.object(self.g, "_fetch_feed_async", new_callable=AsyncMock, return_value=_feed()) as fetch, \
+             patch("gnews.gnews.resolve_link_async", new_callable=AsyncMock, side_effect=_identity):
+            asyncio.run(self.g.get_news_by_location_async("Pakistan"))
+            asyncio.run(self.g.get_news_by_location_async("pakistan"))
+        self.assertEqual(fetch.call_count, 1)
+        with patch.object(self.g, "_fetch_feed") as blocking_fetch:
+            self.assertEqual(len(self.g.get_news_by_location("Pakistan")), 3)
+        blocking_fetch.assert_not_called()
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -1,5 +1,8 @@
+import asyncio
+import threading
 import unittest
 from unittest.mock import patch, MagicMock
+from gnews import GNews
 from gnews.backends.searchapi import SearchApiBackend
 from gnews.exceptions import InvalidConfigError, NetworkError
 
@@ -34,6 +37,22 @@ MOCK_RESPONSE = {
 MOCK_EMPTY_RESPONSE = {"organic_results": []}
 
 
+def _page_response(page, size=10, per_page=10, duplicate=None):
+    results = [{"position": i + 1, "title": f"P{page} #{i + 1}",
+                "link": f"https://example.com/{(page - 1) * per_page + i}"} for i in range(size)]
+    if duplicate:
+        results[-1]["link"] = duplicate
+    return MagicMock(status_code=200, json=lambda: {"organic_results": results})
+
+
+def _paged(pages, calls=None):
+    def get(url, params=None, timeout=None):
+        if calls is not None:
+            calls.append(params["page"])
+        return pages(params["page"])
+    return get
+
+
 class TestSearchApiBackendInit(unittest.TestCase):
     def test_raises_on_empty_key(self):
         with self.assertRaises(InvalidConfigError):
@@ -190,5 +209,126 @@ class TestSearchApiGetNews(unittest.TestCase):
         self.assertIn("tbs", call_params)
 
 
+class TestSearchApiCollect(unittest.TestCase):
+    def setUp(self):
+        self.backend = SearchApiBackend("test-key")
+
+    @patch("gnews.backends.searchapi.requests.get")
+    def test_fetches_pages_needed_for_target(self, mock_get):
+        calls = []
+        mock_get.side_effect = _paged(_page_response, calls)
+        results = self.backend.collect("AI", max_results=25, concurrency=3)
+        self.assertEqual(sorted(calls), [1, 2, 3])
+        self.assertEqual(len(results), 25)
+        self.assertEqual(results[0]["title"], "P1 #1")
+        self.assertEqual(results[10]["title"], "P2 #1")
+
+    @patch("gnews.backends.searchapi.requests.get")
+    def test_starts_at_page(self, mock_get):
+        calls = []
+        mock_get.side_effect = _paged(_page_response, calls)
+        self.backend.collect("AI", max_results=20, page=4)
+        self.assertEqual(sorted(calls), [4, 5])
+
+    @patch("gnews.backends.searchapi.requests.get")
+    def test_requests_overlap_up_to_concurrency(self, mock_get):
+        barrier = threading.Barrier(3, timeout=5)
+
+        def get(url, params=None, timeout=None):
+            barrier.wait()
+            return _page_response(params["page"])
+
+        mock_get.side_effect = get
+        self.assertEqual(len(self.backend.collect("AI", max_results=30, concurrency=3)), 30)
+
+    @patch("gnews.backends.searchapi.requests.get")
+    def test_short_page_stops_pagination(self, mock_get):
+        calls = []
+        mock_get.side_effect = _paged(lambda page: _page_response(page, size=4 if page == 2 else 10), calls)
+        results = self.backend.collect("AI", max_results=100, concurrency=2)
+        self.assertEqual(len(results), 14)
+        # Pages after the short one are never requested beyond those already in flight.
+        self.assertLessEqual(max(calls), 3)
+
+    @patch("gnews.backends.searchapi.requests.get")
+    def test_duplicates_removed(self, mock_get):
+        mock_get.side_effect = _paged(
+            lambda page: _page_response(page, duplicate="https://example.com/0" if page == 2 else None))
+        results = self.backend.collect("AI", max_results=20)
+        urls = [article["url"] for article in results]
+        self.assertEqual(len(urls), len(set(urls)))
+        self.assertEqual(len(results), 19)
+
+    def test_merged_in_rank_order(self):
+        pages = [[{"url": "b", "rank": 2}, {"url": "a", "rank": 1}], [{"url": "c", "rank": 1}]]
+        self.assertEqual([a["url"] for a in SearchApiBackend._merge(pages, 10)], ["a", "b", "c"])
+
+    @patch("gnews.backends.searchapi.requests.get")
+    def test_page_error_raises(self, mock_get):
+        mock_get.side_effect = _paged(
+            lambda page: MagicMock(status_code=500, text="boom") if page == 2 else _page_response(page))
+        with self.assertRaises(NetworkError):
+            self.backend.collect("AI", max_results=30)
+
+    def test_rejects_non_positive_concurrency(self):
+        with self.assertRaises(InvalidConfigError):
+            self.backend.collect("AI", concurrency=0)
+
+    @patch("gnews.backends.searchapi.requests.get")
+    def test_async_without_client(self, mock_get):
+        mock_get.side_effect = _paged(lambda page: _page_response(page, size=3 if page == 3 else 10))
+        results = asyncio.run(self.backend.collect_async("AI", max_results=50, concurrency=5))
+        self.assertEqual(len(results), 23)
+        self.assertEqual(results[-1]["title"], "P3 #3")
+
+    def test_async_with_httpx_client(self):
+        httpx = __import__("pytest").importorskip("httpx")
+        pages = []
+
+        def handler(request):
+            page = int(request.url.params["page"])
+            pages.append(page)
+            size = 10 if page < 2 else 0
+            return httpx.Response(200, json={"organic_results": [
+                {"position": i + 1, "link": f"https://example.com/{page}/{i}"} for i in range(size)]})
+
+        async def scenario():
+            async with httpx.AsyncClient(transport=httpx.MockTransport(handler)) as client:
+                return await self.backend.collect_async("AI", max_results=40, concurrency=1, client=client)
+
+        self.assertEqual(len(asyncio.run(scenario())), 10)
+        self.assertEqual(pages, [1, 2])
+
+
+class TestGNewsSearchApiConcurrency(unittest.TestCase):
+    def test_collects_with_concurrency(self):
+        g = GNews(searchapi_key="key", max_results=30, searchapi_concurrency=3)
+        with patch.object(g._searchapi, "collect", return_value=[{"url": "u"}]) as collect:
+            self.assertEqual(g.get_news("AI"), [{"url": "u"}])
+        self.assertEqual(collect.call_args.kwargs["max_results"], 30)
+        self.assertEqual(collect.call_args.kwargs["concurrency"], 3)
+
+    def test_async_uses_collect_async(self):
+        g = GNews(searchapi_key="key", searchapi_concurrency=2)
+
+        async def collect_async(**kwargs):
+            return [{"url": kwargs["query"]}]
+
+        with patch.object(g._searchapi, "collect_async", side_effect=collect_async):
+            self.assertEqual(asyncio.run(g.get_news_async("AI")), [{"url": "AI"}])
+
+    def test_single_page_by_default(self):
+        g = GNews(searchapi_key="key")
+        with patch.object(g._searchapi, "get_news", return_value=[]) as get_news, \
+             patch.object(g._searchapi, "collect") as collect:
+            g.get_news("AI")
+        get_news.assert_called_once()
+        collect.assert_not_called()
+
+    def test_rejects_non_positive_concurrency(self):
+        with self.assertRaises(InvalidConfigError):
+            GNews(searchapi_key="key", searchapi_concurrency=0)
+
+
 if __name__ == "__main__":
     unittest.main()
@@ -0,0 +1,142 @@
+import asyncio
+import inspect
+import threading
+import unittest
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, patch
+
+from gnews import GNews
+from gnews.exceptions import InvalidConfigError
+
+
+def _entries(n, start=0, day=10):
+    return [{"title": f"Title {i}", "link": f"https://example.com/{i}",
+             "published": f"Mon, {day:02d} Jun 2026 10:00:00 GMT",
+             "description": "", "source": {"href": "https://example.com", "title": "Example"}}
+            for i in range(start, start + n)]
+
+
+def _feed(entries):
+    return SimpleNamespace(status=200, entries=entries)
+
+
+def run(coro):
+    return asyncio.run(coro)
+
+
+async def _take(agen, n):
+    taken = []
+    async for article in agen:
+        taken.append(article)
+        if len(taken) == n:
+            break
+    await agen.aclose()
+    return taken
+
+
+class TestIterNews(unittest.TestCase):
+    def test_matches_get_news(self):
+        g = GNews(max_workers=4)
+        with patch.object(g, "_fetch_feed", return_value=_feed(_entries(10))), \
+             patch("gnews.gnews.resolve_link", side_effect=lambda url, *a, **k: url):
+            self.assertEqual(list(g.iter_news("AI")), g.get_news("AI"))
+
+    def test_nothing_fetched_until_iterated(self):
+        g = GNews()
+        with patch.object(g, "_fetch_feed") as fetch:
+            articles = g.iter_top_news()
+            fetch.assert_not_called()
+        self.assertTrue(inspect.isgenerator(articles))
+
+    def test_invalid_input_raises_eagerly(self):
+        g = GNews()
+        with self.assertRaises(InvalidConfigError):
+            g.iter_news("")
+        with self.assertRaises(InvalidConfigError):
+            g.iter_news_by_topic("NOT_A_TOPIC")
+
+    def test_break_stops_resolution(self):
+        g = GNews(max_workers=2)
+        resolved = []
+        lock = threading.Lock()
+
+        def resolve(url, *args, **kwargs):
+            with lock:
+                resolved.append(url)
+            return url
+
+        with patch.object(g, "_fetch_feed", return_value=_feed(_entries(50))), \
+             patch("gnews.gnews.resolve_link", side_effect=resolve):
+            articles = g.iter_news_by_topic("WORLD")
+            first = next(articles)
+            articles.close()
+            g.close()
+        self.assertEqual(first["title"], "Title 0")
+        # The consumed entry plus at most max_workers in flight.
+        self.assertLessEqual(len(resolved), 3)
+
+    def test_walk_streams_windows_without_keeping_articles(self):
+        g = GNews(max_results=150, max_workers=1)
+        pages = [_feed(_entries(100, day=20)), _feed(_entries(100, start=90, day=12))]
+        with patch.object(g, "_fetch_feed", side_effect=pages) as fetch, \
+             patch("gnews.gnews.resolve_link", side_effect=lambda url, *a, **k: url):
+            articles = list(g.iter_news("AI"))
+        self.assertEqual(len(articles), 150)
+        self.assertEqual(len({a["url"] for a in articles}), 150)
+        self.assertEqual(fetch.call_count, 2)
+        self.assertIn("before%3A2026-06-20", fetch.call_args_list[1].args[0])
+
+    def test_walk_break_stops_fetching(self):
+        g = GNews(max_results=500, max_workers=1)
+        with patch.object(g, "_fetch_feed", return_value=_feed(_entries(100))) as fetch, \
+             patch("gnews.gnews.resolve_link", side_effect=lambda url, *a, **k: url):
+            for i, _ in enumerate(g.iter_news("AI")):
+                if i == 10:
+                    break
+        self.assertEqual(fetch.call_count, 1)
+
+    def test_searchapi(self):
+        g = GNews(searchapi_key="key")
+        with patch.object(g._searchapi, "get_news", return_value=[{"url": "u"}]) as search:
+            self.assertEqual(list(g.iter_news("AI", page=2)), [{"url": "u"}])
+        self.assertEqual(search.call_args.kwargs["page"], 2)
+
+
+class TestIterNewsAsync(unittest.TestCase):
+    def test_yields_in_feed_order(self):
+        g = GNews(max_workers=3)
+        with patch.object(g, "_fetch_feed_async", new_callable=AsyncMock, return_value=_feed(_entries(8))), \
+             patch("gnews.gnews.resolve_link_async", new_callable=AsyncMock, side_effect=lambda url, *a: url):
+            articles = run(_take(g.iter_news_async("AI"), 8))
+        self.assertEqual([a["title"] for a in articles], [f"Title {i}" for i in range(8)])
+
+    def test_break_cancels_pending(self):
+        g = GNews(max_workers=2)
+        started = []
+
+        async def resolve(url, *args):
+            started.append(url)
+            await asyncio.sleep(0)
+            return url
+
+        with patch.object(g, "_fetch_feed_async", new_callable=AsyncMock, return_value=_feed(_entries(50))), \
+             patch("gnews.gnews.resolve_link_async", side_effect=resolve):
+            articles = run(_take(g.iter_top_news_async(), 1))
+        self.assertEqual(len(articles), 1)
+        self.assertLessEqual(len(started), 3)
+
+    def test_walk(self):
+        g = GNews(max_results=150)
+        pages = [_feed(_entries(100, day=20)), _feed(_entries(100, start=90, day=12))]
+        with patch.object(g, "_fetch_feed_async", new_callable=AsyncMock, side_effect=pages), \
+             patch("gnews.gnews.resolve_link_async", new_callable=AsyncMock, side_effect=lambda url, *a: url):
+            articles = run(_take(g.iter_news_async("AI"), 1000))
+        self.assertEqual(len({a["url"] for a in articles}), 150)
+
+    def test_invalid_input_raises_eagerly(self):
+        with self.assertRaises(InvalidConfigError):
+            GNews().iter_news_async("")
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,126 @@
+import asyncio
+import csv
+import gzip
+import json
+import os
+import tempfile
+import unittest
+from unittest.mock import patch
+
+from gnews import Article, ArticleWriter, GNews, LazyArticle, write_articles, write_articles_async
+from gnews.exceptions import InvalidConfigError
+
+
+def _articles(n):
+    for i in range(n):
+        yield {"title": f"Title {i}", "description": "Summary", "published date": "Mon, 15 Jun 2026 10:00:00 GMT",
+               "url": f"https://example.com/{i}", "publisher": {"href": "https://example.com", "title": "Example"}}
+
+
+SEARCHAPI_ARTICLE = {"title": "AI", "description": "Snippet", "published date": "1 hour ago",
+                     "iso_date": "2026-06-15T10:00:00Z", "url": "https://example.com/ai", "publisher": "TechNews",
+                     "thumbnail": "https://example.com/t.png", "favicon": "", "rank": 1}
+
+
+class TestArticleWriter(unittest.TestCase):
+    def setUp(self):
+        self.tmpdir = tempfile.TemporaryDirectory()
+        self.dir = self.tmpdir.name
+
+    def tearDown(self):
+        self.tmpdir.cleanup()
+
+    def test_jsonl_one_record_per_line(self):
+        path = os.path.join(self.dir, "news.jsonl")
+        self.assertEqual(write_articles(_articles(3), path), [path])
+        with open(path, encoding="utf-8") as f:
+            records = [json.loads(line) for line in f]
+        self.assertEqual([r["title"] for r in records], ["Title 0", "Title 1", "Title 2"])
+        self.assertEqual(records[0]["publisher"]["title"], "Example")
+
+    def test_csv_fixed_schema_across_backends(self):
+        path = os.path.join(self.dir, "news.csv")
+        write_articles([next(_articles(1)), SEARCHAPI_ARTICLE], path)
+        with open(path, newline="", encoding="utf-8") as f:
+            rows = list(csv.DictReader(f))
+        self.assertEqual(rows[0]["publisher"], "Example")
+        self.assertEqual(rows[0]["publisher href"], "https://example.com")
+        self.assertEqual(rows[0]["thumbnail"], "")
+        self.assertEqual(rows[1]["thumbnail"], "https://example.com/t.png")
+        self.assertEqual(rows[1]["rank"], "1")
+
+    def test_gzip_from_suffix(self):
+        path = os.path.join(self.dir, "news.csv.gz")
+        write_articles(_articles(2), path)
+        with gzip.open(path, "rt", newline="", encoding="utf-8") as f:
+            self.assertEqual(len(list(csv.DictReader(f))), 2)
+
+    def test_rotate_by_records(self):
+        paths = write_articles(_articles(5), os.path.join(self.dir, "news.jsonl.gz"), max_records=2)
+        self.assertEqual([os.path.basename(p) for p in paths],
+                         ["news-00000.jsonl.gz", "news-00001.jsonl.gz", "news-00002.jsonl.gz"])
+        with gzip.open(paths[-1], "rt", encoding="utf-8") as f:
+            self.assertEqual(json.loads(f.readline())["title"], "Title 4")
+
+    def test_rotate_by_bytes(self):
+        paths = write_articles(_articles(20), os.path.join(self.dir, "news.csv"), max_bytes=1000)
+        self.assertGreater(len(paths), 1)
+        total = 0
+        for path in paths:
+            with open(path, newline="", encoding="utf-8") as f:
+                total += len(list(csv.DictReader(f)))
+        self.assertEqual(total, 20)
+
+    def test_articles_and_lazy_articles(self):
+        path = os.path.join(self.dir, "news.jsonl")
+        lazy = LazyArticle({"title": "Lazy", "url": "https://news.google.com/rss/articles/x"},
+                           lambda url: "https://example.com/resolved")
+        write_articles([Article(next(_articles(1))), lazy], path)
+        with open(path, encoding="utf-8") as f:
+            records = [json.loads(line) for line in f]
+        self.assertEqual(records[0]["publisher"]["href"], "https://example.com")
+        self.assertEqual(records[1]["url"], "https://example.com/resolved")
+
+    def test_async_iterable(self):
+        async def stream():
+            for article in _articles(4):
+                yield article
+
+        path = os.path.join(self.dir, "news.ndjson")
+        asyncio.run(write_articles_async(stream(), path))
+        with open(path, encoding="utf-8") as f:
+            self.assertEqual(len(f.readlines()), 4)
+
+    def test_empty_export_still_writes_header(self):
+        path = os.path.join(self.dir, "news.csv")
+        write_articles([], path)
+        with open(path, encoding="utf-8") as f:
+            self.assertTrue(f.read().startswith("title,description"))
+
+    def test_validation(self):
+        with self.assertRaises(InvalidConfigError):
+            ArticleWriter(os.path.join(self.dir, "news.xml"), format="xml")
+        with self.assertRaises(InvalidConfigError):
+            ArticleWriter(os.path.join(self.dir, "news.jsonl"), compression="lzma")
+        with self.assertRaises(InvalidConfigError):
+            ArticleWriter(os.path.join(self.dir, "news.jsonl"), max_records=0)
+
+    def test_zstd_requires_extra(self):
+        with patch.dict("sys.modules", {"zstandard": None}):
+            with self.assertRaises(ImportError):
+                ArticleWriter(os.path.join(self.dir, "news.jsonl.zst"))
+
+
+class TestSaveToCsvHeader(unittest.TestCase):
+    def test_header_covers_every_article(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            path = os.path.join(tmp, "news.csv")
+            GNews().save_to_csv([{"title": "A", "url": "u"}, SEARCHAPI_ARTICLE], path)
+            with open(path, newline="", encoding="utf-8") as f:
+                rows = list(csv.DictReader(f))
+        self.assertEqual(rows[1]["thumbnail"], "https://example.com/t.png")
+        self.assertEqual(rows[0]["thumbnail"], "")
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,68 @@
+import random
+import unittest
+from unittest.mock import patch
+
+from bs4 import BeautifulSoup
+
+from gnews import GNews
+from gnews.utils import text
+from gnews.utils.text import strip_html, strip_html_slow
+
+GOOGLE_DESCRIPTION = ('<a href="https://news.google.com/rss/articles/CBMiK2h0?oc=5&amp;hl=en-US" '
+                      'target="_blank">Markets rally as AT&amp;T beats estimates</a>'
+                      '&nbsp;&nbsp;<font color="#6f6f6f">Reuters</font>')
+
+PIECES = ['<a href="https://x.com/?a=1&amp;b=2">', '</a>', '&nbsp;', '<font color="#6f6f6f">', '</font>',
+          'Title', 'AT&T', ' & ', '&amp;', '&lt;', '&#39;', '&#x27;', '&copy', '&foo;', '<b>', '</b>',
+          '<br/>', '<ol>', '<li>', '</li>', 'a < b', '<3', '"', "'", '>', '<', '&', ';', '\xa0', '\n',
+          '<!-- c -->', '<script>1</script>', '<p', '<a title="a>b">', '&#13;', '</', ' ', '  ', '\t',
+          '<input disabled>', '</a >', '<img src=x />', '&#32;', 'é']
+
+
+def _reference(markup):
+    return BeautifulSoup(markup, features="html.parser").get_text().replace('\xa0', ' ')
+
+
+class TestStripHtml(unittest.TestCase):
+    def test_google_news_description(self):
+        self.assertEqual(strip_html(GOOGLE_DESCRIPTION), "Markets rally as AT&T beats estimates  Reuters")
+
+    def test_plain_text_is_unchanged(self):
+        self.assertEqual(strip_html("Plain headline"), "Plain headline")
+        self.assertEqual(strip_html(""), "")
+
+    def test_nbsp_replaced(self):
+        self.assertEqual(strip_html("a\xa0b"), "a b")
+
+    def test_entities_decoded(self):
+        self.assertEqual(strip_html("<b>&lt;tag&gt; &#39;q&#x27; &eacute;</b>"), "<tag> 'q' é")
+
+    def test_list_markup(self):
+        markup = '<ol><li><a href="u1">One</a>&nbsp;&nbsp;<font>A</font></li><li>Two</li></ol>'
+        self.assertEqual(strip_html(markup), "One  ATwo")
+
+    def test_script_and_comment_match_bs4(self):
+        for markup in ('<script>var a = "<b>";</script>x', 'a<!-- hidden -->b', '<p"</font>a < b'):
+            self.assertEqual(strip_html(markup), _reference(markup))
+
+    def test_matches_bs4_on_random_markup(self):
+        rng = random.Random(8)
+        for _ in range(5000):
+            markup = ''.join(rng.choice(PIECES) for _ in range(rng.randint(1, 8)))
+            self.assertEqual(strip_html(markup), _reference(markup), repr(markup))
+
+    def test_fast_path_does_not_touch_bs4(self):
+        with patch.object(text, "strip_html_slow") as slow:
+            strip_html(GOOGLE_DESCRIPTION)
+        slow.assert_not_called()
+
+    def test_fallback_without_bs4(self):
+        with patch.dict("sys.modules", {"bs4": None}):
+            self.assertEqual(strip_html_slow('a<!-- c --><script>x</script>&amp;<b>b</b>\xa0'), "a&b ")
+
+    def test_gnews_clean_uses_stripper(self):
+        self.assertEqual(GNews._clean(GOOGLE_DESCRIPTION), _reference(GOOGLE_DESCRIPTION))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,244 @@
+import asyncio
+import threading
+import time
+import unittest
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from types import SimpleNamespace
+from unittest.mock import MagicMock, patch
+
+from gnews import GNews, Transport
+from gnews.backends.searchapi import SearchApiBackend
+from gnews.exceptions import InvalidConfigError
+from gnews.utils.constants import USER_AGENT
+from gnews.utils.transport import parse_feed
+from gnews.utils.utils import resolve_link
+
+RSS_BODY = (b'<?xml version="1.0"?><rss version="2.0"><channel><title>t</title>'
+            b'<item><title>AI</title><link>https://example.com/ai</link>'
+            b'<source url="https://example.com">Example</source></item></channel></rss>')
+
+
+class _FeedHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+    connections = 0
+    requests_seen = []
+
+    def setup(self):
+        type(self).connections += 1
+        super().setup()
+
+    def do_GET(self):
+        type(self).requests_seen.append(dict(self.headers))
+        if self.headers.get("If-None-Match") == '"v1"':
+            self.send_response(304)
+            self.send_header("Content-Length", "0")
+            self.end_headers()
+            return
+        self.send_response(200)
+        self.send_header("Content-Type", "application/rss+xml")
+        self.send_header("Content-Length", str(len(RSS_BODY)))
+        self.send_header("ETag", '"v1"')
+        self.end_headers()
+        self.wfile.write(RSS_BODY)
+
+    def log_message(self, *args):
+        pass
+
+
+class TestTransport(unittest.TestCase):
+    def test_session_is_pooled_and_reused(self):
+        transport = Transport(proxies={"https": "http://proxy:8080"}, max_connections_per_host=4)
+        session = transport._sync_client()
+        self.assertIs(transport._sync_client(), session)
+        adapter = session.get_adapter("https://news.google.com")
+        self.assertEqual(adapter._pool_maxsize, 4)
+        self.assertTrue(adapter._pool_block)
+        self.assertEqual(session.headers["User-Agent"], USER_AGENT)
+        self.assertIn("gzip", session.headers["Accept-Encoding"])
+        self.assertEqual(session.proxies["https"], "http://proxy:8080")
+        transport.close()
+        self.assertIsNone(transport._client)
+
+    def test_validation(self):
+        with self.assertRaises(InvalidConfigError):
+            Transport(max_connections_per_host=0)
+
+    def test_http2_requires_h2(self):
+        with patch.dict("sys.modules", {"h2": None}):
+            with self.assertRaises(ImportError):
+                Transport(http2=True)
+
+    def test_async_client_shares_settings(self):
+        httpx = __import__("pytest").importorskip("httpx")
+        transport = Transport(max_connections=7)
+        client = transport.new_async_client()
+        self.assertIsInstance(client, httpx.AsyncClient)
+        self.assertEqual(client.headers["User-Agent"], USER_AGENT)
+        asyncio.run(client.aclose())
+
+    def test_parse_feed_copies_status_and_validators(self):
+        feed = parse_feed(200, RSS_BODY, {"ETag": '"v1"', "Last-Modified": "Mon, 10 Jun 2026 10:00:00 GMT"})
+        self.assertEqual(feed.status, 200)
+        self.assertEqual(feed.etag, '"v1"')
+        self.assertEqual(feed.entries[0].link, "https://example.com/ai")
+        self.assertEqual(parse_feed(304, b"ignored", {}).entries, [])
+
+
+class TestKeepAlive(unittest.TestCase):
+    def setUp(self):
+        _FeedHandler.connections = 0
+        _FeedHandler.requests_seen = []
+        self.server = ThreadingHTTPServer(("127.0.0.1", 0), _FeedHandler)
+        threading.Thread(target=self.server.serve_forever, daemon=True).start()
+        self.url = f"http://127.0.0.1:{self.server.server_port}/rss"
+
+    def tearDown(self):
+        self.server.shutdown()
+        self.server.server_close()
+
+    def test_feed_fetches_reuse_one_connection(self):
+        transport = Transport()
+        transport._sync_client().trust_env = False
+        with GNews(transport=transport) as g:
+            first = g._fetch_feed(self.url)
+            second = g._fetch_feed(self.url, etag=first.etag)
+        transport.close()
+        self.assertEqual(first.status, 200)
+        self.assertEqual(len(first.entries), 1)
+        self.assertEqual(second.status, 304)
+        self.assertEqual(_FeedHandler.connections, 1)
+        self.assertEqual(_FeedHandler.requests_seen[1]["If-None-Match"], '"v1"')
+
+
+class TestAsyncClientPerLoop(unittest.TestCase):
+    def setUp(self):
+        __import__("pytest").importorskip("httpx")
+        self.server = ThreadingHTTPServer(("127.0.0.1", 0), _FeedHandler)
+        threading.Thread(target=self.server.serve_forever, daemon=True).start()
+        self.url = f"http://127.0.0.1:{self.server.server_port}/rss"
+
+    def tearDown(self):
+        self.server.shutdown()
+        self.server.server_close()
+
+    def test_client_of_previous_loop_is_closed(self):
+        g = GNews()
+        created = []
+
+        def new_async_client():
+            with patch.dict("os.environ", {"NO_PROXY": "127.0.0.1"}):
+                client = Transport.new_async_client(g._transport)
+            created.append(client)
+            return client
+
+        async def fetch():
+            return await g._fetch_feed_async(self.url)
+
+        async def fetch_then_close():
+            await fetch()
+            states = [client.is_closed for client in created]
+            await g.aclose()
+            return states
+
+        with patch.object(g._transport, "new_async_client", side_effect=new_async_client):
+            asyncio.run(fetch())
+            states = asyncio.run(fetch_then_close())
+        self.assertEqual(states, [True, False])
+        self.assertTrue(created[1].is_closed)
+
+
+class _SlowHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+    lock = threading.Lock()
+    active = 0
+    peak = 0
+
+    def do_GET(self):
+        cls = type(self)
+        with cls.lock:
+            cls.active += 1
+            cls.peak = max(cls.peak, cls.active)
+        time.sleep(0.05)
+        with cls.lock:
+            cls.active -= 1
+        self.send_response(200)
+        self.send_header("Content-Length", "0")
+        self.end_headers()
+
+    def log_message(self, *args):
+        pass
+
+
+class TestHttpxPerHostLimit(unittest.TestCase):
+    def setUp(self):
+        __import__("pytest").importorskip("httpx")
+        _SlowHandler.active = _SlowHandler.peak = 0
+        self.server = ThreadingHTTPServer(("127.0.0.1", 0), _SlowHandler)
+        threading.Thread(target=self.server.serve_forever, daemon=True).start()
+        self.url = f"http://127.0.0.1:{self.server.server_port}/"
+        self.transport = Transport(max_connections_per_host=2)
+
+    def tearDown(self):
+        self.server.shutdown()
+        self.server.server_close()
+
+    def test_sync_client(self):
+        with patch.dict("os.environ", {"NO_PROXY": "127.0.0.1"}):
+            client = self.transport._new_httpx_client()
+        threads = [threading.Thread(target=client.get, args=(self.url,)) for _ in range(6)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        client.close()
+        self.assertEqual(_SlowHandler.peak, 2)
+        self.assertEqual(client._host_slots._hosts, {})
+
+    def test_async_client(self):
+        async def fetch_all():
+            with patch.dict("os.environ", {"NO_PROXY": "127.0.0.1"}):
+                client = self.transport.new_async_client()
+            try:
+                await asyncio.gather(*(client.get(self.url) for _ in range(6)))
+            finally:
+                await client.aclose()
+
+        asyncio.run(fetch_all())
+        self.assertEqual(_SlowHandler.peak, 2)
+
+
+class TestTransportUsers(unittest.TestCase):
+    def test_client_owns_default_transport(self):
+        g = GNews()
+        with patch.object(g._transport, "close") as close:
+            g.close()
+        close.assert_called_once()
+
+    def test_shared_transport_not_closed(self):
+        transport = Transport()
+        g = GNews(transport=transport)
+        with patch.object(transport, "close") as close:
+            g.close()
+        close.assert_not_called()
+
+    def test_searchapi_uses_transport(self):
+        transport = MagicMock()
+        transport.get.return_value = SimpleNamespace(status_code=200, text="",
+                                                     json=lambda: {"organic_results": [{"title": "T"}]})
+        g = GNews(searchapi_key="key", transport=transport)
+        self.assertIsInstance(g._searchapi, SearchApiBackend)
+        articles = g.get_news("AI")
+        self.assertEqual(articles[0]["title"], "T")
+        self.assertEqual(transport.get.call_args.kwargs["params"]["q"], "AI")
+
+    @patch("gnews.utils.utils.resolve_url", side_effect=lambda url, **kwargs: url)
+    def test_redirect_fallback_uses_transport(self, _):
+        transport = MagicMock()
+        transport.head.return_value = "https://publisher.example.com/story"
+        url = "https://news.google.com/rss/articles/CBMi"
+        self.assertEqual(resolve_link(url, transport=transport), "https://publisher.example.com/story")
+        transport.head.assert_called_once_with(url, timeout=5)
+
+
+if __name__ == '__main__':
+    unittest.main()
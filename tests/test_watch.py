@@ -0,0 +1,160 @@
+import asyncio
+import threading
+import unittest
+from types import SimpleNamespace
+from unittest.mock import patch
+
+from gnews import GNews
+from gnews.exceptions import InvalidConfigError, NetworkError
+
+
+def _entries(ids):
+    return [{"id": f"guid-{i}", "title": f"Title {i}", "link": f"https://news.google.com/rss/articles/CBMi{i}",
+             "published": "", "description": "Summary",
+             "source": {"href": "https://example.com", "title": "Example"}} for i in ids]
+
+
+def _feed(ids, status=200, etag='"v1"'):
+    return SimpleNamespace(status=status, entries=_entries(ids), etag=etag)
+
+
+class _Done(Exception):
+    pass
+
+
+class _Clock:
+    """Fake monotonic clock; ``sleep`` advances it and ends the watch after ``limit`` sleeps."""
+
+    def __init__(self, limit):
+        self.now = 1000.0
+        self.sleeps = []
+        self.limit = limit
+
+    def __call__(self):
+        return self.now
+
+    def sleep(self, seconds):
+        if len(self.sleeps) == self.limit:
+            raise _Done
+        self.sleeps.append(round(seconds))
+        self.now += seconds
+
+
+class TestWatch(unittest.TestCase):
+    def _watch(self, g, feeds, limit, **kwargs):
+        clock = _Clock(limit)
+        calls = []
+        with patch("gnews.gnews.time.monotonic", side_effect=clock), \
+             patch.object(g, "_sleep", side_effect=clock.sleep), \
+             patch("gnews.gnews.resolve_link", side_effect=lambda url, *a, **k: url):
+            with self.assertRaises(_Done):
+                g.watch(feeds, lambda feed, articles: calls.append((feed, [a["title"] for a in articles])),
+                        **kwargs)
+        return calls, clock
+
+    def test_only_new_entries_processed(self):
+        g = GNews(max_workers=1)
+        with patch.object(g, "_fetch_feed", side_effect=[_feed([1, 2, 3]), _feed([2, 3, 4])]), \
+             patch.object(g, "_process", wraps=g._process) as process:
+            calls, _ = self._watch(g, ["top"], limit=1)
+        self.assertEqual(calls, [("top", ["Title 1", "Title 2", "Title 3"]), ("top", ["Title 4"])])
+        self.assertEqual(process.call_count, 4)
+
+    def test_sends_validators_and_backs_off_when_unchanged(self):
+        g = GNews(max_workers=1)
+        responses = [_feed([1]), _feed([], status=304), _feed([1]), _feed([1]), _feed([1, 2]), _feed([1, 2])]
+        with patch.object(g, "_fetch_feed", side_effect=responses) as fetch:
+            calls, clock = self._watch(g, ["top"], limit=5, interval=60, max_interval=200)
+        self.assertEqual(fetch.call_args_list[1].kwargs, {"etag": '"v1"'})
+        # Unchanged polls double the interval up to max_interval; a new entry resets it.
+        self.assertEqual(clock.sleeps, [60, 120, 200, 200, 60])
+        self.assertEqual(calls, [("top", ["Title 1"]), ("top", ["Title 2"])])
+
+    def test_skip_existing(self):
+        g = GNews(max_workers=1)
+        with patch.object(g, "_fetch_feed", side_effect=[_feed([1, 2]), _feed([1, 2, 3])]):
+            calls, _ = self._watch(g, ["top"], limit=1, skip_existing=True)
+        self.assertEqual(calls, [("top", ["Title 3"])])
+
+    def test_per_feed_intervals(self):
+        g = GNews(max_workers=1)
+        urls = []
+
+        def fetch(url, **kwargs):
+            urls.append(url)
+            return _feed([])
+
+        with patch.object(g, "_fetch_feed", side_effect=fetch):
+            self._watch(g, {"topic:TECHNOLOGY": 10, "site:bbc.com": 25}, limit=3, backoff=1)
+        self.assertIn("/headlines/section/topic/TECHNOLOGY", urls[0])
+        self.assertIn("site:bbc.com", urls[1])
+        # Polls at t=0 (both), 10, 20 (technology), then 25 (site).
+        self.assertEqual(len(urls), 5)
+        self.assertIn("site:bbc.com", urls[-1])
+
+    def test_failed_poll_backs_off_and_continues(self):
+        g = GNews(max_workers=1, max_retries=0)
+        with patch.object(g, "_fetch_feed", side_effect=[RuntimeError("down"), _feed([1])]), \
+             self.assertLogs("gnews.gnews", level="WARNING"):
+            calls, clock = self._watch(g, ["top"], limit=1, interval=30)
+        self.assertEqual(clock.sleeps, [60])
+        self.assertEqual(calls, [("top", ["Title 1"])])
+
+    def test_stop_event(self):
+        g = GNews()
+        stop = threading.Event()
+        stop.set()
+        with patch.object(g, "_fetch_feed") as fetch:
+            g.watch(["top"], lambda feed, articles: None, stop=stop)
+        fetch.assert_not_called()
+
+    def test_validation(self):
+        g = GNews()
+        with self.assertRaises(InvalidConfigError):
+            g.watch([], print)
+        with self.assertRaises(InvalidConfigError):
+            g.watch(["top"], print, interval=0)
+        with self.assertRaises(InvalidConfigError):
+            g.watch(["topic:NOPE"], print)
+
+
+class TestWatchAsync(unittest.TestCase):
+    def test_yields_new_articles(self):
+        g = GNews(max_workers=1, lazy_urls=True)
+        responses = {"top": [_feed([1, 2]), _feed([2, 3])], "AI": [_feed([7]), _feed([7])]}
+
+        async def fetch(url, **kwargs):
+            return responses["AI" if "search" in url else "top"].pop(0)
+
+        async def collect():
+            found = []
+            async for feed, article in g.watch_async(["top", "AI"], interval=0.01):
+                found.append((feed, article["title"]))
+                if len(found) == 4:
+                    break
+            return found
+
+        with patch.object(g, "_fetch_feed_async", side_effect=fetch):
+            found = asyncio.run(collect())
+        self.assertEqual(found, [("top", "Title 1"), ("top", "Title 2"), ("AI", "Title 7"), ("top", "Title 3")])
+
+    def test_failure_does_not_end_iteration(self):
+        g = GNews(max_workers=1, lazy_urls=True)
+        responses = [NetworkError("down"), _feed([1])]
+
+        async def fetch(url, **kwargs):
+            response = responses.pop(0)
+            if isinstance(response, Exception):
+                raise response
+            return response
+
+        async def first():
+            async for feed, article in g.watch_async(["top"], interval=0.01):
+                return article["title"]
+
+        with patch.object(g, "_fetch_feed_async", side_effect=fetch), self.assertLogs("gnews.gnews", "WARNING"):
+            self.assertEqual(asyncio.run(first()), "Title 1")
+
+
+if __name__ == '__main__':
+    unittest.main()